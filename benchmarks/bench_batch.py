@@ -0,0 +1,40 @@
+"""
+Throughput of mjcf.batch.generate() on randomized gen_terrain.py variants.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_batch [variant_count] [workers]
+"""
+import sys
+import tempfile
+
+from mjcf import batch
+from gen_terrain import get_model
+
+
+def sample_terrain(rng):
+    min_side = rng.uniform(0.05, 0.2)
+    return dict(
+        min_side=min_side,
+        max_side=min_side + rng.uniform(0.1, 0.5),
+    )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    with tempfile.TemporaryDirectory() as directory:
+        result = batch.generate(
+            get_model,
+            directory + "/terrain_{index:05d}.xml",
+            sampler=sample_terrain,
+            count=count,
+            workers=workers,
+        )
+    print("variants:    {}".format(len(result.paths)))
+    print("seconds:     {:.2f}".format(result.seconds))
+    print("models/s:    {:.1f}".format(result.models_per_second))
+
+
+if __name__ == '__main__':
+    main()
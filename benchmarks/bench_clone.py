@@ -0,0 +1,36 @@
+"""
+Spawning ants from gen_ants.py by construction against cloning a prototype.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_clone [ant_count]
+"""
+import sys
+from time import perf_counter
+
+from gen_ants import get_ant
+
+
+def main():
+    ant_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    start = perf_counter()
+    for i in range(ant_count):
+        get_ant(name="ant_{}".format(i), location=[2.0 * i, 0, 0.75])
+    constructed = perf_counter() - start
+
+    prototype, _ = get_ant(name="")
+    start = perf_counter()
+    for i in range(ant_count):
+        prototype.clone("ant_{}_".format(i), pos=[2.0 * i, 0, 0.75])
+    cloned = perf_counter() - start
+
+    print("ants:        {}".format(ant_count))
+    print("get_ant():   {:.3f} s".format(constructed))
+    print("clone():     {:.3f} s ({:.1f}x)".format(
+        cloned, constructed / cloned
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Colorscale lookups one value at a time with get_rgb() against a single
+get_rgb_batch() call. Needs numpy.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_colors [value_count]
+"""
+import sys
+from time import perf_counter
+
+import numpy as np
+
+from colors import get_rgb, get_rgb_batch, viridis
+
+
+def main():
+    value_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    values = np.random.default_rng(0).uniform(0, 1, value_count)
+
+    start = perf_counter()
+    looped = [
+        get_rgb(viridis, value, reverse=True) for value in values.tolist()
+    ]
+    single = perf_counter() - start
+
+    start = perf_counter()
+    batched = get_rgb_batch("viridis", values, reverse=True)
+    batch = perf_counter() - start
+    assert batched.tolist() == looped
+
+    start = perf_counter()
+    get_rgb_batch("viridis", values, interpolate=True, reverse=True)
+    interpolated = perf_counter() - start
+
+    print("values:                  {}".format(value_count))
+    print("get_rgb():               {:.3f} s".format(single))
+    print("get_rgb_batch():         {:.3f} s ({:.1f}x)".format(
+        batch,
+        single / batch
+    ))
+    print("interpolate=True:        {:.3f} s".format(interpolated))
+
+
+if __name__ == '__main__':
+    main()
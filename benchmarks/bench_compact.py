@@ -0,0 +1,61 @@
+"""
+Size and throughput of pretty against compact xml, xml() against
+xml(pretty=False), for each of scaffolding/sample_models and for a model of
+ants generated by gen_ants.py.
+
+Loaded models keep the attribute strings of their file, so only generated
+models have their numbers shortened.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_compact [repeat]
+"""
+import glob
+import os
+import sys
+from time import perf_counter
+
+import mjcf
+from benchmarks.bench_incremental import get_model
+
+
+def best_of(repeat, model):
+    """
+    Returns the best times of xml() and xml(pretty=False) and their outputs,
+    taking turns so that both see the same noise
+    """
+    best = [float("inf"), float("inf")]
+    results = [None, None]
+    for _ in range(repeat):
+        for i, pretty in enumerate((True, False)):
+            start = perf_counter()
+            results[i] = model.xml(pretty=pretty)
+            best[i] = min(best[i], perf_counter() - start)
+    return best, results
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    paths = sorted(glob.glob(os.path.join("scaffolding", "sample_models",
+                                          "*.xml")))
+    models = [(os.path.basename(path), mjcf.load(path)) for path in paths]
+    models.append(("ants (gen_ants.py x 100)", get_model(100)[0]))
+
+    print("{:<28} {:>9} {:>9} {:>6} {:>10} {:>10}".format(
+        "model", "pretty B", "compact B", "size", "pretty ms", "compact ms"
+    ))
+    for name, model in models:
+        (pretty_time, compact_time), (pretty, compact) = best_of(repeat,
+                                                                 model)
+        print("{:<28} {:>9,} {:>9,} {:>6.0%} {:>10.3f} {:>10.3f}".format(
+            name,
+            len(pretty),
+            len(compact),
+            len(compact) / len(pretty),
+            pretty_time * 1e3,
+            compact_time * 1e3
+        ))
+
+
+if __name__ == '__main__':
+    main()
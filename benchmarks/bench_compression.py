@@ -0,0 +1,69 @@
+"""
+Writing and loading a ~100k element model of ants uncompressed, gzip and
+zstd compressed (when the zstandard package is installed), pretty and
+compact: file size, write time and load time.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_compression [ant_count]
+"""
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+import mjcf
+from benchmarks.bench_incremental import get_model
+
+SETTINGS = [
+    ("xml", None, None),
+    ("xml.gz", "gzip", 1),
+    ("xml.gz", "gzip", 6),
+    ("xml.gz", "gzip", 9),
+    ("xml.zst", "zstd", 3),
+    ("xml.zst", "zstd", 10),
+]
+
+
+def main():
+    ant_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2300
+    mujoco, _, _ = get_model(ant_count)
+    expected = {pretty: mujoco.xml(pretty=pretty) for pretty in [True, False]}
+
+    print("{:<8} {:<10} {:>12} {:>7} {:>9} {:>8}".format(
+        "", "format", "bytes", "ratio", "write s", "load s"
+    ))
+    with tempfile.TemporaryDirectory() as directory:
+        for pretty in [True, False]:
+            plain_size = None
+            for suffix, compression, level in SETTINGS:
+                path = os.path.join(directory, "ants." + suffix)
+                start = perf_counter()
+                try:
+                    mujoco.write(path, pretty=pretty,
+                                 compression_level=level)
+                except ImportError:
+                    continue
+                written = perf_counter() - start
+                size = os.path.getsize(path)
+                plain_size = plain_size or size
+
+                start = perf_counter()
+                loaded = mjcf.load(path)
+                load = perf_counter() - start
+                assert loaded.xml(pretty=pretty) == expected[pretty]
+
+                row = "{:<8} {:<10} {:>12,} {:>6.1f}x {:>9.3f} {:>8.3f}"
+                print(row.format(
+                    "pretty" if pretty else "compact",
+                    "{} {}".format(compression, level) if compression
+                    else "plain",
+                    size,
+                    plain_size / size,
+                    written,
+                    load
+                ))
+
+
+if __name__ == '__main__':
+    main()
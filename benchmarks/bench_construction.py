@@ -0,0 +1,56 @@
+"""
+Per-instance construction cost for every element class in mjcf.elements.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_construction [instances_per_class]
+"""
+import sys
+from inspect import signature, Parameter
+from timeit import timeit
+
+from mjcf import elements as e
+from mjcf.element import Element
+
+
+def get_element_classes():
+    modules = [
+        e.elements, e.visual, e.equality, e.fixed,
+        e.sensor, e.default, e.spatial
+    ]
+    classes = []
+    for module in modules:
+        for name, obj in sorted(vars(module).items()):
+            is_element = isinstance(obj, type) and issubclass(obj, Element)
+            if is_element and obj.__module__ == module.__name__:
+                classes.append(obj)
+    return classes
+
+
+def get_required_args(cls):
+    """
+    Placeholder values for the attributes a class can't be built without
+    """
+    return {
+        k: "x"
+        for k, v in signature(cls).parameters.items()
+        if v.default is Parameter.empty
+    }
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    total = 0.0
+    print("{:<28} {:>10}".format("class", "us/inst"))
+    for cls in get_element_classes():
+        kwargs = get_required_args(cls)
+        cls(**kwargs)  # Warm up the per-class caches
+        seconds = timeit(lambda: cls(**kwargs), number=number)
+        total += seconds
+        name = "{}.{}".format(cls.__module__.split(".")[-1], cls.__name__)
+        print("{:<28} {:>10.2f}".format(name, seconds / number * 1e6))
+    print("{:<28} {:>10.2f}".format("total", total))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Walking serial chains of bodies nested far deeper than Python's recursion
+limit, like a snake or a rope: writing, cloning, indexing, validating and
+loading them. Time per body should stay flat as the chain grows, apart
+from pretty printing: its indentation grows with the depth, so the size of
+a pretty document grows with the square of the depth.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_deep_chain [max_depth]
+"""
+import sys
+from io import StringIO
+from time import perf_counter
+
+import mjcf
+from mjcf import elements as e
+from mjcf.lib.xmltodict import unparse
+
+
+def get_chain(depth):
+    mujoco = e.Mujoco(model="chain")
+    worldbody = e.Worldbody()
+    mujoco.add_child(worldbody)
+    parent = worldbody
+    for i in range(depth):
+        body = e.Body(name="link_{}".format(i), pos=[0.1, 0, 0])
+        body.add_children([
+            e.Joint(name="joint_{}".format(i), type="hinge", axis=[0, 0, 1]),
+            e.Geom(type="capsule", fromto=[0, 0, 0, 0.1, 0, 0], size=0.02)
+        ])
+        parent.add_child(body)
+        parent = body
+    return mujoco
+
+
+def timed(fn, *args, **kwargs):
+    start = perf_counter()
+    result = fn(*args, **kwargs)
+    return perf_counter() - start, result
+
+
+def main():
+    max_depth = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    depths = [max_depth // 100, max_depth // 10, max_depth]
+    print("recursion limit: {}".format(sys.getrecursionlimit()))
+    print("{:>8} {:>10} {:>10} {:>10} {:>10} {:>10} {:>10} {:>10}".format(
+        "depth", "build s", "xml() s", "compact s", "dict s", "clone s",
+        "validate s", "load s"
+    ))
+    for depth in depths:
+        build, mujoco = timed(get_chain, depth)
+        write, xml = timed(mujoco.xml)
+        compact, _ = timed(mujoco.write, StringIO(), pretty=False)
+        to_dict, _ = timed(
+            lambda: unparse(mujoco._to_dict(), ordered_mixed_children=True,
+                            short_empty_elements=True, pretty=True)
+        )
+        clone, copy = timed(mujoco.clone, "copy_")
+        validate, _ = timed(mjcf.validate, copy)
+        load, loaded = timed(mjcf.loads, xml)
+        assert loaded.xml() == xml
+        assert mujoco.find(name="joint_{}".format(depth - 1)) is not None
+        print("{:>8} {:>10.3f} {:>10.3f} {:>10.3f} {:>10.3f} {:>10.3f} "
+              "{:>10.3f} {:>10.3f}".format(
+                  depth, build, write, compact, to_dict, clone, validate, load
+              ))
+
+
+if __name__ == '__main__':
+    main()
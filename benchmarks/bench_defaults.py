@@ -0,0 +1,106 @@
+"""
+Resolving the effective attributes of every element of a ~100k element
+model of ants with nested <default> classes, in one pass with the
+DefaultResolver against walking the defaults classes for each element.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_defaults [ant_count]
+"""
+import sys
+from collections import Counter
+from time import perf_counter
+
+from mjcf import elements as e
+from mjcf.defaults import DefaultResolver, get_default_tag
+from benchmarks.bench_incremental import get_model
+
+
+def add_defaults(mujoco):
+    default = e.Default()
+    legs = e.Default(class_="legs")
+    feet = e.Default(class_="feet")
+    default.add_children([
+        e.Joint(armature=1, damping=1, limited=True),
+        e.Geom(condim=3, rgba=[0.8, 0.6, 0.4, 1]),
+        e.Motor(ctrllimited=True, ctrlrange=[-1.0, 1.0]),
+        legs
+    ])
+    legs.add_children([e.Geom(rgba=[0.2, 0.6, 0.8, 1]), feet])
+    feet.add_child(e.Geom(friction=[2, 0.5, 0.5]))
+    mujoco.add_child(default)
+    worldbody = mujoco.find(tag="worldbody")
+    for i, ant in enumerate(worldbody._children):
+        ant.childclass = ["main", "legs", "feet"][i % 3]
+
+
+def walk_get_attributes(mujoco, element):
+    """
+    Resolves one element from scratch: finds its class, then merges the
+    defaults of the class and of each of its parents
+    """
+    class_name = element._values.get("class_")
+    parent = element._parent
+    while class_name is None and parent is not None:
+        class_name = parent._values.get("childclass")
+        parent = parent._parent
+    class_name = class_name or "main"
+
+    tag = get_default_tag(element.__class__)
+    chain = []
+    stack = [(mujoco.find(tag="default"), ())]
+    while stack:
+        default, parents = stack.pop()
+        name = default._values.get("class_", "main")
+        parents = parents + (default,)
+        if name == class_name:
+            chain = parents
+            break
+        stack.extend((child, parents) for child in default._children
+                     if isinstance(child, e.Default))
+    attributes = {
+        attr: value
+        for attr, value in element.get_default_args().items()
+        if value is not None
+    }
+    for default in chain:
+        for child in default._children:
+            if tag is not None and get_default_tag(child.__class__) == tag:
+                attributes.update(
+                    (attr, value) for attr, value in child._values.items()
+                    if attr in element._attribute_set
+                )
+    attributes.update(element._values)
+    return attributes
+
+
+def main():
+    ant_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2300
+    mujoco, _, _ = get_model(ant_count)
+    add_defaults(mujoco)
+
+    start = perf_counter()
+    resolver = DefaultResolver(mujoco)
+    colors = Counter()
+    count = 0
+    for element, attributes in resolver.iter_attributes():
+        count += 1
+        if element.__class__ is e.Geom:
+            colors[tuple(attributes["rgba"])] += 1
+    resolved = perf_counter() - start
+
+    elements = [element for element, _ in resolver.iter_attributes()]
+    sample = elements[::100]
+    start = perf_counter()
+    walked = [walk_get_attributes(mujoco, element) for element in sample]
+    per_walk = (perf_counter() - start) / len(sample)
+    assert walked == [resolver.get_attributes(element) for element in sample]
+
+    print("elements:           {}".format(count))
+    print("geom colors:        {}".format(dict(colors)))
+    print("resolver:           {:.3f} s".format(resolved))
+    print("walk (est.):        {:.3f} s".format(per_walk * count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Serialization of a 100k motor actuator block stored as Motor elements
+against the same block stored as an ElementTable. Needs numpy.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_element_table [motor_count]
+"""
+import sys
+from time import perf_counter
+
+import numpy as np
+
+from mjcf import ElementTable
+from mjcf import elements as e
+from mjcf.lib.xmltodict import unparse
+
+
+def main():
+    motor_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    joints = ["joint_{}".format(i) for i in range(motor_count)]
+    gears = np.random.default_rng(0).uniform(50, 150, motor_count)
+
+    elements = e.Actuator()
+    elements.add_children([
+        e.Motor(joint=joint, gear=[gear], ctrlrange=[-1, 1], ctrllimited=True)
+        for joint, gear in zip(joints, gears.tolist())
+    ])
+    table = e.Actuator()
+    table.add_child(ElementTable(
+        e.Motor,
+        joint=joints,
+        gear=gears[:, None],
+        ctrlrange=(-1, 1),
+        ctrllimited=True
+    ))
+
+    start = perf_counter()
+    legacy = unparse(elements._to_dict(), ordered_mixed_children=True,
+                     short_empty_elements=True, pretty=True)
+    to_dict = perf_counter() - start
+
+    start = perf_counter()
+    from_elements = elements.xml()
+    written = perf_counter() - start
+
+    start = perf_counter()
+    from_table = table.xml()
+    tabled = perf_counter() - start
+
+    assert legacy == from_elements == from_table
+
+    print("motors:              {}".format(motor_count))
+    print("_to_dict+unparse:    {:.3f} s".format(to_dict))
+    print("xml(), elements:     {:.3f} s".format(written))
+    print("xml(), table:        {:.3f} s ({:.1f}x, {:.1f}x)".format(
+        tabled,
+        to_dict / tabled,
+        written / tabled
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Looking elements up by name and tag in a large model of ants from
+gen_ants.py, against walking the tree for each lookup. Lookups should take
+the same time whatever the size of the model, the default is ~1M elements.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_find [ant_count]
+"""
+import sys
+from time import perf_counter
+
+import mjcf.elements as e
+from benchmarks.bench_incremental import get_model, count_elements
+
+
+def walk_find(root, name):
+    stack = [root]
+    while stack:
+        element = stack.pop()
+        if element._values.get("name") == name:
+            return element
+        stack.extend(reversed(element._children))
+    return None
+
+
+def main():
+    ant_count = int(sys.argv[1]) if len(sys.argv) > 1 else 23000
+    mujoco, _, actuator = get_model(ant_count)
+    worldbody = mujoco._children[1]
+    legs = ["front_right", "front_left", "back_left", "back_right"]
+    names = [
+        "hip_joint_{}_leg_ant_{}".format(legs[i % 4], i * 7919 % ant_count)
+        for i in range(1000)
+    ]
+
+    start = perf_counter()
+    mujoco.find(name=names[0])
+    indexed = perf_counter() - start
+
+    start = perf_counter()
+    found = [mujoco.find(name=name) for name in names]
+    by_name = (perf_counter() - start) / len(names)
+    assert all(element is not None for element in found)
+
+    # Kept up to date as the model grows
+    start = perf_counter()
+    for i in range(1000):
+        worldbody.add_child(e.Body(name="extra_{}".format(i)))
+    added = (perf_counter() - start) / 1000
+    assert mujoco.find(name="extra_999") is not None
+
+    start = perf_counter()
+    hinges = mujoco.find_all(tag="joint", type="hinge")
+    by_tag = perf_counter() - start
+    assert len(hinges) == 8 * ant_count
+
+    walk_names = names[:5]
+    start = perf_counter()
+    walked = [walk_find(mujoco, name) for name in walk_names]
+    by_walk = (perf_counter() - start) / len(walk_names)
+    assert walked == found[:len(walk_names)]
+
+    print("elements:      {}".format(count_elements(mujoco)))
+    print("index:         {:.3f} s".format(indexed))
+    print("find(name=):   {:.2f} us".format(by_name * 1e6))
+    print("walk:          {:.2f} us".format(by_walk * 1e6))
+    print("add_child:     {:.2f} us".format(added * 1e6))
+    print("find_all(tag=\"joint\", type=\"hinge\"): {:.3f} s".format(by_tag))
+
+
+if __name__ == '__main__':
+    main()
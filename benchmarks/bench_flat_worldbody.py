@@ -0,0 +1,46 @@
+"""
+Serialization of a worldbody with 100k direct children, the flat layout
+gen_terrain.py produces, through Element.xml() and the xmltodict path.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_flat_worldbody [child_count]
+"""
+import sys
+from time import perf_counter
+
+from mjcf import elements as e
+from mjcf.lib.xmltodict import unparse
+
+
+def get_worldbody(child_count):
+    worldbody = e.Worldbody()
+    worldbody.add_children([
+        e.Geom(type="box", pos=[i, 0, 1], size=[0.2, 0.2, 0.2])
+        for i in range(child_count)
+    ])
+    return worldbody
+
+
+def main():
+    child_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    worldbody = get_worldbody(child_count)
+
+    start = perf_counter()
+    xml_string = worldbody.xml()
+    print("xml():           {:.3f} s".format(perf_counter() - start))
+
+    outdict = worldbody._to_dict()
+    start = perf_counter()
+    first = unparse(outdict, ordered_mixed_children=True,
+                    short_empty_elements=True, pretty=True)
+    print("unparse(dict):   {:.3f} s".format(perf_counter() - start))
+
+    # The dict is left untouched, a second pass yields the same document
+    second = unparse(outdict, ordered_mixed_children=True,
+                     short_empty_elements=True, pretty=True)
+    assert first == second == xml_string
+
+
+if __name__ == '__main__':
+    main()
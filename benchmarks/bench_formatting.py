@@ -0,0 +1,86 @@
+"""
+Attribute value formatting throughput on the values found in
+scaffolding/sample_models, against the str(list) based formatting
+Element._stringify_value used to do.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_formatting
+"""
+import os
+from timeit import timeit
+
+from mjcf.lib.xmltodict import parse
+from mjcf.utils import format_value, _format_vector
+
+SAMPLE_MODELS = os.path.join("scaffolding", "sample_models")
+
+
+def to_number(token):
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def get_values(node, values):
+    """
+    Collects numeric attribute values from a parsed model, vectors as lists
+    """
+    items = node if isinstance(node, list) else [node]
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        for key, value in item.items():
+            if key.startswith("@"):
+                try:
+                    tokens = [to_number(t) for t in value.split()]
+                except ValueError:
+                    continue
+                values.append(tokens if len(tokens) > 1 else tokens[0])
+            else:
+                get_values(value, values)
+    return values
+
+
+def str_format(val):
+    if isinstance(val, list):
+        val = str(val).strip(("[]")).replace(",", "")
+    if isinstance(val, bool):
+        val = str(val).lower()
+    return str(val)
+
+
+def main():
+    print("{:<30} {:>7} {:>9} {:>9} {:>9}".format(
+        "model", "values", "str() us", "cold us", "warm us"
+    ))
+    for filename in sorted(os.listdir(SAMPLE_MODELS)):
+        with open(os.path.join(SAMPLE_MODELS, filename)) as fh:
+            values = get_values(parse(fh.read()), [])
+        count = len(values) * 100
+
+        def run_str():
+            for v in values:
+                str_format(v)
+
+        def run_cold():
+            _format_vector.cache_clear()
+            for v in values:
+                format_value(v)
+
+        def run_warm():
+            for v in values:
+                format_value(v)
+
+        old = timeit(run_str, number=100)
+        cold = timeit(run_cold, number=100)
+        warm = timeit(run_warm, number=100)
+        print("{:<30} {:>7} {:>9.3f} {:>9.3f} {:>9.3f}".format(
+            filename, len(values),
+            old / count * 1e6, cold / count * 1e6, warm / count * 1e6
+        ))
+
+
+if __name__ == '__main__':
+    main()
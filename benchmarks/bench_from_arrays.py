@@ -0,0 +1,57 @@
+"""
+Building random cube terrains like gen_terrain.py one element at a time
+against Element.from_arrays() on NumPy columns. Needs numpy.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_from_arrays [cube_count]
+"""
+import sys
+from time import perf_counter
+
+import numpy as np
+
+from mjcf import elements as e
+from gen_terrain import get_cube
+
+
+def main():
+    cube_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = np.random.default_rng(0)
+    pos = rng.uniform(0, 100, (cube_count, 3))
+    sides = rng.uniform(0.1, 0.5, cube_count)
+    rgba = rng.uniform(0, 1, (cube_count, 4))
+
+    start = perf_counter()
+    worldbody = e.Worldbody()
+    worldbody.add_children([
+        get_cube(x, y, z, side, color)
+        for (x, y, z), side, color
+        in zip(pos.tolist(), sides.tolist(), rgba.tolist())
+    ])
+    looped = perf_counter() - start
+
+    start = perf_counter()
+    geoms = e.Geom.from_arrays(
+        type="box",
+        size=np.repeat(sides[:, None], 3, axis=1),
+        rgba=rgba
+    )
+    freejoints = e.Freejoint.from_arrays(children=[()] * cube_count)
+    bodies = e.Body.from_arrays(pos=pos, children=list(zip(freejoints, geoms)))
+    columnar = e.Worldbody()
+    columnar.add_children(bodies)
+    vectorized = perf_counter() - start
+
+    assert worldbody.xml() == columnar.xml()
+
+    print("cubes:          {}".format(cube_count))
+    print("get_cube():     {:.3f} s".format(looped))
+    print("from_arrays():  {:.3f} s ({:.1f}x)".format(
+        vectorized,
+        looped / vectorized
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Import time of the package in fresh interpreters, checked against a budget.
+Exits with status 1 when a statement goes over budget.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_import [run_count]
+
+For a per module breakdown of a slow statement use
+
+    python -X importtime -c "import mjcf.elements"
+"""
+import os
+import subprocess
+import sys
+from statistics import median
+
+# Statement -> budget in milliseconds, generous for slow machines
+BUDGETS = [
+    ("import mjcf", 40),
+    ("import mjcf.elements", 40),
+    ("from mjcf import elements as e; e.Mujoco", 80),
+    ("from mjcf import elements as e; e.sensor.Touch", 100),
+]
+
+TIMER = """\
+from time import perf_counter
+start = perf_counter()
+{}
+print(perf_counter() - start)
+"""
+
+
+def get_import_time(statement):
+    """
+    Returns the milliseconds a new interpreter takes to run `statement`
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", TIMER.format(statement)],
+        stdout=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    return float(result.stdout) * 1000
+
+
+def main():
+    run_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    over_budget = False
+    for statement, budget in BUDGETS:
+        milliseconds = median(
+            get_import_time(statement) for _ in range(run_count)
+        )
+        status = "ok" if milliseconds <= budget else "OVER BUDGET"
+        over_budget = over_budget or milliseconds > budget
+        print("{:50} {:6.1f} ms / {:3} ms  {}".format(
+            statement,
+            milliseconds,
+            budget,
+            status
+        ))
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == '__main__':
+    main()
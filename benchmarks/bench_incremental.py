@@ -0,0 +1,63 @@
+"""
+Re-serializing a ~50k element model after changing a single Motor.gear,
+from scratch and incrementally.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_incremental [ant_count]
+"""
+import sys
+from time import perf_counter
+
+from mjcf import elements as e
+from gen_ants import get_ant
+
+
+def get_model(ant_count):
+    mujoco = e.Mujoco(model="ants")
+    option = e.Option(timestep=0.01)
+    worldbody = e.Worldbody()
+    actuator = e.Actuator()
+    mujoco.add_children([option, worldbody, actuator])
+    for i in range(ant_count):
+        body, actuators = get_ant(
+            name="ant_{}".format(i),
+            location=[2.0 * i, 0, 0.75]
+        )
+        worldbody.add_child(body)
+        actuator.add_children(actuators)
+    return mujoco, option, actuator
+
+
+def count_elements(element):
+    return 1 + sum(count_elements(child) for child in element._children)
+
+
+def timed(fn, *args, **kwargs):
+    start = perf_counter()
+    result = fn(*args, **kwargs)
+    return perf_counter() - start, result
+
+
+def main():
+    ant_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1150
+    mujoco, option, actuator = get_model(ant_count)
+    print("elements:           {}".format(count_elements(mujoco)))
+
+    full_seconds, _ = timed(mujoco.xml)
+    print("xml():              {:.4f} s".format(full_seconds))
+
+    first_seconds, _ = timed(mujoco.xml, incremental=True)
+    print("first incremental:  {:.4f} s".format(first_seconds))
+
+    motor = actuator._children[len(actuator._children) // 2]
+    for gear in (100, 125, 175):
+        motor.gear = gear
+        option.timestep = 0.01 / gear
+        seconds, incremental = timed(mujoco.xml, incremental=True)
+        assert incremental == mujoco.xml()
+        print("after edit:         {:.4f} s".format(seconds))
+
+
+if __name__ == '__main__':
+    main()
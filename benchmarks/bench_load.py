@@ -0,0 +1,44 @@
+"""
+Parse speed of mjcf.load() on every model in scaffolding/sample_models,
+next to a plain xmltodict.parse() of the same file.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_load
+"""
+import os
+from timeit import timeit
+
+import mjcf
+from mjcf.lib.xmltodict import parse
+
+SAMPLE_MODELS = os.path.join("scaffolding", "sample_models")
+
+
+def count_elements(element):
+    return 1 + sum(count_elements(child) for child in element._children)
+
+
+def main():
+    number = 200
+    print("{:<30} {:>9} {:>10} {:>10} {:>12}".format(
+        "model", "elements", "load ms", "dict ms", "elements/s"
+    ))
+    for filename in sorted(os.listdir(SAMPLE_MODELS)):
+        path = os.path.join(SAMPLE_MODELS, filename)
+        elements = count_elements(mjcf.load(path))
+
+        def run_dict():
+            with open(path, "rb") as fh:
+                parse(fh)
+
+        load_seconds = timeit(lambda: mjcf.load(path), number=number) / number
+        dict_seconds = timeit(run_dict, number=number) / number
+        print("{:<30} {:>9} {:>10.3f} {:>10.3f} {:>12.0f}".format(
+            filename, elements, load_seconds * 1e3, dict_seconds * 1e3,
+            elements / load_seconds
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Memory used by a generated 100k element tree.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_memory [element_count]
+"""
+import sys
+import tracemalloc
+
+from mjcf import elements as e
+
+
+def get_tree(element_count):
+    """
+    Flat worldbody of bodies holding a joint and a geom each, the layout
+    produced by gen_terrain.py and gen_ants.py.
+    """
+    mujoco = e.Mujoco(model="memory")
+    worldbody = e.Worldbody()
+    mujoco.add_child(worldbody)
+    for i in range(element_count // 3):
+        body = e.Body(name="body_{}".format(i), pos=[i, 0, 1])
+        body.add_children([
+            e.Freejoint(),
+            e.Geom(type="box", size=[0.2, 0.2, 0.2], rgba=[0.5, 0.5, 0.5, 1])
+        ])
+        worldbody.add_child(body)
+    return mujoco
+
+
+def main():
+    element_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    get_tree(3)  # Warm up the per-class caches
+    tracemalloc.start()
+    tree = get_tree(element_count)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("elements: {}".format(element_count))
+    print("total: {:.1f} MiB".format(current / 2 ** 20))
+    print("per element: {:.0f} bytes".format(current / element_count))
+    return tree
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Building a ReferenceIndex of a ~100k element model of ants from
+gen_ants.py, looking names up in it and checking its references.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_references [ant_count]
+"""
+import sys
+from time import perf_counter
+
+from mjcf.references import ReferenceIndex
+from benchmarks.bench_incremental import get_model, count_elements
+
+
+def main():
+    ant_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2300
+    mujoco, _, _ = get_model(ant_count)
+
+    start = perf_counter()
+    index = ReferenceIndex(mujoco)
+    indexed = perf_counter() - start
+
+    legs = ["front_right", "front_left", "back_left", "back_right"]
+    names = [
+        ("joint", "hip_joint_{}_leg_ant_{}".format(leg, i))
+        for i in range(ant_count) for leg in legs
+    ]
+    start = perf_counter()
+    found = sum(index.get(*name) is not None for name in names)
+    looked_up = perf_counter() - start
+    assert found == len(names)
+
+    start = perf_counter()
+    errors = index.get_errors()
+    checked = perf_counter() - start
+    assert not errors, errors[:10]
+
+    print("elements:      {}".format(count_elements(mujoco)))
+    print("names:         {}".format(len(index.elements)))
+    print("references:    {}".format(len(index.references)))
+    print("index:         {:.3f} s".format(indexed))
+    print("lookups:       {:.3f} us each".format(
+        looked_up / len(names) * 1e6
+    ))
+    print("check:         {:.3f} s".format(checked))
+
+
+if __name__ == '__main__':
+    main()
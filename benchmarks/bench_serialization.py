@@ -0,0 +1,48 @@
+"""
+Serialization time of Element.xml() against the OrderedDict + xmltodict
+path for growing models.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_serialization [element_count ...]
+"""
+import sys
+from time import perf_counter
+
+from mjcf.lib.xmltodict import unparse
+from benchmarks.bench_memory import get_tree
+
+
+def dict_xml(element):
+    outdict = element._to_dict()
+    return unparse(
+        outdict,
+        ordered_mixed_children=True,
+        short_empty_elements=True,
+        pretty=True
+    )
+
+
+def timed(fn, *args):
+    start = perf_counter()
+    result = fn(*args)
+    return perf_counter() - start, result
+
+
+def main():
+    counts = [int(c) for c in sys.argv[1:]] or [10000, 100000, 1000000]
+    print("{:>10} {:>12} {:>12} {:>10}".format(
+        "elements", "xml() s", "dict s", "speedup"
+    ))
+    for count in counts:
+        tree = get_tree(count)
+        xml_seconds, xml_string = timed(tree.xml)
+        dict_seconds, dict_string = timed(dict_xml, tree)
+        assert xml_string == dict_string
+        print("{:>10} {:>12.3f} {:>12.3f} {:>9.1f}x".format(
+            count, xml_seconds, dict_seconds, dict_seconds / xml_seconds
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Validating a tree of ants from gen_ants.py, with and without checking
+names, against the time it takes to build it.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_validation [ant_count]
+"""
+import sys
+from time import perf_counter
+
+from mjcf import elements as e
+from mjcf.validation import get_errors
+from gen_ants import get_ant
+
+
+def main():
+    ant_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    start = perf_counter()
+    worldbody = e.Worldbody()
+    for i in range(ant_count):
+        ant, _ = get_ant(name="ant_{}".format(i), location=[2.0 * i, 0, 0.75])
+        worldbody.add_child(ant)
+    built = perf_counter() - start
+
+    start = perf_counter()
+    errors = get_errors(worldbody)
+    validated = perf_counter() - start
+    assert not errors, errors[:10]
+
+    start = perf_counter()
+    errors = get_errors(worldbody, references=True)
+    referenced = perf_counter() - start
+    assert not errors, errors[:10]
+
+    print("ants:              {}".format(ant_count))
+    print("construction:      {:.3f} s".format(built))
+    print("attributes:        {:.3f} s ({:.1f}% of construction)".format(
+        validated,
+        100 * validated / built
+    ))
+    print("with references:   {:.3f} s ({:.1f}% of construction)".format(
+        referenced,
+        100 * referenced / built
+    ))
+
+
+if __name__ == '__main__':
+    main()
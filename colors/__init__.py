@@ -1,14 +1,77 @@
+import functools
 from math import ceil
 from .viridis import viridis # NoQA
 from .plasma import plasma # NoQA
 from .inferno import inferno # NoQA
 from .magma import magma # NoQA
 
+_COLORSCALES = {
+    "viridis": viridis,
+    "plasma": plasma,
+    "inferno": inferno,
+    "magma": magma,
+}
 
-def get_rgb(colorscale, val):
+
+def get_rgb(colorscale, val, reverse=False):
+    """
+    Returns the color of `colorscale` at `val`, between 0 and 1, running
+    through the colorscale backwards if `reverse` is set.
+
+    The colorscale is never modified.
+    """
     assert 0 <= val and val <= 1
     num_colors = len(colorscale)
 
-    index = int(ceil(val * num_colors)) - 1
+    # A value of 0 wraps around to the last color
+    index = (int(ceil(val * num_colors)) - 1) % num_colors
+    if reverse:
+        index = num_colors - 1 - index
 
     return colorscale[index]
+
+
+@functools.lru_cache(maxsize=None)
+def get_colorscale_array(name):
+    """
+    Returns the named colorscale as a read-only (n, 3) numpy array, only
+    built the first time it is asked for. Needs numpy.
+    """
+    import numpy as np
+
+    colors = np.array(_COLORSCALES[name], dtype=np.float64)
+    colors.flags.writeable = False
+    return colors
+
+
+def get_rgb_batch(colorscale, values, interpolate=False, reverse=False):
+    """
+    Returns the colors of `colorscale` at each of `values` as an (n, 3)
+    numpy array. Needs numpy.
+
+    `colorscale` is a colorscale name like "viridis", a list of colors or an
+    array. Values pick the same colors get_rgb() does unless `interpolate`
+    is set, then colors are blended linearly between neighbouring stops.
+    """
+    import numpy as np
+
+    if isinstance(colorscale, str):
+        colors = get_colorscale_array(colorscale)
+    else:
+        colors = np.asarray(colorscale, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    if values.size and (values.min() < 0 or values.max() > 1):
+        raise ValueError("Colorscale values must be between 0 and 1")
+    if not interpolate:
+        index = np.ceil(values * len(colors)).astype(np.intp) - 1
+        index %= len(colors)
+        if reverse:
+            index = len(colors) - 1 - index
+        return colors[index]
+
+    if reverse:
+        colors = colors[::-1]
+    position = values * (len(colors) - 1)
+    lower = np.minimum(position.astype(np.intp), len(colors) - 2)
+    weight = (position - lower)[..., None]
+    return colors[lower] * (1 - weight) + colors[lower + 1] * weight
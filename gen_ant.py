@@ -69,21 +69,7 @@ def get_leg(
     )
     ankle_body.add_children([ankle_joint, ankle_geom])
 
-    # Actuators
-    hip = e.Motor(
-        ctrllimited="true",
-        ctrlrange=[-1.0, 1.0],
-        joint=hip_joint.name,
-        gear=150
-    )
-    ankle = e.Motor(
-        ctrllimited=True,
-        ctrlrange=[-1.0, 1.0],
-        joint=ankle_joint.name,
-        gear=150
-    )
-
-    return leg, hip, ankle
+    return leg
 
 
 def main():
@@ -250,18 +236,18 @@ def main():
         pos=[0, 0, 0],
         type="free"
     )
-    front_right_leg, fr_hip, fr_ankle = get_leg(
+    front_right_leg = get_leg(
         "front_right_leg"
     )
-    front_left_leg, fl_hip, fl_ankle = get_leg(
+    front_left_leg = get_leg(
         "front_left_leg",
         hip_angle=90,
     )
-    back_left_leg, bl_hip, bl_ankle = get_leg(
+    back_left_leg = get_leg(
         "back_left_leg",
         hip_angle=180,
     )
-    back_right_leg, br_hip, br_ankle = get_leg(
+    back_right_leg = get_leg(
         "back_right_leg",
         hip_angle=270,
     )
@@ -275,23 +261,19 @@ def main():
         back_right_leg
     ])
 
-    # Actuator
+    # Actuator, one motor per hinge joint of the legs
     actuator.add_children([
-        fr_hip,
-        fr_ankle,
-        fl_hip,
-        fl_ankle,
-        bl_hip,
-        bl_ankle,
-        br_hip,
-        br_ankle
+        e.Motor(
+            ctrllimited=True,
+            ctrlrange=[-1.0, 1.0],
+            joint=hinge.name,
+            gear=150
+        )
+        for hinge in torso.find_all(tag="joint", type="hinge")
     ])
 
-    model_xml = mujoco.xml()
-
     # Output
-    with open('ant-gen.xml', 'w') as fh:
-        fh.write(model_xml)
+    mujoco.write('ant-gen.xml')
 
 
 if __name__ == '__main__':
@@ -314,11 +314,8 @@ def main():
     # Actuator
     actuator.add_children(ant_actuators)
 
-    model_xml = mujoco.xml()
-
     # Output
-    with open('ants-gen.xml', 'w') as fh:
-        fh.write(model_xml)
+    mujoco.write('ants-gen.xml')
 
 
 if __name__ == '__main__':
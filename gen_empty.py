@@ -102,11 +102,8 @@ def main():
         floor_geom,
     ])
 
-    model_xml = mujoco.xml()
-
     # Output
-    with open('empty-gen.xml', 'w') as fh:
-        fh.write(model_xml)
+    mujoco.write('empty-gen.xml')
 
 
 if __name__ == '__main__':
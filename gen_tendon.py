@@ -247,11 +247,8 @@ def main():
         s6,
         side3
     ])
-    model_xml = mujoco.xml()
-
     # Output
-    with open('tendon-gen.xml', 'w') as fh:
-        fh.write(model_xml)
+    mujoco.write('tendon-gen.xml')
 
 
 if __name__ == '__main__':
@@ -3,22 +3,17 @@ from random import random, uniform
 from colors import get_rgb, viridis
 
 
-def get_cubes():
-    square_count = 10
-    colorscale = viridis
-    colorscale.reverse()
+def get_cubes(square_count=10, min_side=0.1, max_side=0.5):
     cubes = []
     for i in range(square_count):
         for j in range(square_count):
             x = i + random()
             y = j + random()
-            min_side = 0.1
-            max_side = 0.5
             side_range = max_side - min_side
             side = uniform(min_side, max_side)
             z = side * 2
             color_point = (side - min_side) / side_range
-            rgb = get_rgb(colorscale, color_point)
+            rgb = get_rgb(viridis, color_point, reverse=True)
             alpha = 1 - (color_point / 10)
             rgba = rgb + [alpha]
             cube = get_cube(x, y, z, side, rgba)
@@ -47,7 +42,7 @@ def get_cube(x=0, y=0, z=1, size=0.2, rgba=[0.5, 0.5, 0.5, 1]):
     return body
 
 
-def main():
+def get_model(square_count=10, min_side=0.1, max_side=0.5):
     #########################
     # Level 1
     mujoco = e.Mujoco(
@@ -155,14 +150,17 @@ def main():
         floor_geom,
     ])
 
-    cubes = get_cubes()
+    cubes = get_cubes(square_count, min_side, max_side)
     worldbody.add_children(cubes)
 
-    model_xml = mujoco.xml()
+    return mujoco
+
+
+def main():
+    mujoco = get_model()
 
     # Output
-    with open('terrain-gen.xml', 'w') as fh:
-        fh.write(model_xml)
+    mujoco.write('terrain-gen.xml')
 
 
 if __name__ == '__main__':
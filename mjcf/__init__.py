@@ -1 +1,6 @@
-from .__version__ import __version__  # noqa: F401
\ No newline at end of file
+from .__version__ import __version__  # noqa: F401
+from .parser import load, loads  # noqa: F401
+from .element_table import ElementTable  # noqa: F401
+from .validation import validate, ValidationError  # noqa: F401
+from .references import ReferenceIndex  # noqa: F401
+from .defaults import DefaultResolver, extract_defaults  # noqa: F401
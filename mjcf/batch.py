@@ -0,0 +1,134 @@
+"""
+Generating many model variants in parallel
+"""
+import hashlib
+import itertools
+import os
+import random
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+BatchResult = namedtuple("BatchResult",
+                         ["paths", "seconds", "models_per_second"])
+
+
+def grid(**axes):
+    """
+    Returns every combination of the given parameter values, e.g.
+
+        grid(min_side=[0.1, 0.2], square_count=[5, 10])
+        -> [{'min_side': 0.1, 'square_count': 5}, ...]
+    """
+    names = list(axes)
+    return [
+        dict(zip(names, values))
+        for values in itertools.product(*axes.values())
+    ]
+
+
+def get_variant_seed(seed, index):
+    """
+    Returns the seed of the `index`th variant of a batch seeded with `seed`.
+
+    Only depends on its arguments, so a variant comes out the same no matter
+    which worker builds it or in which order.
+    """
+    return _hash_seed("{}:{}".format(seed, index))
+
+
+def _get_sampler_seed(seed, index):
+    """
+    Returns the seed of the sampler's generator for the `index`th variant,
+    distinct from the variant seed so the sampler and the builder don't
+    draw the same numbers
+    """
+    return _hash_seed("{}:{}:sampler".format(seed, index))
+
+
+def _hash_seed(key):
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def _seed_globals(variant_seed):
+    """
+    Seeds the module level generators builders are likely to use
+    """
+    random.seed(variant_seed)
+    numpy = sys.modules.get("numpy")
+    if numpy is not None:
+        numpy.random.seed(variant_seed % 2 ** 32)
+
+
+def _generate_variant(task):
+    builder, params, sampler, index, seed, output, write_options = task
+    variant_seed = get_variant_seed(seed, index)
+    _seed_globals(variant_seed)
+    if sampler is not None:
+        params = sampler(random.Random(_get_sampler_seed(seed, index)))
+
+    model = builder(**params)
+    path = output.format(index=index, seed=variant_seed, **params)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    model.write(path, **write_options)
+
+    return path
+
+
+def generate(builder, output, params=None, sampler=None, count=None, seed=0,
+             workers=None, chunksize=16, **write_options):
+    """
+    Builds and writes model variants across a pool of worker processes.
+
+    `builder` is called with each variant's parameters as keyword arguments
+    and returns the root element to write. The parameters either come from
+    `params`, a list of dicts (see grid()), or from `sampler`, called `count`
+    times with a random.Random seeded for that variant.
+
+    `output` is a path pattern formatted with the variant's `index`, `seed`
+    and parameters, e.g. "variants/terrain_{index:05d}.xml", or ".xml.gz"
+    for gzip compressed files. Remaining keyword arguments are passed on to
+    Element.write().
+
+    Before a variant is built, the random module (and numpy.random when
+    numpy is loaded) is seeded from `seed` and the variant's index, so
+    builders relying on the global generators produce the same variants on
+    every run. Builders and samplers must be picklable, i.e. module level
+    functions. With `workers` set to 1 everything runs in this process.
+
+    Returns a BatchResult with the written paths, in variant order, and the
+    throughput in models per second.
+    """
+    if (params is None) == (sampler is None):
+        raise ValueError("Pass exactly one of params or sampler")
+    if sampler is not None:
+        if count is None:
+            raise ValueError("count is required with a sampler")
+        params = itertools.repeat(None, count)
+
+    tasks = (
+        (builder, variant_params, sampler, index, seed, output, write_options)
+        for index, variant_params in enumerate(params)
+    )
+
+    start = perf_counter()
+    if workers == 1:
+        paths = list(map(_generate_variant, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            paths = list(executor.map(
+                _generate_variant,
+                tasks,
+                chunksize=chunksize
+            ))
+    seconds = perf_counter() - start
+
+    return BatchResult(
+        paths=paths,
+        seconds=seconds,
+        models_per_second=len(paths) / seconds if seconds else float("inf")
+    )
@@ -0,0 +1,121 @@
+"""
+gzip and zstd compressed documents
+"""
+import os
+
+GZIP = "gzip"
+ZSTD = "zstd"
+
+# Levels used unless one is given: the standard ones of each format
+DEFAULT_LEVELS = {GZIP: 6, ZSTD: 3}
+
+_SUFFIXES = {".gz": GZIP, ".zst": ZSTD}
+
+# Leading bytes of each format
+_MAGIC_NUMBERS = {GZIP: b"\x1f\x8b", ZSTD: b"\x28\xb5\x2f\xfd"}
+
+
+def infer_compression(path):
+    """
+    Returns the compression of a path from its suffix, e.g. "gzip" for
+    "model.xml.gz", None for uncompressed paths
+    """
+    if isinstance(path, bytes):
+        path = os.fsdecode(path)
+    suffix = os.path.splitext(os.fspath(path))[1].lower()
+    return _SUFFIXES.get(suffix)
+
+
+def detect_compression(head):
+    """
+    Returns the compression of data starting with the bytes `head`, None
+    when it isn't compressed
+    """
+    for compression, magic in _MAGIC_NUMBERS.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def _import_zstandard():
+    # Optional dependency, only needed for zstd files
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstd compression needs the zstandard package, install it with "
+            "pip install zstandard"
+        ) from None
+    return zstandard
+
+
+def open_compressor(file, compression, level=None):
+    """
+    Returns a binary file object compressing what is written to it into the
+    binary file object `file`. Closing it ends the compressed stream and
+    leaves `file` open.
+
+    gzip output has no timestamp, so the same document always compresses to
+    the same bytes.
+    """
+    if level is None:
+        level = DEFAULT_LEVELS.get(compression)
+    if compression == GZIP:
+        import gzip
+        return gzip.GzipFile(filename="", fileobj=file, mode="wb",
+                             compresslevel=level, mtime=0)
+    if compression == ZSTD:
+        zstandard = _import_zstandard()
+        return zstandard.ZstdCompressor(level=level).stream_writer(
+            file,
+            closefd=False
+        )
+    raise ValueError("Unknown compression {!r}, use {!r} or {!r}".format(
+        compression,
+        GZIP,
+        ZSTD
+    ))
+
+
+class _PrefixedReader(object):
+    """
+    A binary file object reading `head`, bytes already read from `file`,
+    before the rest of `file`
+    """
+
+    def __init__(self, head, file):
+        self.head = head
+        self.file = file
+
+    def read(self, size=-1):
+        head = self.head
+        if not head:
+            return self.file.read(size)
+        if size is None or size < 0:
+            self.head = b""
+            return head + self.file.read()
+        self.head = head[size:]
+        return head[:size]
+
+
+def open_decompressor(file):
+    """
+    Returns a binary file object reading `file` decompressed, or `file`
+    itself when it isn't compressed. Compression is detected from the
+    leading bytes, whatever the file is called.
+    """
+    peek = getattr(file, "peek", None)
+    if peek is not None:
+        head = peek(4)[:4]
+    else:
+        head = file.read(4)
+        file = _PrefixedReader(head, file)
+
+    compression = detect_compression(head)
+    if compression == GZIP:
+        import gzip
+        return gzip.GzipFile(fileobj=file, mode="rb")
+    if compression == ZSTD:
+        zstandard = _import_zstandard()
+        return zstandard.ZstdDecompressor().stream_reader(file, closefd=False)
+    return file
@@ -0,0 +1,479 @@
+"""
+Effective attribute values of elements, given their <default> classes
+"""
+from mjcf.element import Element
+from mjcf.utils import format_value
+
+# The top-level defaults class, named "main" when its class is left out
+MAIN_CLASS = "main"
+
+_ACTUATORS = ["General", "Motor", "Position", "Velocity", "Cylinder",
+              "Muscle"]
+
+# Element class -> tag of the <default> child setting its defaults, for the
+# classes whose tag differs. Every actuator shortcut sets the defaults of
+# the one actuator of a class, tendons and equalities share one each. The
+# sections holding them take no defaults themselves.
+_DEFAULT_TAGS = {
+    "elements.Spatial": "tendon",
+    "elements.Fixed": "tendon",
+    "elements.Actuator": None,
+    "elements.Tendon": None,
+    "elements.Equality": None,
+}
+for _cls in _ACTUATORS:
+    _DEFAULT_TAGS["elements." + _cls] = "actuator"
+    _DEFAULT_TAGS["default." + _cls] = "actuator"
+for _cls in ["Connect", "Weld", "Joint", "Tendon", "Distance"]:
+    _DEFAULT_TAGS["equality." + _cls] = "equality"
+
+# Tags of the elements defaults classes apply to, after the mapping above
+_DEFAULT_TARGETS = frozenset([
+    "mesh", "material", "joint", "geom", "site", "camera", "light", "pair",
+    "equality", "tendon", "actuator",
+])
+
+# Element class -> default tag, None for classes without defaults
+_CLASS_TAGS = {}
+
+
+def get_default_tag(cls):
+    """
+    Returns the tag of the <default> child setting the defaults of elements
+    of class `cls`, None if defaults classes don't apply to them
+    """
+    try:
+        return _CLASS_TAGS[cls]
+    except KeyError:
+        pass
+    module = cls.__module__.replace("mjcf.elements.", "", 1)
+    key = "{}.{}".format(module, cls.__name__)
+    tag = _DEFAULT_TAGS.get(key, cls.__name__.lower())
+    # Joints of fixed tendons and the like are no joints
+    if tag not in _DEFAULT_TARGETS or module not in (
+        "elements", "default", "equality"
+    ):
+        tag = None
+    _CLASS_TAGS[cls] = tag
+    return tag
+
+
+class DefaultResolver(object):
+    """
+    Resolves the attribute values elements of a model actually get: the
+    values they set, then those of their defaults class, then MuJoCo's
+    built-in defaults.
+
+    The <default> tree under `root` is read once, `classes` maps each
+    class name to {default tag: attribute values}, merged with the values
+    of its parent classes. The defaults of each (class, element class) pair
+    are then merged with the built-in defaults on first use and shared by
+    all elements of the pair.
+
+    An element's class is its class attribute, else the childclass of the
+    nearest body around it that has one, else "main". All actuator
+    shortcuts share the defaults of the class' actuator, each taking the
+    attributes it has.
+    """
+
+    def __init__(self, root):
+        from mjcf.elements import Default
+
+        self.root = root
+        self.classes = {}
+        self._defaults = {}
+        defaults = [root] if root.__class__ is Default else [
+            child for child in root._children if child.__class__ is Default
+        ]
+        for default in defaults:
+            self._add_class(default, MAIN_CLASS, {})
+        if MAIN_CLASS not in self.classes:
+            self.classes[MAIN_CLASS] = {}
+
+    def _add_class(self, default, name, parent_settings):
+        from mjcf.elements import Default
+
+        stack = [(default, name, parent_settings)]
+        while stack:
+            default, name, parent_settings = stack.pop()
+            settings = dict(parent_settings)
+            nested = []
+            for child in default._children:
+                if child.__class__ is Default:
+                    nested.append(child)
+                    continue
+                tag = get_default_tag(child.__class__)
+                if tag is None:
+                    continue
+                values = dict(settings.get(tag, ()))
+                values.update(child._values)
+                settings[tag] = values
+            self.classes[name] = settings
+            for child in reversed(nested):
+                child_name = child._values.get("class_")
+                if child_name is not None:
+                    stack.append((child, child_name, settings))
+
+    def get_defaults(self, cls, class_name=MAIN_CLASS):
+        """
+        Returns the attribute values elements of class `cls` in defaults
+        class `class_name` get unless they set them, built-in defaults
+        included. The dict is shared and must not be mutated.
+        """
+        key = (class_name, cls)
+        try:
+            return self._defaults[key]
+        except KeyError:
+            pass
+        try:
+            settings = self.classes[class_name]
+        except KeyError:
+            raise ValueError(
+                "Unknown defaults class '{}'".format(class_name)
+            ) from None
+        defaults = {
+            attr: value for attr, value in cls.get_default_args().items()
+            if value is not None
+        }
+        tag = get_default_tag(cls)
+        if tag is not None and tag in settings:
+            attribute_set = cls._attribute_set
+            defaults.update(
+                (attr, value) for attr, value in settings[tag].items()
+                if attr in attribute_set and attr != "class_"
+            )
+        self._defaults[key] = defaults
+        return defaults
+
+    def get_class(self, element):
+        """
+        Returns the name of the defaults class of `element`
+        """
+        name = element._values.get("class_")
+        if name is not None:
+            return name
+        parent = element._parent
+        while parent is not None:
+            name = parent._values.get("childclass")
+            if name is not None:
+                return name
+            parent = parent._parent
+        return MAIN_CLASS
+
+    def get_attributes(self, element, class_name=None):
+        """
+        Returns a new dict of the effective attribute values of `element`,
+        in defaults class `class_name` if given, else in its own
+        """
+        if class_name is None:
+            class_name = self.get_class(element)
+        attributes = dict(self.get_defaults(element.__class__, class_name))
+        attributes.update(element._values)
+        return attributes
+
+    def get(self, element, attr):
+        """
+        Returns the effective value of one attribute of `element`, None if
+        it is neither set nor has a default
+        """
+        value = element._values.get(attr)
+        if value is None:
+            defaults = self.get_defaults(element.__class__,
+                                         self.get_class(element))
+            value = defaults.get(attr)
+        return value
+
+    def iter_attributes(self):
+        """
+        Yields (element, effective attribute values) for every element under
+        the root outside <default>, in document order and in a single walk.
+        The rows of an ElementTable are yielded as (table, row values).
+        """
+        from mjcf.element_table import ElementTable
+        from mjcf.elements import Default
+
+        get_defaults = self.get_defaults
+        stack = [(self.root, MAIN_CLASS)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            element, inherited = pop()
+            cls = element.__class__
+            if cls is Default:
+                continue
+            if cls is ElementTable:
+                for values in element._iter_values():
+                    attributes = dict(get_defaults(
+                        element._element_class,
+                        values.get("class_", inherited)
+                    ))
+                    attributes.update(values)
+                    yield element, attributes
+                continue
+
+            values = element._values
+            attributes = dict(get_defaults(
+                cls,
+                values.get("class_", inherited)
+            ))
+            attributes.update(values)
+            yield element, attributes
+
+            children = element._children
+            if children:
+                inherited = values.get("childclass", inherited)
+                for child in reversed(children):
+                    push((child, inherited))
+
+
+# Attributes never moved to a defaults class: names, and the alternative
+# ways of giving a frame's orientation, which override one another
+_NOT_EXTRACTED = frozenset([
+    "name", "class_", "fromto", "quat", "axisangle", "euler", "xyaxes",
+    "zaxis",
+])
+
+# Default tags that only accept some of their element's attributes
+_DEFAULT_ATTRIBUTES = {"mesh": frozenset(["scale"])}
+
+# Attributes default tags don't accept, besides name and class, as listed in
+# mjcf/elements/default.py
+_DISALLOWED_ATTRIBUTES = {
+    "pair": frozenset(["geom1", "geom2"]),
+    "actuator": frozenset([
+        "joint", "jointinparent", "site", "tendon", "slidersite",
+        "cranksite",
+    ]),
+}
+
+# Children of <mujoco> a new <default> goes before, in MJCF section order
+_AFTER_DEFAULT = frozenset([
+    "custom", "asset", "worldbody", "contact", "equality", "tendon",
+    "actuator", "sensor", "keyframe",
+])
+
+
+def _insert_child(parent, child, before_tags):
+    """
+    Adds `child` to `parent` before its first child with one of
+    `before_tags`, at the end if there is none
+    """
+    children = parent._children
+    for i, sibling in enumerate(children):
+        if sibling.__class__.__name__.lower() in before_tags:
+            break
+    else:
+        parent.add_child(child)
+        return
+
+    parent.add_child(child)
+    children.insert(i, children.pop())
+    # The index lists later additions last, rebuild it in document order
+    index = parent._index
+    if index is not None:
+        index.valid = False
+
+
+class _DefaultClass(object):
+    """
+    A defaults class being extracted into: its <default> element, None
+    until one is needed for the main class of a model without any, parent
+    class and {default tag: child element holding its settings}
+    """
+    __slots__ = ("element", "parent", "settings")
+
+    def __init__(self, element, parent):
+        self.element = element
+        self.parent = parent
+        self.settings = {}
+        for child in element._children if element is not None else ():
+            tag = get_default_tag(child.__class__)
+            if tag is not None:
+                self.settings[tag] = child
+
+    def get(self, tag, attr):
+        setting = self.settings.get(tag)
+        return None if setting is None else setting._values.get(attr)
+
+
+def extract_defaults(root, min_count=2):
+    """
+    Moves attribute values repeated across the elements of a model into its
+    <default> classes, producing a smaller but equivalent model. Returns the
+    number of attribute values removed from elements, net of those added.
+
+    Each defaults class, "main" first and nested classes after their
+    parents, takes the most common value of each attribute among the
+    elements it applies to: the elements of the class and of its nested
+    classes that don't set the attribute in between. Elements then stop
+    setting that value, and elements that relied on the value the class
+    used to pass on set it themselves. A value is only moved when it saves
+    at least `min_count` attribute values. A <default> is added to `root`
+    when needed.
+
+    Values are compared as written, so 1 and 1.0 count as different. Names,
+    orientations, fromto and attributes MuJoCo doesn't accept in defaults,
+    like the geoms of a pair or the joint of an actuator, are left alone, as
+    are elements in tables and kinds of elements of mixed classes, e.g.
+    motors next to positions sharing one actuator default. Tendon and
+    equality defaults have no element classes to set them with, so they
+    are left alone too.
+    """
+    from mjcf.element_table import ElementTable
+    from mjcf.elements import Default
+
+    top = None
+    for child in root._children:
+        if child.__class__ is Default:
+            top = child
+            break
+
+    # Defaults classes, parents before their nested classes
+    classes = {MAIN_CLASS: _DefaultClass(top, None)}
+    order = [MAIN_CLASS]
+    stack = [(top, MAIN_CLASS)] if top is not None else []
+    while stack:
+        default, name = stack.pop()
+        for child in default._children:
+            child_name = child._values.get("class_")
+            if child.__class__ is Default and child_name is not None:
+                classes[child_name] = _DefaultClass(child, name)
+                order.append(child_name)
+                stack.append((child, child_name))
+
+    # Default tag -> [(element, class name)], in a single walk
+    groups = {}
+    skipped = set()
+    stack = [(root, MAIN_CLASS)]
+    while stack:
+        element, inherited = stack.pop()
+        cls = element.__class__
+        if cls is Default:
+            continue
+        if cls is ElementTable:
+            tag = get_default_tag(element._element_class)
+            if tag is not None:
+                skipped.add(tag)
+            continue
+        values = element._values
+        tag = get_default_tag(cls)
+        if tag is not None:
+            groups.setdefault(tag, []).append(
+                (element, values.get("class_", inherited))
+            )
+        children = element._children
+        if children:
+            inherited = values.get("childclass", inherited)
+            stack.extend((child, inherited) for child in reversed(children))
+
+    removed = 0
+    for tag, members in groups.items():
+        element_classes = set(element.__class__ for element, _ in members)
+        if tag in skipped or len(element_classes) != 1:
+            continue
+        cls = element_classes.pop()
+        if cls.__name__.lower() != tag and tag != "actuator":
+            continue
+        removed += _extract_tag(root, tag, cls, members, classes, order,
+                                min_count)
+    return removed
+
+
+def _extract_tag(root, tag, cls, members, classes, order, min_count):
+    """
+    Extracts the defaults of the elements of one default tag, all of class
+    `cls`, see extract_defaults()
+    """
+    allowed = _DEFAULT_ATTRIBUTES.get(tag)
+    disallowed = _DISALLOWED_ATTRIBUTES.get(tag, frozenset())
+    attrs = [
+        attr for attr in cls._attribute_names
+        if attr not in _NOT_EXTRACTED and attr not in disallowed
+        and (allowed is None or attr in allowed)
+        and any(attr in element._values for element, _ in members)
+    ]
+    default_args = cls.get_default_args()
+
+    removed = 0
+    for class_name in order:
+        target = classes[class_name]
+        setting = target.settings.get(tag)
+        for attr in attrs:
+            if setting is not None and (
+                attr not in setting._attribute_set
+                or setting._values.get(attr) is not None
+            ):
+                continue
+            reaching = [
+                element for element, name in members
+                if _reaches(classes, name, class_name, tag, attr)
+            ]
+            counts = {}
+            for element in reaching:
+                value = element._values.get(attr)
+                if value is not None:
+                    text = format_value(value)
+                    if text in counts:
+                        counts[text][1] += 1
+                    else:
+                        counts[text] = [value, 1]
+            if not counts:
+                continue
+            text, (value, count) = max(
+                counts.items(), key=lambda item: item[1][1]
+            )
+
+            # The value the class passes on now, from its parents or built in
+            inherited = None
+            parent = target.parent
+            while parent is not None and inherited is None:
+                inherited = classes[parent].get(tag, attr)
+                parent = classes[parent].parent
+            if inherited is None:
+                inherited = default_args.get(attr)
+            same = inherited is not None and format_value(inherited) == text
+
+            lacking = [
+                element for element in reaching if attr not in element._values
+            ]
+            if lacking and not same and inherited is None:
+                # These elements would pick up a value they don't have
+                continue
+            added = 0 if same else len(lacking)
+            if count - added < min_count:
+                continue
+
+            if not same:
+                if setting is None:
+                    if target.element is None:
+                        from mjcf.elements import Default
+                        target.element = Default()
+                        _insert_child(root, target.element, _AFTER_DEFAULT)
+                    setting = cls.__new__(cls)
+                    Element.__init__(setting)
+                    _insert_child(target.element, setting, ("default",))
+                    target.settings[tag] = setting
+                setattr(setting, attr, value)
+                for element in lacking:
+                    setattr(element, attr, inherited)
+            for element in reaching:
+                explicit = element._values.get(attr)
+                if explicit is not None and format_value(explicit) == text:
+                    setattr(element, attr, None)
+            removed += count - added
+    return removed
+
+
+def _reaches(classes, name, target, tag, attr):
+    """
+    Returns whether a value of `attr` set by class `target` reaches the
+    elements of class `name`, no class in between setting it
+    """
+    while name is not None:
+        if name == target:
+            return True
+        current = classes.get(name)
+        if current is None or current.get(tag, attr) is not None:
+            return False
+        name = current.parent
+    return False
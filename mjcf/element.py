@@ -1,31 +1,287 @@
-from collections import OrderedDict
-from mjcf.lib.xmltodict import unparse  # Patched Fork
-from inspect import signature, Parameter
+import os
+from collections import OrderedDict, namedtuple
+from io import StringIO, TextIOBase, TextIOWrapper
+from mjcf.compression import infer_compression, open_compressor
+from mjcf.index import ElementIndex
+from mjcf.references import get_class_references, get_namespace
+from mjcf.utils import (
+    format_compact, format_value, quote_attribute, shorten_numbers, to_python
+)
+
+XML_DECLARATION = '<?xml version="1.0" encoding="{}"?>\n'
+
+# Describes an MJCF attribute of an element class, see mjcf/elements/spec.py
+AttributeSpec = namedtuple(
+    "AttributeSpec",
+    ["name", "type", "default", "required", "size", "options"]
+)
+
+# Attribute specs and constructor defaults per element class, filled in
+# lazily by Element.get_attribute_specs() and Element.get_default_args() and
+# shared by every instance of that class.
+_ATTRIBUTE_SPECS = {}
+_DEFAULT_ARGS = {}
+# float_precision -> attributes kept -> class -> {attribute: (default,
+# default as compact text)}, nested rather than keyed by tuples as they are
+# looked up for every element written
+_COMPACT_DEFAULTS = {}
+_NO_DEFAULTS = {}
+# Interned sets of attribute names, see _get_class_attributes()
+_CLASS_ATTRIBUTES = {}
+# Class -> names of its vector attributes, see split_columns()
+_VECTOR_ATTRIBUTES = {}
+_SEQUENCE_TYPES = (list, tuple)
+
+
+def split_columns(cls, columns):
+    """
+    Splits keyword columns of attribute values for elements of class `cls`
+    into (constants, names, rows, count), see Element.from_arrays().
+
+    `constants` maps attributes to the value shared by every element, `rows`
+    holds the values of the attributes in `names`, one list per attribute.
+    """
+    vectors = _get_vector_attributes(cls)
+    constants = {}
+    names = []
+    rows = []
+    count = None
+    for name, value in columns.items():
+        if name not in cls._attribute_set:
+            raise AttributeError("'{}' object has no attribute '{}'".format(
+                cls.__name__,
+                name
+            ))
+        if value is None:
+            continue
+        # One tolist() call converts a whole array to Python values,
+        # which are much faster to format than NumPy scalars
+        is_array = hasattr(value, "tolist")
+        if is_array:
+            is_column = value.ndim > 0
+            value = to_python(value)
+        else:
+            # A list of numbers for a vector attribute is one vector
+            is_column = isinstance(value, list) and (
+                name not in vectors
+                or (value and isinstance(value[0], _SEQUENCE_TYPES))
+            )
+        if not is_column:
+            constants[name] = value
+            continue
+        if count is None:
+            count = len(value)
+        elif len(value) != count:
+            raise ValueError(
+                "Column '{}' has {} values, expected {}".format(
+                    name, len(value), count
+                )
+            )
+        names.append(name)
+        rows.append(value)
+
+    return constants, names, rows, count
+
+
+def _get_vector_attributes(cls):
+    """
+    Returns the names of the attributes of `cls` holding lists of numbers
+    """
+    try:
+        return _VECTOR_ATTRIBUTES[cls]
+    except KeyError:
+        pass
+    vectors = _VECTOR_ATTRIBUTES[cls] = frozenset(
+        spec.name for spec in cls.get_attribute_specs()
+        if spec.type is not None and spec.type.lower().startswith("list")
+    )
+    return vectors
+
+
+def describe(element):
+    """
+    Returns a short description of an element for messages, e.g.
+    '<joint name="hip">'
+    """
+    tag = element.__class__.__name__.lower()
+    name = element._values.get("name")
+    if name is None:
+        return "<{}>".format(tag)
+    return "<{} name=\"{}\">".format(tag, name)
+
+
+def _get_unparented_error(child, parent):
+    return ValueError(
+        "{} is among the children of {} but has {} as its parent, children "
+        "must be added with add_child()".format(
+            describe(child),
+            describe(parent),
+            "no element" if child._parent is None else describe(child._parent)
+        )
+    )
+
+
+class _TagCache(dict):
+    """
+    The memoized XML of an element written with `incremental` but not
+    frozen: the text of a childless element, and only the start and end
+    tags of an element with children, so every tag is kept once rather
+    than by each of its ancestors as well
+    """
+    __slots__ = ()
 
 
 class Element(object):
+    """
+    Base class for all MuJoCo elements.
+
+    The Python class -> MJCF xml file conversion takes a bit of
+    hackery and we take care of that here.
+
+    Elements are slotted. The attribute names and their defaults live on the
+    class, each instance only stores the attribute values that were explicitly
+    set, everything else falls back to the class defaults on access.
+    """
+    __slots__ = ('_values', '_children', '_parent', '_dirty', '_cache',
+                 '_index')
+
+    # Names of the MJCF attributes of this element, in xml output order
+    _attribute_names = []
+    _attribute_set = frozenset()
+    _attribute_index = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._attribute_set = frozenset(cls._attribute_names)
+        cls._attribute_index = {
+            name: i for i, name in enumerate(cls._attribute_names)
+        }
+
     def __init__(self):
+        # Private slots are set with object.__setattr__, skipping the MJCF
+        # attribute handling of our own __setattr__
+        setattr_ = object.__setattr__
+        setattr_(self, "_values", {})
+        setattr_(self, "_children", [])
+        setattr_(self, "_parent", None)
+        # Whether this element or one of its descendants changed since it was
+        # last serialized. Always true for the ancestors of a dirty element.
+        setattr_(self, "_dirty", True)
+        # Memoized xml, keyed by output settings, only kept once frozen
+        setattr_(self, "_cache", None)
+        # The ElementIndex of this element's tree, once it has been queried
+        setattr_(self, "_index", None)
+
+    def __getattr__(self, name):
+        """
+        Only called when regular lookup fails, i.e. for MJCF attributes whose
+        value is not stored on the instance.
+        """
+        if name[0] != "_" and name in self._attribute_set:
+            return self._values.get(name, self.get_default_args().get(name))
+        raise AttributeError("'{}' object has no attribute '{}'".format(
+            self.__class__.__name__,
+            name
+        ))
+
+    def __setattr__(self, name, value):
+        if name in self._attribute_set:
+            if name == "name" and self._index is not None:
+                self._rename(value)
+            # Unset attributes are simply not stored
+            if value is not None:
+                self._values[name] = value
+            elif name in self._values:
+                del self._values[name]
+            if not self._dirty:
+                self._mark_dirty()
+        elif name[0] == "_":
+            object.__setattr__(self, name, value)
+        else:
+            raise AttributeError("'{}' object has no attribute '{}'".format(
+                self.__class__.__name__,
+                name
+            ))
+
+    def __delattr__(self, name):
+        if name[0] != "_" and name in self._attribute_set:
+            if name == "name" and self._index is not None:
+                self._rename(None)
+            self._values.pop(name, None)
+            if not self._dirty:
+                self._mark_dirty()
+        else:
+            object.__delattr__(self, name)
+
+    @classmethod
+    def get_attribute_specs(cls):
+        """
+        Returns an AttributeSpec for each MJCF attribute of this class, in xml
+        output order.
+
+        Specs of the classes in mjcf.elements come from the table generated
+        by scaffolding/gen_spec.py, others are read off the constructor's
+        signature. Either way this only happens the first time a class is
+        seen.
+        """
+        try:
+            return _ATTRIBUTE_SPECS[cls]
+        except KeyError:
+            pass
+        from mjcf.elements.spec import SPECS
+        specs = SPECS.get("{}.{}".format(cls.__module__, cls.__name__))
+        if specs is not None:
+            specs = tuple(AttributeSpec(*spec) for spec in specs)
+        else:
+            specs = cls._inspect_attribute_specs()
+        _ATTRIBUTE_SPECS[cls] = specs
+        return specs
+
+    @classmethod
+    def _inspect_attribute_specs(cls):
+        """
+        Returns the attribute specs of an element class missing from the
+        spec table, e.g. one defined outside of this package
+        """
+        from inspect import signature, Parameter
+        parameters = signature(cls).parameters
+        specs = []
+        for name in cls._attribute_names:
+            parameter = parameters.get(name)
+            required = (
+                parameter is not None
+                and parameter.default is Parameter.empty
+            )
+            default = None
+            if parameter is not None and not required:
+                default = parameter.default
+            attr_type = None
+            if parameter is not None:
+                attr_type = getattr(parameter.annotation, "__name__", None)
+            specs.append(AttributeSpec(
+                name, attr_type, default, required, None, None
+            ))
+        return tuple(specs)
+
+    @classmethod
+    def get_default_args(cls):
         """
-        Base class for all MuJoCo elements.
+        Returns the defaults of the optional attributes of this class.
 
-        The Python class -> MJCF xml file conversion takes a bit of
-        hackery and we take care of that here.
+        The defaults are only gathered the first time a class is seen, the
+        resulting dict is shared by all instances and must not be mutated.
         """
-        self._attribute_names = []
-        self._children = []
-        self._default_args = self.get_default_args()
         try:
-            getattr(self, "call_kwargs")
-        except AttributeError:
-            self.call_kwargs = {}
-
-    def get_default_args(self):
-        sig = signature(self.__class__)
-        return {
-            k: v.default
-            for k, v in sig.parameters.items()
-            if v.default is not Parameter.empty
+            return _DEFAULT_ARGS[cls]
+        except KeyError:
+            pass
+        default_args = {
+            spec.name: spec.default
+            for spec in cls.get_attribute_specs()
+            if not spec.required
         }
+        _DEFAULT_ARGS[cls] = default_args
+        return default_args
 
     def _xml_style_update(self, parent, child):
         """
@@ -35,65 +291,95 @@ class Element(object):
         """
         assert len(child.keys()) == 1
         child_key = list(child.keys())[0]
+        child_val = child[child_key]
+        # Element tables give a list of values, one per row
+        child_vals = child_val if isinstance(child_val, list) else [child_val]
         # Turn the dict into a list when needed
         if child_key in parent:
             prev_val = parent[child_key]
             if isinstance(prev_val, list):
-                parent[child_key].append(child[child_key])
+                parent[child_key].extend(child_vals)
             else:
-                parent[child_key] = [prev_val, child[child_key]]
+                parent[child_key] = [prev_val] + child_vals
         else:
             parent.update(child)
 
         return parent
 
-    def _stringify_value(self, val):
+    def _stringify_value(self, val, float_precision=None):
         """
         Values need to be in an XML/MCJF compatible format.
         """
+        return format_value(val, float_precision)
 
-        if isinstance(val, list):
-            val = str(val).strip(("[]")).replace(",", "")
-        if isinstance(val, bool):
-            val = str(val).lower()
-
-        return val
-
-    def _is_default_value(self, value, param):
-        """
-        Returns True if the value is equal to the default value for this param
+    def _drop_default_values(self, explicit):
         """
-        default = self._default_args.get(param)
+        Forget attribute values that are equal to the default value for their
+        param, unless they were explicitly passed to the constructor.
 
-        # If someone explicitly instantiates an element using a keyword
-        # value that is the default value we want this to appear in the
-        # final xml.
-        #
-        # This is because MJCF allows for global default setting that
-        # can be overridden by child elements
-        override = param in self.call_kwargs
-        if default is not None and not override and default == value:
-            return True
+        Default values clutter mjcf xml so we don't keep them around. If
+        someone explicitly instantiates an element using a keyword value that
+        is the default value we want this to appear in the final xml.
 
-        return False
+        This is because MJCF allows for global default setting that
+        can be overridden by child elements
+        """
+        values = self._values
+        for param, default in self.get_default_args().items():
+            if param in explicit or default is None:
+                continue
+            if param in values and values[param] == default:
+                del values[param]
 
     def _to_dict(self, order=None, omit_defaults=True):
         """
         Returns a dict ready for processing by xmltodict lib
         """
+        outdict = self._get_node_dict(order, omit_defaults)
+        # Child dicts are merged into their parent's before they are filled
+        # in, walking the tree with an explicit stack rather than recursing
+        stack = [(self, outdict[self.__class__.__name__.lower()])]
+        while stack:
+            element, element_dict = stack.pop()
+            i = 0
+            for child in element._children:
+                if child._parent is not element:
+                    raise _get_unparented_error(child, element)
+                if child._children:
+                    child_dict = child._get_node_dict(order=i)
+                    stack.append((
+                        child,
+                        child_dict[child.__class__.__name__.lower()]
+                    ))
+                else:
+                    child_dict = child._to_dict(order=i)
+                element._xml_style_update(element_dict, child_dict)
+                # Element tables hold one dict per row
+                child_value = next(iter(child_dict.values()))
+                i += len(child_value) if isinstance(child_value, list) else 1
+
+        return outdict
+
+    def _get_node_dict(self, order=None, omit_defaults=True):
+        """
+        Returns the xmltodict ready dict of this element without children
+        """
         element_name = self.__class__.__name__
         element_name = element_name.lower()
         outdict = OrderedDict()
         outdict[element_name] = OrderedDict()
+        values = self._values
+        default_args = self.get_default_args()
         for attr in self._attribute_names:
-            v = getattr(self, attr)
+            v = values.get(attr)
 
+            # Default values clutter mjcf xml and were never stored unless
+            # explicitly set, put them back if asked to
+            if v is None and not omit_defaults:
+                v = default_args.get(attr)
             # Ignore values set to a Python None
             if v is None:
                 continue
-            # Default values clutter mjcf xml so strip them
-            if omit_defaults and self._is_default_value(v, attr):
-                continue
             # Strip underscore from protected name
             if attr == "class_":
                 attr = "class"
@@ -103,40 +389,733 @@ class Element(object):
         if order is not None:
             outdict[element_name]["@__order__"] = order
 
-        for i, child in enumerate(self._children):
-            child_dict = child._to_dict(order=i)
-            outdict[element_name] = self._xml_style_update(
-                outdict[element_name],
-                child_dict
+        return outdict
+
+    @classmethod
+    def _get_compact_defaults(cls, float_precision=None, keep_defaults=None):
+        """
+        Returns {attribute name: (default value, default value as compact
+        text)}, without the attributes in `keep_defaults`
+        """
+        try:
+            return _COMPACT_DEFAULTS[float_precision][keep_defaults][cls]
+        except KeyError:
+            pass
+        by_class = _COMPACT_DEFAULTS.setdefault(float_precision, {}) \
+            .setdefault(keep_defaults, {})
+        defaults = by_class[cls] = {
+            attr: (default, format_compact(default, float_precision))
+            for attr, default in cls.get_default_args().items()
+            if default is not None and (
+                keep_defaults is None or attr not in keep_defaults
             )
+        }
+        return defaults
 
-        return outdict
+    def _format_attributes(self, float_precision=None, compact=False,
+                           keep_defaults=None):
+        """
+        Returns the ' key="value"' attribute string of this element's start tag
+
+        With `compact`, numbers are written as short as possible and values
+        equal to their default, -0.0 for 0.0 too, are left out, except for
+        the attributes in `keep_defaults`, as a <default> class may set them
+        to something else. None keeps every value.
+        """
+        values = self._values
+        if not values:
+            return ""
+
+        # Only set values are stored, put them in the class' attribute order
+        parts = []
+        if compact:
+            if keep_defaults is None:
+                defaults = _NO_DEFAULTS
+            else:
+                try:
+                    defaults = _COMPACT_DEFAULTS[float_precision][
+                        keep_defaults][self.__class__]
+                except KeyError:
+                    defaults = self._get_compact_defaults(float_precision,
+                                                          keep_defaults)
+            get_default = defaults.get
+            for attr in sorted(values, key=self._attribute_index.__getitem__):
+                v = values[attr]
+                default = get_default(attr)
+                if default is None:
+                    if v.__class__ is not str:
+                        v = shorten_numbers(format_value(v, float_precision))
+                elif v.__class__ is str:
+                    if v == default[1]:
+                        continue
+                # Compare to the default before formatting, only values of
+                # another type, like 1.0 for 1, need their text compared
+                elif v.__class__ is default[0].__class__ and v == default[0]:
+                    continue
+                else:
+                    v = shorten_numbers(format_value(v, float_precision))
+                    if v == default[1]:
+                        continue
+                if attr == "class_":
+                    attr = "class"
+                parts.append(" " + attr + "=" + quote_attribute(v))
+            return "".join(parts)
+
+        for attr in sorted(values, key=self._attribute_index.__getitem__):
+            v = format_value(values[attr], float_precision)
+            # Strip underscore from protected name
+            if attr == "class_":
+                attr = "class"
+            parts.append(" " + attr + "=" + quote_attribute(v))
 
-    def xml(self):
+        return "".join(parts)
+
+    def _write_xml(self, write, depth=0, pretty=True, newl="\n", indent="\t",
+                   float_precision=None, incremental=False):
+        """
+        Writes the XML for this element and all of its children to `write`
+        in a single walk of the tree.
+
+        Children are written in the order they were added and the output is
+        identical to running _to_dict() through the xmltodict lib. Frozen
+        elements that haven't changed since they were last serialized write
+        their memoized XML instead of walking their children. With
+        `incremental` every element memoizes its own tags as it is written.
+
+        Without `pretty` the output is compact: no whitespace between tags,
+        short numbers and no values equal to their defaults.
+
+        The tree is walked with an explicit stack, so chains of bodies nested
+        deeper than Python's recursion limit are written in linear time.
+        """
+        from mjcf.elements import Default
+
+        # Attributes whose defaults are written anyway in compact output
+        keep_defaults = None if pretty else self._get_class_attributes()
+        options = (pretty, newl, indent, float_precision, keep_defaults)
+        out = write
+        # Parts of the frozen elements being written, innermost last
+        buffers = []
+        # Number of <default> elements being written, none of the values of
+        # their descendants are left out
+        defaults_open = 0
+        # (element, depth, end tag or None if the element is yet to start)
+        stack = [(self, depth, None)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            element, depth, end = pop()
+
+            if end is not None:
+                write(end)
+                if element.__class__ is Default:
+                    defaults_open -= 1
+                if element._cache.__class__ is dict:
+                    text = "".join(buffers.pop())
+                    element._cache[(depth, defaults_open) + options] = text
+                    write = buffers[-1].append if buffers else out
+                    write(text)
+                element._dirty = False
+                continue
+
+            cache = element._cache
+            if cache is None and incremental:
+                cache = element._cache = _TagCache()
+            if cache is not None:
+                key = (depth, defaults_open) + options
+                if element._dirty:
+                    cache.clear()
+                else:
+                    text = cache.get(key)
+                    if text is None:
+                        pass
+                    elif text.__class__ is str:
+                        write(text)
+                        continue
+                    else:
+                        # Tags of an element with children, see _TagCache
+                        start, end = text
+                        write(start)
+                        if element.__class__ is Default:
+                            defaults_open += 1
+                        push((element, depth, end))
+                        for child in reversed(element._children):
+                            if child._parent is not element:
+                                raise _get_unparented_error(child, element)
+                            push((child, depth + 1, None))
+                        continue
+
+            keep = None if defaults_open else keep_defaults
+            children = element._children
+            if not children:
+                if cache is None:
+                    element._write_tags(write, depth, pretty, newl, indent,
+                                        float_precision, keep)
+                else:
+                    parts = []
+                    element._write_tags(parts.append, depth, pretty, newl,
+                                        indent, float_precision, keep)
+                    text = cache[key] = "".join(parts)
+                    write(text)
+                element._dirty = False
+                continue
+
+            if cache.__class__ is dict:
+                parts = []
+                buffers.append(parts)
+                write = parts.append
+            tag = element.__class__.__name__.lower()
+            if pretty:
+                attributes = element._format_attributes(float_precision)
+                start = depth * indent + "<" + tag + attributes + ">" + newl
+                end = depth * indent + "</" + tag + ">"
+                if depth:
+                    end += newl
+            else:
+                attributes = element._format_attributes(float_precision, True,
+                                                        keep)
+                start = "<" + tag + attributes + ">"
+                end = "</" + tag + ">"
+            write(start)
+            if cache.__class__ is _TagCache:
+                cache[key] = (start, end)
+            if element.__class__ is Default:
+                defaults_open += 1
+            push((element, depth, end))
+            for child in reversed(children):
+                # Trees built with add_child() can't have loops, catch
+                # children added by other means before they loop forever
+                if child._parent is not element:
+                    raise _get_unparented_error(child, element)
+                push((child, depth + 1, None))
+
+    def _write_tags(self, write, depth, pretty, newl, indent,
+                    float_precision, keep_defaults):
+        """
+        Writes the empty element tag of this childless element, compact
+        without `pretty`, see _format_attributes() for `keep_defaults`
+        """
+        tag = self.__class__.__name__.lower()
+        if not pretty:
+            write("<" + tag + self._format_attributes(
+                float_precision, True, keep_defaults
+            ) + "/>")
+            return
+        attributes = self._format_attributes(float_precision)
+        write(depth * indent)
+        write("<" + tag + attributes + "/>")
+        if depth or not attributes:
+            write(newl)
+
+    def _get_class_attributes(self):
+        """
+        Returns the names of the attributes set by the <default> classes of
+        this element's tree
+        """
+        from mjcf.elements import Default
+
+        names = set()
+        root = self._get_root()
+        stack = [
+            child for child in root._children if child.__class__ is Default
+        ]
+        if root.__class__ is Default:
+            stack.append(root)
+        while stack:
+            element = stack.pop()
+            names.update(element._values)
+            stack.extend(element._children)
+        # The same set is returned for the same names, so that looking up
+        # _COMPACT_DEFAULTS by it compares by identity rather than by value
+        names = frozenset(names)
+        return _CLASS_ATTRIBUTES.setdefault(names, names)
+
+    def _write_document(self, write, pretty=True, encoding="utf-8",
+                        float_precision=None, incremental=False):
+        """
+        Writes the XML declaration followed by this element to `write`
+        """
+        write(XML_DECLARATION.format(encoding))
+        self._write_xml(write, pretty=pretty, float_precision=float_precision,
+                        incremental=incremental)
+
+    def xml(self, float_precision=None, incremental=False, pretty=True):
         """
         Returns an XML string representation of this element
+
+        Floats are written in full unless `float_precision` limits them to
+        that many significant digits.
+
+        Without `pretty` the XML is compact: no indentation or newlines,
+        numbers without redundant characters ("0 .5" for "0.0 0.5") and no
+        values equal to their MuJoCo default, unless a <default> class may
+        set the attribute to something else. Values under <default> are all
+        kept.
+
+        With `incremental`, every element memoizes its own tags so the next
+        call only formats the attributes of the elements that changed in the
+        meantime and of their ancestors, for about the size of the output in
+        memory. Frozen elements (see freeze()) memoize the XML of their whole
+        subtree and skip walking it while nothing in it changes.
+        """
+        with StringIO() as fh:
+            self._write_document(fh.write, pretty=pretty,
+                                 float_precision=float_precision,
+                                 incremental=incremental)
+            return fh.getvalue()
+
+    def write(self, file, pretty=True, encoding="utf-8", float_precision=None,
+              incremental=False, compression="infer", compression_level=None):
         """
+        Writes an XML document for this element to `file` as it is generated,
+        without building the whole document in memory first.
+
+        `file` is either a path or a file-like object. Binary file objects
+        receive the document encoded with `encoding`, text file objects are
+        written to as is. See xml() for `pretty`, `float_precision` and
+        `incremental`.
 
-        outdict = self._to_dict()
-        return unparse(
-            outdict,
-            ordered_mixed_children=True,
-            short_empty_elements=True,
-            pretty=True
+        `compression` is "gzip", "zstd" (needs the zstandard package) or None.
+        By default it is inferred from the suffix of a path, ".gz" or ".zst",
+        and file objects aren't compressed. The document is compressed as it
+        is written, at `compression_level` or the format's default level.
+        """
+        options = dict(
+            pretty=pretty,
+            encoding=encoding,
+            float_precision=float_precision,
+            incremental=incremental
         )
+        is_path = isinstance(file, (str, bytes, os.PathLike))
+        if compression == "infer":
+            compression = infer_compression(file) if is_path else None
+
+        if is_path:
+            if compression is not None:
+                with open(file, "wb") as fh:
+                    self._write_binary(fh, options, compression,
+                                       compression_level)
+                return
+            with open(file, "w", encoding=encoding,
+                      errors="xmlcharrefreplace") as fh:
+                self._write_document(fh.write, **options)
+            return
+
+        if isinstance(file, TextIOBase):
+            if compression is not None:
+                raise ValueError(
+                    "Compressed output needs a path or a binary file object"
+                )
+            self._write_document(file.write, **options)
+            return
+
+        self._write_binary(file, options, compression, compression_level)
+
+    def _write_binary(self, file, options, compression=None,
+                      compression_level=None):
+        """
+        Writes the document to a binary file object, compressed with
+        `compression` unless None, and leaves the file object open
+        """
+        stream = file
+        if compression is not None:
+            stream = open_compressor(file, compression, compression_level)
+        fh = TextIOWrapper(stream, encoding=options["encoding"],
+                           errors="xmlcharrefreplace")
+        try:
+            self._write_document(fh.write, **options)
+            fh.flush()
+        finally:
+            # Hand the binary stream back to the caller still open
+            fh.detach()
+            if stream is not file:
+                stream.close()
 
     def add_child(self, child):
         """
         Adds a child element to the list of children for this element
 
-        TODO: Prevent or detect loops
+        A child without children of its own may be added to the same parent
+        more than once, e.g. a site a tendon passes through twice. Raises a
+        ValueError if the child has another parent, is an ancestor of this
+        element or has children and was already added, add a clone() of it
+        instead.
         """
+        self._add_child(child)
+
+    def add_children(self, children):
+        """
+        Adds multiple children to the list of children for this element
+        """
+        for child in children:
+            self.add_child(child)
+
+    def _get_root(self):
+        """
+        Returns the root of this element's tree
+        """
+        root = self
+        while root._parent is not None:
+            root = root._parent
+        return root
+
+    def _is_descendant(self, element):
+        """
+        Returns whether this element is `element` or one of its descendants.
+
+        Walks up from this element and down through `element`'s subtree in
+        lockstep and stops at whichever ends first, so adding a small
+        subtree deep down a chain, or a long chain to a new parent, is cheap.
+        """
+        up = self
+        down = [element]
+        while True:
+            if up is element:
+                return True
+            up = up._parent
+            if up is None:
+                return False
+            if not down:
+                return False
+            node = down.pop()
+            if node is self:
+                return True
+            down.extend(node._children)
+
+    def _add_child(self, child):
         assert isinstance(child, Element)
 
+        if child._parent is not None:
+            if child._parent is not self:
+                raise ValueError(
+                    "{} already has a parent {}, add a clone() of it instead"
+                    .format(describe(child), describe(child._parent))
+                )
+            if child._children:
+                # Would write the whole subtree twice
+                raise ValueError(
+                    "{} is already a child of {}, only elements without "
+                    "children can be added again".format(
+                        describe(child), describe(self)
+                    )
+                )
+        # Ancestors of this element have children, so only adding itself or
+        # a child with children of its own can create a loop
+        if (child._children or child is self) and self._is_descendant(child):
+            raise ValueError("Adding {} to {} would create a loop".format(
+                describe(child),
+                describe(self)
+            ))
+
+        child._parent = self
         self._children.append(child)
+        if not self._dirty:
+            self._mark_dirty()
 
-    def add_children(self, children):
+        index = self._index
+        if index is not None and index.valid:
+            index.add_subtree(child)
+        elif child._index is not None and child._index.root is child:
+            # No longer the root of a tree
+            child._index.valid = False
+
+    def _rename(self, name):
         """
-        Adds multiple children to the list of children for this element
+        Moves this element to its new name in its tree's index
+        """
+        index = self._index
+        if not index.valid:
+            return
+        old_name = self._values.get("name")
+        if old_name is not None:
+            index.remove_name(self, old_name)
+        if name is not None:
+            index.add_name(self, name)
+
+    def _get_index(self):
+        """
+        Returns the index of this element's tree, indexing it if needed
+        """
+        index = self._index
+        if index is None or not index.valid:
+            index = ElementIndex(self._get_root())
+        return index
+
+    def _contains(self, element):
+        """
+        Returns whether `element` is this element or one of its descendants
+        """
+        while element is not None:
+            if element is self:
+                return True
+            element = element._parent
+        return False
+
+    def _select(self, path):
+        """
+        Returns the elements matching a path of tags like "worldbody/body",
+        relative to this element. A "*" step matches any tag and a leading
+        "//" matches the first tag anywhere below this element.
+        """
+        if path.startswith("//"):
+            steps = path[2:].split("/")
+            first = steps.pop(0)
+            if first == "*":
+                elements = self._get_descendants()
+            else:
+                elements = [
+                    element for element in
+                    self._get_index().by_tag.get(first, [])
+                    if element is not self and self._contains(element)
+                ]
+        else:
+            steps = path.split("/")
+            elements = [self]
+        for step in steps:
+            if not step or step == ".":
+                continue
+            elements = [
+                child
+                for element in elements
+                for child in element._children
+                if step == "*" or child.__class__.__name__.lower() == step
+            ]
+        return elements
+
+    def _get_descendants(self):
+        """
+        Returns the descendants of this element in document order, without
+        the rows of element tables, as indexed
         """
-        [self.add_child(child) for child in children]
+        from mjcf.element_table import ElementTable
+
+        descendants = []
+        stack = list(reversed(self._children))
+        while stack:
+            element = stack.pop()
+            if element.__class__ is ElementTable:
+                continue
+            descendants.append(element)
+            stack.extend(reversed(element._children))
+        return descendants
+
+    def _iter_matches(self, path, tag, filters):
+        if path is not None:
+            candidates = self._select(path)
+        elif "name" in filters or tag is not None:
+            index = self._get_index()
+            if "name" in filters:
+                candidates = index.by_name.get(filters["name"], [])
+            else:
+                candidates = index.by_tag.get(tag, [])
+            if self._parent is not None or index.root is not self:
+                candidates = [c for c in candidates if self._contains(c)]
+        else:
+            candidates = self._get_descendants()
+            candidates.insert(0, self)
+
+        formatted = {
+            attr: format_value(value) for attr, value in filters.items()
+        }
+        for element in candidates:
+            if tag is not None and element.__class__.__name__.lower() != tag:
+                continue
+            for attr, value in filters.items():
+                if attr not in element._attribute_set:
+                    break
+                actual = getattr(element, attr)
+                if actual is None or (
+                    actual != value and format_value(actual) != formatted[attr]
+                ):
+                    break
+            else:
+                yield element
+
+    def find(self, path=None, tag=None, **filters):
+        """
+        Returns the first element in this element's subtree (itself
+        included) matching a query, see find_all(), or None
+        """
+        return next(self._iter_matches(path, tag, filters), None)
+
+    def find_all(self, path=None, tag=None, **filters):
+        """
+        Returns the elements in this element's subtree, this element
+        included, with the given `tag` and attribute values, e.g.
+
+            mujoco.find_all(tag="joint", type="hinge")
+            mujoco.find(name="hip_1")
+
+        Values are compared as they are written, so True matches "true", and
+        unset attributes match their default. With a `path` like
+        "worldbody/body/geom" (relative to this element) or "//body/geom"
+        (anywhere below it) only elements at that path are considered.
+
+        Queries by name or tag are looked up in an index of the tree, built
+        by the first query and kept up to date as children are added, so
+        they don't walk the tree.
+        """
+        return list(self._iter_matches(path, tag, filters))
+
+    def _mark_dirty(self):
+        """
+        Marks this element and its ancestors as changed, invalidating their
+        memoized XML.
+
+        Stops at the first ancestor that is already dirty, as all of its own
+        ancestors are too, so marking costs O(1) amortized.
+        """
+        node = self
+        while node is not None and not node._dirty:
+            node._dirty = True
+            node = node._parent
+
+    def freeze(self):
+        """
+        Memoizes the XML of this element and its children the next time it is
+        serialized, so later serializations can reuse it.
+
+        The memoized XML is ignored as soon as an attribute of any element in
+        the subtree is set or a child is added to one of them.
+        """
+        if self._cache.__class__ is not dict:
+            self._cache = {}
+
+    def unfreeze(self):
+        """
+        Stops memoizing the XML of this element
+        """
+        self._cache = None
+
+    def _copy_node(self):
+        """
+        Returns a childless copy of this element sharing its attribute values
+        """
+        cls = self.__class__
+        node = cls.__new__(cls)
+        Element.__init__(node)
+        node._values = self._values.copy()
+        if self._cache.__class__ is dict:
+            node._cache = {}
+        return node
+
+    def clone(self, prefix="", **attributes):
+        """
+        Returns a copy of this element and all of its children, cheap enough
+        to stamp out thousands of instances of a prototype subtree.
+
+        Only the element objects are new, attribute values are shared with
+        the prototype, so give clones new values rather than mutating shared
+        ones in place.
+
+        Every name in the subtree, and every reference to one of those names
+        from within the subtree, gets `prefix` prepended. `attributes` are then
+        set on the returned element, e.g. pos=[2, 0, 0.75] to place it.
+        """
+        root = self._copy_node()
+        names = set()
+        references = []
+        stack = [(self, root)]
+        while stack:
+            node, duplicate = stack.pop()
+            if prefix:
+                values = duplicate._values
+                definition, attr_namespaces = get_class_references(
+                    duplicate.__class__
+                )
+                if definition is not None and definition[0] in values:
+                    attr, namespace = definition
+                    names.add((namespace, values[attr]))
+                    values[attr] = prefix + values[attr]
+                elif "name" in values:
+                    values["name"] = prefix + values["name"]
+                if attr_namespaces and not attr_namespaces.keys().isdisjoint(
+                    values
+                ):
+                    references.append((values, attr_namespaces))
+            for child in node._children:
+                child_duplicate = child._copy_node()
+                child_duplicate._parent = duplicate
+                duplicate._children.append(child_duplicate)
+                stack.append((child, child_duplicate))
+
+        # References may point at names defined anywhere in the subtree
+        for values, attr_namespaces in references:
+            for attr, namespace in attr_namespaces.items():
+                name = values.get(attr)
+                if name is None:
+                    continue
+                if (get_namespace(values, namespace), name) in names:
+                    values[attr] = prefix + name
+
+        for attr, value in attributes.items():
+            setattr(root, attr, value)
+
+        return root
+
+    @classmethod
+    def from_arrays(cls, children=None, **columns):
+        """
+        Returns a list of elements of this class built from columns of
+        attribute values, e.g. cubes from NumPy arrays:
+
+            Geom.from_arrays(type="box", pos=positions, size=sizes, rgba=rgba)
+
+        Columns are NumPy arrays, with one element per row along their first
+        axis, or lists with one element per item. A vector attribute's
+        column is a list of vectors, e.g. pos=[(0, 0, 1), (1, 0, 1)], so a
+        list of numbers like size=[0.2, 0.2, 0.2] is a single value. Single
+        values, lists of numbers for vector attributes and anything else
+        that isn't a column, including tuples, are given to every element.
+        Elements are created without calling their constructor so every
+        value given is kept, default or not.
+
+        `children` optionally holds one child element, or list of children,
+        per element. Body.from_arrays(pos=..., children=geoms) wraps each of
+        `geoms` in a body of its own.
+        """
+        constants, names, rows, count = split_columns(cls, columns)
+        return cls._from_columns(constants, names, rows, count, children)
+
+    @classmethod
+    def _from_columns(cls, constants, names, rows, count, children=None):
+        """
+        Returns the elements of columns already split by split_columns(),
+        see from_arrays()
+        """
+        if children is not None:
+            if count is None:
+                count = len(children)
+            elif len(children) != count:
+                raise ValueError("Got {} children for {} elements".format(
+                    len(children), count
+                ))
+        if count is None:
+            raise ValueError("from_arrays() needs at least one column")
+
+        new = cls.__new__
+        init = Element.__init__
+        # Slot setters, skipping our __setattr__
+        set_values = Element._values.__set__
+        elements = []
+        append = elements.append
+        for row in zip(*rows) if rows else [()] * count:
+            values = constants.copy()
+            values.update(zip(names, row))
+            if None in row:
+                for name, value in zip(names, row):
+                    if value is None:
+                        del values[name]
+            element = new(cls)
+            init(element)
+            set_values(element, values)
+            append(element)
+
+        if children is not None:
+            for element, element_children in zip(elements, children):
+                if isinstance(element_children, Element):
+                    element_children = [element_children]
+                for child in element_children:
+                    element._add_child(child)
+
+        return elements
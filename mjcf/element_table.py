@@ -0,0 +1,149 @@
+from collections import OrderedDict
+from mjcf.element import Element, split_columns
+from mjcf.utils import (
+    format_compact, format_compact_values, format_value, format_values,
+    quote_attribute
+)
+
+
+class ElementTable(Element):
+    """
+    A run of sibling elements of one class stored as columns of attribute
+    values, e.g. the motors of an actuator:
+
+        actuator.add_child(ElementTable(
+            e.Motor,
+            joint=joint_names,
+            gear=gears,
+            ctrlrange=(-1, 1)
+        ))
+
+    Columns are given as in Element.from_arrays(). No element objects are
+    created for the rows, each row is written with a single format string.
+    The rows can't have children. Tables are written in place of their rows
+    and are meant to be added to a parent element, not written on their own.
+    """
+    __slots__ = ('_element_class', '_constants', '_names', '_columns',
+                 '_count')
+
+    def __init__(self, element_class, **columns):
+        super().__init__()
+        constants, names, columns, count = split_columns(element_class,
+                                                         columns)
+        if count is None:
+            raise ValueError("ElementTable needs at least one column")
+        self._element_class = element_class
+        self._constants = constants
+        self._names = names
+        self._columns = columns
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def add_child(self, child):
+        raise TypeError("ElementTable rows can't have children")
+
+    def to_elements(self):
+        """
+        Returns the rows of this table as a list of elements
+        """
+        return self._element_class._from_columns(
+            self._constants, self._names, self._columns, self._count
+        )
+
+    def _iter_values(self):
+        """
+        Yields a dict of the attribute values of each row
+        """
+        constants = self._constants
+        names = self._names
+        rows = zip(*self._columns) if self._columns else [()] * self._count
+        for row in rows:
+            values = constants.copy()
+            values.update(
+                (name, value) for name, value in zip(names, row)
+                if value is not None
+            )
+            yield values
+
+    def _get_attribute_order(self):
+        """
+        Returns this table's attribute names in xml output order
+        """
+        return sorted(
+            list(self._constants) + self._names,
+            key=self._element_class._attribute_index.__getitem__
+        )
+
+    def _to_dict(self, order=None, omit_defaults=True):
+        """
+        Returns a dict holding the xmltodict ready dicts of all rows,
+        numbered from `order` on
+        """
+        tag = self._element_class.__name__.lower()
+        rows = []
+        for i, element in enumerate(self.to_elements()):
+            row_order = None if order is None else order + i
+            rows.append(element._to_dict(row_order, omit_defaults)[tag])
+
+        return OrderedDict([(tag, rows)])
+
+    def _write_tags(self, write, depth, pretty, newl, indent,
+                    float_precision, keep_defaults):
+        """
+        Writes the empty element tags of every row, compact without
+        `pretty`, see Element._format_attributes() for `keep_defaults`
+        """
+        if pretty:
+            format_, format_column, defaults = format_value, format_values, {}
+        else:
+            format_, format_column = format_compact, format_compact_values
+            defaults = {} if keep_defaults is None else \
+                self._element_class._get_compact_defaults(float_precision,
+                                                          keep_defaults)
+
+        # The row template, e.g. '\t\t<motor gear="1" joint%s/>\n', with one
+        # %s per column, each filled in with ' name="value"' or nothing
+        tag = self._element_class.__name__.lower()
+        parts = ["<", tag]
+        if pretty:
+            parts.insert(0, (depth * indent).replace("%", "%%"))
+        columns = []
+        for attr in self._get_attribute_order():
+            name = "class" if attr == "class_" else attr
+            default = defaults.get(attr, (None, None))[1]
+            if attr in self._constants:
+                value = format_(self._constants[attr], float_precision)
+                if value == default:
+                    continue
+                text = " " + name + "=" + quote_attribute(value)
+                parts.append(text.replace("%", "%%"))
+                continue
+            prefix = " " + name + "="
+            values = self._columns[self._names.index(attr)]
+            columns.append([
+                "" if text is None or text == default
+                else prefix + quote_attribute(text)
+                for text in format_column(values, float_precision)
+            ])
+            parts.append("%s")
+        has_attributes = len(parts) > 2 + pretty
+        parts.append("/>")
+        if pretty and (depth or not has_attributes):
+            parts.append(newl.replace("%", "%%"))
+        template = "".join(parts)
+
+        if columns:
+            write("".join(map(template.__mod__, zip(*columns))))
+        else:
+            write(template * self._count)
+
+    def _copy_node(self):
+        node = super()._copy_node()
+        node._element_class = self._element_class
+        node._constants = self._constants
+        node._names = self._names
+        node._columns = self._columns
+        node._count = self._count
+        return node
@@ -1,3 +1,48 @@
-from .elements import *
+"""
+Element classes, imported on first use.
 
-from . import (visual, equality, fixed, sensor, default, spatial)
+The top level elements (mjcf.elements.Mujoco, Body, ...) live in the
+elements submodule, the elements of nested namespaces in submodules named
+after them, e.g. mjcf.elements.sensor.Touch. Each submodule is only
+imported the first time one of its classes is looked up, keeping the
+import of this package cheap.
+"""
+import importlib
+
+_SUBMODULES = frozenset([
+    "elements", "visual", "equality", "fixed", "sensor", "default", "spatial"
+])
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    if name.startswith("__"):
+        if name != "__all__":
+            raise AttributeError(
+                "module '{}' has no attribute '{}'".format(__name__, name)
+            )
+        # Star imports get everything this package used to import eagerly
+        elements = importlib.import_module(".elements", __name__)
+        return sorted(
+            {n for n in vars(elements) if not n.startswith("_")} | _SUBMODULES
+        )
+
+    elements = importlib.import_module(".elements", __name__)
+    try:
+        value = getattr(elements, name)
+    except AttributeError:
+        raise AttributeError(
+            "module '{}' has no attribute '{}'".format(__name__, name)
+        ) from None
+    # Later lookups no longer go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    elements = importlib.import_module(".elements", __name__)
+    return sorted(
+        set(globals()) | _SUBMODULES |
+        {n for n in vars(elements) if not n.startswith("_")}
+    )
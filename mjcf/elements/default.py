@@ -7,11 +7,13 @@ class Mesh(Element):
     defaults class.          The only mesh attribute available here is: scale.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Material(Element):
@@ -21,11 +23,13 @@ class Material(Element):
     except:     name, class.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Joint(Element):
@@ -35,11 +39,13 @@ class Joint(Element):
     name, class.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Geom(Element):
@@ -49,11 +55,13 @@ class Geom(Element):
     name, class.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Site(Element):
@@ -63,11 +71,13 @@ class Site(Element):
     name, class.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Camera(Element):
@@ -77,11 +87,13 @@ class Camera(Element):
     name, class.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Light(Element):
@@ -91,11 +103,13 @@ class Light(Element):
     name, class.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Pair(Element):
@@ -105,11 +119,13 @@ class Pair(Element):
     class, geom1, geom2.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Equality(Element):
@@ -122,11 +138,13 @@ class Equality(Element):
     attributes available here are:     active, solref, solimp.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Tendon(Element):
@@ -138,11 +156,13 @@ class Tendon(Element):
     class.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class General(Element):
@@ -152,11 +172,13 @@ class General(Element):
     name, class, joint, jointinparent, site, tendon, slidersite, cranksite.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Motor(Element):
@@ -169,11 +191,13 @@ class Motor(Element):
     jointinparent, site, tendon, slidersite, cranksite.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Position(Element):
@@ -182,11 +206,13 @@ class Position(Element):
     joint, jointinparent, site, tendon, slidersite, cranksite.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Velocity(Element):
@@ -195,11 +221,13 @@ class Velocity(Element):
     joint, jointinparent, site, tendon, slidersite, cranksite.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Cylinder(Element):
@@ -208,11 +236,13 @@ class Cylinder(Element):
     joint, jointinparent, site, tendon, slidersite, cranksite.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Muscle(Element):
@@ -221,8 +251,10 @@ class Muscle(Element):
     joint, jointinparent, site, tendon, slidersite, cranksite.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
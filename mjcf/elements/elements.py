@@ -23,6 +23,9 @@ class Include(Element):
         to the directory of the main MJCF file. If the file is not in the same
         directory, it should be prefixed with a relative path.
     """
+    __slots__ = ()
+    _attribute_names = ['file']
+
     @capture_kwargs
     def __init__(
         self,
@@ -30,7 +33,6 @@ class Include(Element):
     ):
         super().__init__()
         self.file = file
-        self._attribute_names = ['file']
 
 
 class Mujoco(Element):
@@ -42,6 +44,9 @@ class Mujoco(Element):
         The name of the model. This name is shown in the title bar of MuJoCo
         HAPTIX.
     """
+    __slots__ = ()
+    _attribute_names = ['model']
+
     @capture_kwargs
     def __init__(
         self,
@@ -49,7 +54,6 @@ class Mujoco(Element):
     ):
         super().__init__()
         self.model = model
-        self._attribute_names = ['model']
 
 
 class Compiler(Element):
@@ -187,6 +191,9 @@ class Compiler(Element):
         This attribute is used to instruct the compiler where to look for
         texture files. It works in the same way as meshdir above.
     """
+    __slots__ = ()
+    _attribute_names = ['angle', 'balanceinertia', 'boundinertia', 'boundmass', 'convexhull', 'coordinate', 'discardvisual', 'eulerseq', 'fitaabb', 'inertiafromgeom', 'inertiagrouprange', 'meshdir', 'settotalmass', 'strippath', 'texturedir']
+
     @capture_kwargs
     def __init__(
         self,
@@ -222,7 +229,6 @@ class Compiler(Element):
         self.settotalmass = settotalmass
         self.strippath = strippath
         self.texturedir = texturedir
-        self._attribute_names = ['angle', 'balanceinertia', 'boundinertia', 'boundmass', 'convexhull', 'coordinate', 'discardvisual', 'eulerseq', 'fitaabb', 'inertiafromgeom', 'inertiagrouprange', 'meshdir', 'settotalmass', 'strippath', 'texturedir']
 
 
 class Option(Element):
@@ -373,6 +379,9 @@ class Option(Element):
         Passive forces in the Computation chapter. The magnitude of these
         forces scales with the values of the next two attributes.
     """
+    __slots__ = ()
+    _attribute_names = ['apirate', 'collision', 'cone', 'density', 'gravity', 'impedance', 'impratio', 'integrator', 'iterations', 'jacobian', 'mpr_iterations', 'mpr_tolerance', 'noslip_iterations', 'noslip_tolerance', 'o_margin', 'o_solimp', 'o_solref', 'reference', 'solver', 'timestep', 'tolerance', 'viscosity', 'wind']
+
     @capture_kwargs
     def __init__(
         self,
@@ -424,7 +433,6 @@ class Option(Element):
         self.tolerance = tolerance
         self.viscosity = viscosity
         self.wind = wind
-        self._attribute_names = ['apirate', 'collision', 'cone', 'density', 'gravity', 'impedance', 'impratio', 'integrator', 'iterations', 'jacobian', 'mpr_iterations', 'mpr_tolerance', 'noslip_iterations', 'noslip_tolerance', 'o_margin', 'o_solimp', 'o_solref', 'reference', 'solver', 'timestep', 'tolerance', 'viscosity', 'wind']
 
 
 class OptionFlag(Element):
@@ -513,6 +521,9 @@ class OptionFlag(Element):
         of states that do not form a trajectory - in which case warm starts
         make no sense and are likely to slow down the solver.
     """
+    __slots__ = ()
+    _attribute_names = ['actuation', 'clampctrl', 'constraint', 'contact', 'energy', 'equality', 'filterparent', 'frictionloss', 'fwdinv', 'gravity', 'limit', 'override', 'passive', 'refsafe', 'sensornoise', 'warmstart']
+
     @capture_kwargs
     def __init__(
         self,
@@ -550,7 +561,6 @@ class OptionFlag(Element):
         self.refsafe = refsafe
         self.sensornoise = sensornoise
         self.warmstart = warmstart
-        self._attribute_names = ['actuation', 'clampctrl', 'constraint', 'contact', 'energy', 'equality', 'filterparent', 'frictionloss', 'fwdinv', 'gravity', 'limit', 'override', 'passive', 'refsafe', 'sensornoise', 'warmstart']
 
 
 class Size(Element):
@@ -632,6 +642,9 @@ class Size(Element):
         The size of the field mjData.userdata of mjData. This field should be
         used to store custom dynamic variables. See also User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['nconmax', 'njmax', 'nkey', 'nstack', 'nuser_actuator', 'nuser_body', 'nuser_cam', 'nuser_geom', 'nuser_jnt', 'nuser_sensor', 'nuser_site', 'nuser_tendon', 'nuserdata']
+
     @capture_kwargs
     def __init__(
         self,
@@ -663,7 +676,6 @@ class Size(Element):
         self.nuser_site = nuser_site
         self.nuser_tendon = nuser_tendon
         self.nuserdata = nuserdata
-        self._attribute_names = ['nconmax', 'njmax', 'nkey', 'nstack', 'nuser_actuator', 'nuser_body', 'nuser_cam', 'nuser_geom', 'nuser_jnt', 'nuser_sensor', 'nuser_site', 'nuser_tendon', 'nuserdata']
 
 
 class Visual(Element):
@@ -685,11 +697,13 @@ class Visual(Element):
     multiple models.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Statistic(Element):
@@ -734,6 +748,9 @@ class Statistic(Element):
         inertia boxes. At runtime this value is multiplied by the attributes of
         the scale element above.
     """
+    __slots__ = ()
+    _attribute_names = ['center', 'extent', 'meaninertia', 'meanmass', 'meansize']
+
     @capture_kwargs
     def __init__(
         self,
@@ -749,7 +766,6 @@ class Statistic(Element):
         self.meaninertia = meaninertia
         self.meanmass = meanmass
         self.meansize = meansize
-        self._attribute_names = ['center', 'extent', 'meaninertia', 'meanmass', 'meansize']
 
 
 class Default(Element):
@@ -764,6 +780,9 @@ class Default(Element):
         classes. This name is used to make the class active when creating an
         actual model element.
     """
+    __slots__ = ()
+    _attribute_names = ['class_']
+
     @capture_kwargs
     def __init__(
         self,
@@ -771,7 +790,6 @@ class Default(Element):
     ):
         super().__init__()
         self.class_ = class_
-        self._attribute_names = ['class_']
 
 
 class Custom(Element):
@@ -780,12 +798,14 @@ class Custom(Element):
     does not have attributes.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     @capture_kwargs
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Numeric(Element):
@@ -807,6 +827,9 @@ class Numeric(Element):
         doubles. If this attribute is not specified, the size will be inferred
         from the actual data array below.
     """
+    __slots__ = ()
+    _attribute_names = ['name', 'data', 'size']
+
     @capture_kwargs
     def __init__(
         self,
@@ -818,7 +841,6 @@ class Numeric(Element):
         self.name = name
         self.data = data
         self.size = size
-        self._attribute_names = ['name', 'data', 'size']
 
 
 class Text(Element):
@@ -832,6 +854,9 @@ class Text(Element):
     :param name:
         Name of the custom text field.
     """
+    __slots__ = ()
+    _attribute_names = ['data', 'name']
+
     @capture_kwargs
     def __init__(
         self,
@@ -841,7 +866,6 @@ class Text(Element):
         super().__init__()
         self.data = data
         self.name = name
-        self._attribute_names = ['data', 'name']
 
 
 class Tuple(Element):
@@ -852,6 +876,9 @@ class Tuple(Element):
     :param name:
         Name of the custom tuple.
     """
+    __slots__ = ()
+    _attribute_names = ['name']
+
     @capture_kwargs
     def __init__(
         self,
@@ -859,7 +886,6 @@ class Tuple(Element):
     ):
         super().__init__()
         self.name = name
-        self._attribute_names = ['name']
 
 
 class Tupleelement(Element):
@@ -876,6 +902,9 @@ class Tupleelement(Element):
         Real-valued parameter associated with this element of the tuple. Its
         use is up to the user.
     """
+    __slots__ = ()
+    _attribute_names = ['objname', 'objtype', 'prm']
+
     @capture_kwargs
     def __init__(
         self,
@@ -887,7 +916,6 @@ class Tupleelement(Element):
         self.objname = objname
         self.objtype = objtype
         self.prm = prm
-        self._attribute_names = ['objname', 'objtype', 'prm']
 
 
 class Asset(Element):
@@ -898,12 +926,14 @@ class Asset(Element):
     chapter.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     @capture_kwargs
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Texture(Element):
@@ -1179,6 +1209,9 @@ class Texture(Element):
         although in some cases (e.g. checker patterns) small values are
         sufficient.
     """
+    __slots__ = ()
+    _attribute_names = ['builtin', 'file', 'fileback', 'filedown', 'filefront', 'fileleft', 'fileright', 'fileup', 'gridlayout', 'gridsize', 'height', 'mark', 'markrgb', 'name', 'random', 'rgb1', 'rgb2', 'type', 'width']
+
     @capture_kwargs
     def __init__(
         self,
@@ -1222,7 +1255,6 @@ class Texture(Element):
         self.rgb2 = rgb2
         self.type = type
         self.width = width
-        self._attribute_names = ['builtin', 'file', 'fileback', 'filedown', 'filefront', 'fileleft', 'fileright', 'fileup', 'gridlayout', 'gridsize', 'height', 'mark', 'markrgb', 'name', 'random', 'rgb1', 'rgb2', 'type', 'width']
 
 
 class Hfield(Element):
@@ -1277,6 +1309,9 @@ class Hfield(Element):
         The default value of 0 means that the data will be loaded from a file,
         which will be used to infer the size of the matrix.
     """
+    __slots__ = ()
+    _attribute_names = ['size', 'file', 'name', 'ncol', 'nrow']
+
     @capture_kwargs
     def __init__(
         self,
@@ -1292,7 +1327,6 @@ class Hfield(Element):
         self.name = name
         self.ncol = ncol
         self.nrow = nrow
-        self._attribute_names = ['size', 'file', 'name', 'ncol', 'nrow']
 
 
 class Mesh(Element):
@@ -1357,6 +1391,9 @@ class Mesh(Element):
         data along each coordinate axis. Negative values are allowed, resulting
         in flipping the mesh along the corresponding axis.
     """
+    __slots__ = ()
+    _attribute_names = ['file', 'class_', 'name', 'scale']
+
     @capture_kwargs
     def __init__(
         self,
@@ -1370,7 +1407,6 @@ class Mesh(Element):
         self.class_ = class_
         self.name = name
         self.scale = scale
-        self._attribute_names = ['file', 'class_', 'name', 'scale']
 
 
 class Material(Element):
@@ -1451,6 +1487,9 @@ class Material(Element):
         "true" means that the 2d texture is repeated N times over one spatial
         unit, regardless of object size.
     """
+    __slots__ = ()
+    _attribute_names = ['name', 'class_', 'emission', 'reflectance', 'rgba', 'shininess', 'specular', 'texrepeat', 'texture', 'texuniform']
+
     @capture_kwargs
     def __init__(
         self,
@@ -1476,7 +1515,6 @@ class Material(Element):
         self.texrepeat = texrepeat
         self.texture = texture
         self.texuniform = texuniform
-        self._attribute_names = ['name', 'class_', 'emission', 'reflectance', 'rgba', 'shininess', 'specular', 'texrepeat', 'texture', 'texuniform']
 
 
 class Body(Element):
@@ -1580,6 +1618,9 @@ class Body(Element):
         rules, the copy operation applies to both position and orientation, and
         the setting of the orientation-related attributes is ignored.
     """
+    __slots__ = ()
+    _attribute_names = ['childclass', 'mocap', 'name', 'pos', 'user', 'axisangle', 'euler', 'quat', 'xyaxes', 'zaxis']
+
     @capture_kwargs
     def __init__(
         self,
@@ -1605,7 +1646,6 @@ class Body(Element):
         self.quat = quat
         self.xyaxes = xyaxes
         self.zaxis = zaxis
-        self._attribute_names = ['childclass', 'mocap', 'name', 'pos', 'user', 'axisangle', 'euler', 'quat', 'xyaxes', 'zaxis']
 
 
 class Inertial(Element):
@@ -1655,6 +1695,9 @@ class Inertial(Element):
     :param zaxis:
         Orientation of the inertial frame. See Frame orientations.
     """
+    __slots__ = ()
+    _attribute_names = ['mass', 'pos', 'diaginertia', 'fullinertia', 'axisangle', 'euler', 'quat', 'xyaxes', 'zaxis']
+
     @capture_kwargs
     def __init__(
         self,
@@ -1678,7 +1721,6 @@ class Inertial(Element):
         self.quat = quat
         self.xyaxes = xyaxes
         self.zaxis = zaxis
-        self._attribute_names = ['mass', 'pos', 'diaginertia', 'fullinertia', 'axisangle', 'euler', 'quat', 'xyaxes', 'zaxis']
 
 
 class Joint(Element):
@@ -1825,6 +1867,9 @@ class Joint(Element):
         Constraint solver parameters for simulating joint limits. See Solver
         parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['armature', 'axis', 'class_', 'damping', 'frictionloss', 'limited', 'margin', 'name', 'pos', 'range', 'ref', 'springdamper', 'springref', 'stiffness', 'type', 'user', 'solimpfriction', 'solimplimit', 'solreffriction', 'solreflimit']
+
     @capture_kwargs
     def __init__(
         self,
@@ -1870,7 +1915,6 @@ class Joint(Element):
         self.solimplimit = solimplimit
         self.solreffriction = solreffriction
         self.solreflimit = solreflimit
-        self._attribute_names = ['armature', 'axis', 'class_', 'damping', 'frictionloss', 'limited', 'margin', 'name', 'pos', 'range', 'ref', 'springdamper', 'springref', 'stiffness', 'type', 'user', 'solimpfriction', 'solimplimit', 'solreffriction', 'solreflimit']
 
 
 class Freejoint(Element):
@@ -1887,6 +1931,9 @@ class Freejoint(Element):
     :param name:
         Name of the joint.
     """
+    __slots__ = ()
+    _attribute_names = ['name']
+
     @capture_kwargs
     def __init__(
         self,
@@ -1894,7 +1941,6 @@ class Freejoint(Element):
     ):
         super().__init__()
         self.name = name
-        self._attribute_names = ['name']
 
 
 class Geom(Element):
@@ -2169,6 +2215,9 @@ class Geom(Element):
     :param zaxis:
         Orientation of the geom frame. See Frame orientations.
     """
+    __slots__ = ()
+    _attribute_names = ['class_', 'conaffinity', 'condim', 'contype', 'density', 'fitscale', 'friction', 'fromto', 'gap', 'group', 'hfield', 'margin', 'mass', 'material', 'mesh', 'name', 'pos', 'rgba', 'size', 'solmix', 'type', 'user', 'axisangle', 'euler', 'quat', 'solimp', 'solref', 'xyaxes', 'zaxis']
+
     @capture_kwargs
     def __init__(
         self,
@@ -2232,7 +2281,6 @@ class Geom(Element):
         self.solref = solref
         self.xyaxes = xyaxes
         self.zaxis = zaxis
-        self._attribute_names = ['class_', 'conaffinity', 'condim', 'contype', 'density', 'fitscale', 'friction', 'fromto', 'gap', 'group', 'hfield', 'margin', 'mass', 'material', 'mesh', 'name', 'pos', 'rgba', 'size', 'solmix', 'type', 'user', 'axisangle', 'euler', 'quat', 'solimp', 'solref', 'xyaxes', 'zaxis']
 
 
 class Site(Element):
@@ -2280,6 +2328,9 @@ class Site(Element):
     :param zaxis:
         Orientation of the site frame. See Frame orientations.
     """
+    __slots__ = ()
+    _attribute_names = ['class_', 'group', 'material', 'name', 'pos', 'rgba', 'size', 'type', 'user', 'axisangle', 'euler', 'quat', 'xyaxes', 'zaxis']
+
     @capture_kwargs
     def __init__(
         self,
@@ -2313,7 +2364,6 @@ class Site(Element):
         self.quat = quat
         self.xyaxes = xyaxes
         self.zaxis = zaxis
-        self._attribute_names = ['class_', 'group', 'material', 'name', 'pos', 'rgba', 'size', 'type', 'user', 'axisangle', 'euler', 'quat', 'xyaxes', 'zaxis']
 
 
 class Camera(Element):
@@ -2392,6 +2442,9 @@ class Camera(Element):
     :param zaxis:
         Orientation of the camera frame. See Frame orientations.
     """
+    __slots__ = ()
+    _attribute_names = ['class_', 'fovy', 'ipd', 'mode', 'name', 'pos', 'target', 'user', 'axisangle', 'euler', 'quat', 'xyaxes', 'zaxis']
+
     @capture_kwargs
     def __init__(
         self,
@@ -2423,7 +2476,6 @@ class Camera(Element):
         self.quat = quat
         self.xyaxes = xyaxes
         self.zaxis = zaxis
-        self._attribute_names = ['class_', 'fovy', 'ipd', 'mode', 'name', 'pos', 'target', 'user', 'axisangle', 'euler', 'quat', 'xyaxes', 'zaxis']
 
 
 class Light(Element):
@@ -2505,6 +2557,9 @@ class Light(Element):
         which body should be targeted in "targetbody" and "targetbodycom"
         modes.
     """
+    __slots__ = ()
+    _attribute_names = ['active', 'ambient', 'attenuation', 'castshadow', 'class_', 'cutoff', 'diffuse', 'dir', 'directional', 'exponent', 'mode', 'name', 'pos', 'specular', 'target']
+
     @capture_kwargs
     def __init__(
         self,
@@ -2540,7 +2595,6 @@ class Light(Element):
         self.pos = pos
         self.specular = specular
         self.target = target
-        self._attribute_names = ['active', 'ambient', 'attenuation', 'castshadow', 'class_', 'cutoff', 'diffuse', 'dir', 'directional', 'exponent', 'mode', 'name', 'pos', 'specular', 'target']
 
 
 class Contact(Element):
@@ -2551,12 +2605,14 @@ class Contact(Element):
     detail in the Computation chapter, thus the description here is brief.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     @capture_kwargs
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Pair(Element):
@@ -2606,6 +2662,9 @@ class Pair(Element):
         Constraint solver parameters for contact simulation. See Solver
         parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['geom1', 'geom2', 'class_', 'condim', 'friction', 'gap', 'margin', 'solimp', 'solref']
+
     @capture_kwargs
     def __init__(
         self,
@@ -2629,7 +2688,6 @@ class Pair(Element):
         self.margin = margin
         self.solimp = solimp
         self.solref = solref
-        self._attribute_names = ['geom1', 'geom2', 'class_', 'condim', 'friction', 'gap', 'margin', 'solimp', 'solref']
 
 
 class Exclude(Element):
@@ -2649,6 +2707,9 @@ class Exclude(Element):
     :param body2:
         The name of the second body in the pair.
     """
+    __slots__ = ()
+    _attribute_names = ['body1', 'body2']
+
     @capture_kwargs
     def __init__(
         self,
@@ -2658,7 +2719,6 @@ class Exclude(Element):
         super().__init__()
         self.body1 = body1
         self.body2 = body2
-        self._attribute_names = ['body1', 'body2']
 
 
 class Equality(Element):
@@ -2670,12 +2730,14 @@ class Equality(Element):
     under the connect element.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     @capture_kwargs
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Tendon(Element):
@@ -2688,12 +2750,14 @@ class Tendon(Element):
     tendons can also represent different forms of mechanical coupling.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     @capture_kwargs
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Spatial(Element):
@@ -2767,6 +2831,9 @@ class Spatial(Element):
         Constraint solver parameters for simulating tendon limits. See Solver
         parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['class_', 'damping', 'frictionloss', 'limited', 'margin', 'material', 'name', 'range', 'rgba', 'stiffness', 'user', 'width', 'solimpfriction', 'solimplimit', 'solreffriction', 'solreflimit']
+
     @capture_kwargs
     def __init__(
         self,
@@ -2804,7 +2871,6 @@ class Spatial(Element):
         self.solimplimit = solimplimit
         self.solreffriction = solreffriction
         self.solreflimit = solreflimit
-        self._attribute_names = ['class_', 'damping', 'frictionloss', 'limited', 'margin', 'material', 'name', 'range', 'rgba', 'stiffness', 'user', 'width', 'solimpfriction', 'solimplimit', 'solreffriction', 'solreflimit']
 
 
 class Fixed(Element):
@@ -2848,6 +2914,9 @@ class Fixed(Element):
     :param user:
         Same as in the spatial element.
     """
+    __slots__ = ()
+    _attribute_names = ['class_', 'damping', 'frictionloss', 'limited', 'margin', 'name', 'range', 'solimpfriction', 'solimplimit', 'solreffriction', 'solreflimit', 'stiffness', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -2879,7 +2948,6 @@ class Fixed(Element):
         self.solreflimit = solreflimit
         self.stiffness = stiffness
         self.user = user
-        self._attribute_names = ['class_', 'damping', 'frictionloss', 'limited', 'margin', 'name', 'range', 'solimpfriction', 'solimplimit', 'solreffriction', 'solreflimit', 'stiffness', 'user']
 
 
 class Actuator(Element):
@@ -2891,12 +2959,14 @@ class Actuator(Element):
     document them only once, under the general actuator.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     @capture_kwargs
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class General(Element):
@@ -3021,6 +3091,9 @@ class General(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['biasprm', 'biastype', 'class_', 'cranklength', 'cranksite', 'ctrllimited', 'ctrlrange', 'dynprm', 'dyntype', 'forcelimited', 'forcerange', 'gainprm', 'gaintype', 'gear', 'joint', 'jointinparent', 'name', 'site', 'slidersite', 'tendon', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -3068,7 +3141,6 @@ class General(Element):
         self.slidersite = slidersite
         self.tendon = tendon
         self.user = user
-        self._attribute_names = ['biasprm', 'biastype', 'class_', 'cranklength', 'cranksite', 'ctrllimited', 'ctrlrange', 'dynprm', 'dyntype', 'forcelimited', 'forcerange', 'gainprm', 'gaintype', 'gear', 'joint', 'jointinparent', 'name', 'site', 'slidersite', 'tendon', 'user']
 
 
 class Motor(Element):
@@ -3168,6 +3240,9 @@ class Motor(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['class_', 'cranklength', 'cranksite', 'ctrllimited', 'ctrlrange', 'forcelimited', 'forcerange', 'gear', 'joint', 'jointinparent', 'name', 'site', 'slidersite', 'tendon', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -3203,7 +3278,6 @@ class Motor(Element):
         self.slidersite = slidersite
         self.tendon = tendon
         self.user = user
-        self._attribute_names = ['class_', 'cranklength', 'cranksite', 'ctrllimited', 'ctrlrange', 'forcelimited', 'forcerange', 'gear', 'joint', 'jointinparent', 'name', 'site', 'slidersite', 'tendon', 'user']
 
 
 class Position(Element):
@@ -3243,6 +3317,9 @@ class Position(Element):
     :param user:
         Same as in actuator/ general.
     """
+    __slots__ = ()
+    _attribute_names = ['kp', 'class_', 'cranklength', 'cranksite', 'ctrllimited', 'ctrlrange', 'forcelimited', 'forcerange', 'gear', 'joint', 'name', 'slidersite', 'tendon', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -3276,7 +3353,6 @@ class Position(Element):
         self.slidersite = slidersite
         self.tendon = tendon
         self.user = user
-        self._attribute_names = ['kp', 'class_', 'cranklength', 'cranksite', 'ctrllimited', 'ctrlrange', 'forcelimited', 'forcerange', 'gear', 'joint', 'name', 'slidersite', 'tendon', 'user']
 
 
 class Velocity(Element):
@@ -3319,6 +3395,9 @@ class Velocity(Element):
     :param user:
         Same as in actuator/ general.
     """
+    __slots__ = ()
+    _attribute_names = ['kv', 'class_', 'cranklength', 'cranksite', 'ctrllimited', 'ctrlrange', 'forcelimited', 'forcerange', 'gear', 'joint', 'name', 'slidersite', 'tendon', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -3352,7 +3431,6 @@ class Velocity(Element):
         self.slidersite = slidersite
         self.tendon = tendon
         self.user = user
-        self._attribute_names = ['kv', 'class_', 'cranklength', 'cranksite', 'ctrllimited', 'ctrlrange', 'forcelimited', 'forcerange', 'gear', 'joint', 'name', 'slidersite', 'tendon', 'user']
 
 
 class Cylinder(Element):
@@ -3400,6 +3478,9 @@ class Cylinder(Element):
     :param user:
         Same as in actuator/ general.
     """
+    __slots__ = ()
+    _attribute_names = ['area', 'bias', 'diameter', 'timeconst', 'class_', 'cranklength', 'cranksite', 'ctrllimited', 'ctrlrange', 'forcelimited', 'forcerange', 'gear', 'joint', 'name', 'slidersite', 'tendon', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -3439,7 +3520,6 @@ class Cylinder(Element):
         self.slidersite = slidersite
         self.tendon = tendon
         self.user = user
-        self._attribute_names = ['area', 'bias', 'diameter', 'timeconst', 'class_', 'cranklength', 'cranksite', 'ctrllimited', 'ctrlrange', 'forcelimited', 'forcerange', 'gear', 'joint', 'name', 'slidersite', 'tendon', 'user']
 
 
 class Muscle(Element):
@@ -3447,12 +3527,14 @@ class Muscle(Element):
              To be written.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     @capture_kwargs
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Sensor(Element):
@@ -3470,12 +3552,14 @@ class Sensor(Element):
     the user.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     @capture_kwargs
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Keyframe(Element):
@@ -3495,12 +3579,14 @@ class Keyframe(Element):
     done programmatically.
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     @capture_kwargs
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
 
 
 class Key(Element):
@@ -3521,6 +3607,9 @@ class Key(Element):
         Simulation time, copied into mjData.time when the simulation state is
         set to this keyframe.
     """
+    __slots__ = ()
+    _attribute_names = ['act', 'qpos', 'qvel', 'time']
+
     @capture_kwargs
     def __init__(
         self,
@@ -3534,7 +3623,6 @@ class Key(Element):
         self.qpos = qpos
         self.qvel = qvel
         self.time = time
-        self._attribute_names = ['act', 'qpos', 'qvel', 'time']
 
 
 class Worldbody(Element):
@@ -3548,9 +3636,11 @@ class Worldbody(Element):
     automatically defined as "world".
 
     """
+    __slots__ = ()
+    _attribute_names = []
+
     @capture_kwargs
     def __init__(
         self,
     ):
         super().__init__()
-        self._attribute_names = []
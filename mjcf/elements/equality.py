@@ -45,6 +45,9 @@ class Connect(Element):
         Constraint solver parameters for equality constraint simulation. See
         Solver parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['anchor', 'body1', 'active', 'body2', 'class_', 'name', 'solimp', 'solref']
+
     @capture_kwargs
     def __init__(
         self,
@@ -66,7 +69,6 @@ class Connect(Element):
         self.name = name
         self.solimp = solimp
         self.solref = solref
-        self._attribute_names = ['anchor', 'body1', 'active', 'body2', 'class_', 'name', 'solimp', 'solref']
 
 
 class Weld(Element):
@@ -98,6 +100,9 @@ class Weld(Element):
     :param solref:
         Same as in connect element.
     """
+    __slots__ = ()
+    _attribute_names = ['body1', 'body2', 'active', 'class_', 'name', 'solimp', 'solref']
+
     @capture_kwargs
     def __init__(
         self,
@@ -117,7 +122,6 @@ class Weld(Element):
         self.name = name
         self.solimp = solimp
         self.solref = solref
-        self._attribute_names = ['body1', 'body2', 'active', 'class_', 'name', 'solimp', 'solref']
 
 
 class Joint(Element):
@@ -150,6 +154,9 @@ class Joint(Element):
     :param solref:
         Same as in connect element.
     """
+    __slots__ = ()
+    _attribute_names = ['joint1', 'joint2', 'polycoef', 'active', 'class_', 'name', 'solimp', 'solref']
+
     @capture_kwargs
     def __init__(
         self,
@@ -171,7 +178,6 @@ class Joint(Element):
         self.name = name
         self.solimp = solimp
         self.solref = solref
-        self._attribute_names = ['joint1', 'joint2', 'polycoef', 'active', 'class_', 'name', 'solimp', 'solref']
 
 
 class Tendon(Element):
@@ -198,6 +204,9 @@ class Tendon(Element):
     :param solref:
         Same as in connect element.
     """
+    __slots__ = ()
+    _attribute_names = ['tendon1', 'polycoef', 'tendon2', 'active', 'class_', 'name', 'solimp', 'solref']
+
     @capture_kwargs
     def __init__(
         self,
@@ -219,7 +228,6 @@ class Tendon(Element):
         self.name = name
         self.solimp = solimp
         self.solref = solref
-        self._attribute_names = ['tendon1', 'polycoef', 'tendon2', 'active', 'class_', 'name', 'solimp', 'solref']
 
 
 class Distance(Element):
@@ -250,6 +258,9 @@ class Distance(Element):
     :param solref:
         Same as in connect element.
     """
+    __slots__ = ()
+    _attribute_names = ['geom1', 'geom2', 'distance', 'active', 'class_', 'name', 'solimp', 'solref']
+
     @capture_kwargs
     def __init__(
         self,
@@ -271,4 +282,3 @@ class Distance(Element):
         self.name = name
         self.solimp = solimp
         self.solref = solref
-        self._attribute_names = ['geom1', 'geom2', 'distance', 'active', 'class_', 'name', 'solimp', 'solref']
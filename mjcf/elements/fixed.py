@@ -14,6 +14,9 @@ class Joint(Element):
         Name of the joint to be added to the fixed tendon. Only scalar joints
         (slide and hinge) can be referenced here.
     """
+    __slots__ = ()
+    _attribute_names = ['coef', 'joint']
+
     def __init__(
         self,
         coef,
@@ -22,4 +25,3 @@ class Joint(Element):
         super().__init__()
         self.coef = coef
         self.joint = joint
-        self._attribute_names = ['coef', 'joint']
@@ -33,6 +33,9 @@ class Touch(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['site', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -48,7 +51,6 @@ class Touch(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['site', 'cutoff', 'name', 'noise', 'user']
 
 
 class Accelerometer(Element):
@@ -75,6 +77,9 @@ class Accelerometer(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['site', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -90,7 +95,6 @@ class Accelerometer(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['site', 'cutoff', 'name', 'noise', 'user']
 
 
 class Velocimeter(Element):
@@ -117,6 +121,9 @@ class Velocimeter(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['site', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -132,7 +139,6 @@ class Velocimeter(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['site', 'cutoff', 'name', 'noise', 'user']
 
 
 class Gyro(Element):
@@ -161,6 +167,9 @@ class Gyro(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['site', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -176,7 +185,6 @@ class Gyro(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['site', 'cutoff', 'name', 'noise', 'user']
 
 
 class Force(Element):
@@ -213,6 +221,9 @@ class Force(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['site', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -228,7 +239,6 @@ class Force(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['site', 'cutoff', 'name', 'noise', 'user']
 
 
 class Torque(Element):
@@ -253,6 +263,9 @@ class Torque(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['site', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -268,7 +281,6 @@ class Torque(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['site', 'cutoff', 'name', 'noise', 'user']
 
 
 class Magnetometer(Element):
@@ -293,6 +305,9 @@ class Magnetometer(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['site', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -308,7 +323,6 @@ class Magnetometer(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['site', 'cutoff', 'name', 'noise', 'user']
 
 
 class Rangefinder(Element):
@@ -340,6 +354,9 @@ class Rangefinder(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['site', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -355,7 +372,6 @@ class Rangefinder(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['site', 'cutoff', 'name', 'noise', 'user']
 
 
 class Jointpos(Element):
@@ -383,6 +399,9 @@ class Jointpos(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['joint', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -398,7 +417,6 @@ class Jointpos(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['joint', 'cutoff', 'name', 'noise', 'user']
 
 
 class Jointvel(Element):
@@ -423,6 +441,9 @@ class Jointvel(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['joint', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -438,7 +459,6 @@ class Jointvel(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['joint', 'cutoff', 'name', 'noise', 'user']
 
 
 class Tendonpos(Element):
@@ -463,6 +483,9 @@ class Tendonpos(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['tendon', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -478,7 +501,6 @@ class Tendonpos(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['tendon', 'cutoff', 'name', 'noise', 'user']
 
 
 class Tendonvel(Element):
@@ -503,6 +525,9 @@ class Tendonvel(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['tendon', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -518,7 +543,6 @@ class Tendonvel(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['tendon', 'cutoff', 'name', 'noise', 'user']
 
 
 class Actuatorpos(Element):
@@ -544,6 +568,9 @@ class Actuatorpos(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['actuator', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -559,7 +586,6 @@ class Actuatorpos(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['actuator', 'cutoff', 'name', 'noise', 'user']
 
 
 class Actuatorvel(Element):
@@ -584,6 +610,9 @@ class Actuatorvel(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['actuator', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -599,7 +628,6 @@ class Actuatorvel(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['actuator', 'cutoff', 'name', 'noise', 'user']
 
 
 class Actuatorfrc(Element):
@@ -627,6 +655,9 @@ class Actuatorfrc(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['actuator', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -642,7 +673,6 @@ class Actuatorfrc(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['actuator', 'cutoff', 'name', 'noise', 'user']
 
 
 class Ballquat(Element):
@@ -667,6 +697,9 @@ class Ballquat(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['joint', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -682,7 +715,6 @@ class Ballquat(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['joint', 'cutoff', 'name', 'noise', 'user']
 
 
 class Ballangvel(Element):
@@ -709,6 +741,9 @@ class Ballangvel(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['joint', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -724,7 +759,6 @@ class Ballangvel(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['joint', 'cutoff', 'name', 'noise', 'user']
 
 
 class Framepos(Element):
@@ -753,6 +787,9 @@ class Framepos(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -770,7 +807,6 @@ class Framepos(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
 
 
 class Framequat(Element):
@@ -800,6 +836,9 @@ class Framequat(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -817,7 +856,6 @@ class Framequat(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
 
 
 class Framexaxis(Element):
@@ -847,6 +885,9 @@ class Framexaxis(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -864,7 +905,6 @@ class Framexaxis(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
 
 
 class Frameyaxis(Element):
@@ -894,6 +934,9 @@ class Frameyaxis(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -911,7 +954,6 @@ class Frameyaxis(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
 
 
 class Framezaxis(Element):
@@ -941,6 +983,9 @@ class Framezaxis(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -958,7 +1003,6 @@ class Framezaxis(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
 
 
 class Framelinvel(Element):
@@ -987,6 +1031,9 @@ class Framelinvel(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -1004,7 +1051,6 @@ class Framelinvel(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
 
 
 class Frameangvel(Element):
@@ -1033,6 +1079,9 @@ class Frameangvel(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -1050,7 +1099,6 @@ class Frameangvel(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
 
 
 class Framelinacc(Element):
@@ -1079,6 +1127,9 @@ class Framelinacc(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -1096,7 +1147,6 @@ class Framelinacc(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
 
 
 class Frameangacc(Element):
@@ -1125,6 +1175,9 @@ class Frameangacc(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -1142,7 +1195,6 @@ class Frameangacc(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
 
 
 class Subtreecom(Element):
@@ -1166,6 +1218,9 @@ class Subtreecom(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['body', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -1181,7 +1236,6 @@ class Subtreecom(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['body', 'cutoff', 'name', 'noise', 'user']
 
 
 class Subtreelinvel(Element):
@@ -1206,6 +1260,9 @@ class Subtreelinvel(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['body', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -1221,7 +1278,6 @@ class Subtreelinvel(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['body', 'cutoff', 'name', 'noise', 'user']
 
 
 class Subtreeangmom(Element):
@@ -1246,6 +1302,9 @@ class Subtreeangmom(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['body', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -1261,7 +1320,6 @@ class Subtreeangmom(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['body', 'cutoff', 'name', 'noise', 'user']
 
 
 class User(Element):
@@ -1306,6 +1364,9 @@ class User(Element):
     :param user:
         See User parameters.
     """
+    __slots__ = ()
+    _attribute_names = ['datatype', 'dim', 'needstage', 'objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
+
     @capture_kwargs
     def __init__(
         self,
@@ -1329,5 +1390,4 @@ class User(Element):
         self.name = name
         self.noise = noise
         self.user = user
-        self._attribute_names = ['datatype', 'dim', 'needstage', 'objname', 'objtype', 'cutoff', 'name', 'noise', 'user']
 
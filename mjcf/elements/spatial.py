@@ -9,13 +9,15 @@ class Site(Element):
     :param site:
         The name of the site that the tendon must pass through.
     """
+    __slots__ = ()
+    _attribute_names = ['site']
+
     def __init__(
         self,
         site,
     ):
         super().__init__()
         self.site = site
-        self._attribute_names = ['site']
 
 
 class Geom(Element):
@@ -37,6 +39,9 @@ class Geom(Element):
         the specified site is automatically selected. Specifying a side site is
         often needed in practice.
     """
+    __slots__ = ()
+    _attribute_names = ['geom', 'sidesite']
+
     def __init__(
         self,
         geom,
@@ -45,7 +50,6 @@ class Geom(Element):
         super().__init__()
         self.geom = geom
         self.sidesite = sidesite
-        self._attribute_names = ['geom', 'sidesite']
 
 
 class Pulley(Element):
@@ -73,10 +77,12 @@ class Pulley(Element):
         included in the tendon path, the first and only branch has divisor
         value of 1.
     """
+    __slots__ = ()
+    _attribute_names = ['divisor']
+
     def __init__(
         self,
         divisor,
     ):
         super().__init__()
         self.divisor = divisor
-        self._attribute_names = ['divisor']
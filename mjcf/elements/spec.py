@@ -0,0 +1,852 @@
+# Generated by scaffolding/gen_spec.py, do not edit.
+"""
+Attribute specs of the element classes in mjcf.elements, keyed by class
+path. Each attribute is described by a
+
+    (name, type, default, required, size, options)
+
+tuple, in xml output order. `size` is the number of values of a vector
+attribute and `options` are the valid values of a keyword attribute, both
+None when they don't apply.
+"""
+
+SPECS = {
+    "mjcf.elements.elements.Include": (
+        ('file', 'str', None, True, None, None),
+    ),
+    "mjcf.elements.elements.Mujoco": (
+        ('model', 'str', 'MuJoCo Model', False, None, None),
+    ),
+    "mjcf.elements.elements.Compiler": (
+        ('angle', 'str', 'degree', False, None, ('radian', 'degree')),
+        ('balanceinertia', 'bool', False, False, None, None),
+        ('boundinertia', 'float', None, False, None, None),
+        ('boundmass', 'float', None, False, None, None),
+        ('convexhull', 'bool', True, False, None, None),
+        ('coordinate', 'str', 'local', False, None, ('local', 'global')),
+        ('discardvisual', 'bool', False, False, None, None),
+        ('eulerseq', 'str', 'xyz', False, None, None),
+        ('fitaabb', 'bool', False, False, None, None),
+        ('inertiafromgeom', 'str', 'auto', False, None, ('false', 'true', 'auto')),
+        ('inertiagrouprange', 'List[int]', [0, 4], False, 2, None),
+        ('meshdir', 'str', None, False, None, None),
+        ('settotalmass', 'float', None, False, None, None),
+        ('strippath', 'bool', False, False, None, None),
+        ('texturedir', 'str', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Option": (
+        ('apirate', 'float', None, False, None, None),
+        ('collision', 'str', 'all', False, None, ('all', 'predefined', 'dynamic')),
+        ('cone', 'str', 'pyramidal', False, None, ('pyramidal', 'elliptic')),
+        ('density', 'float', None, False, None, None),
+        ('gravity', 'List[float]', [0.0, 0.0, -9.81], False, 3, None),
+        ('impedance', 'str', 'sigmoid', False, None, ('constant', 'sigmoid', 'linear', 'user')),
+        ('impratio', 'float', None, False, None, None),
+        ('integrator', 'str', 'Euler', False, None, ('Euler', 'RK4')),
+        ('iterations', 'int', None, False, None, None),
+        ('jacobian', 'str', 'auto', False, None, ('dense', 'sparse', 'auto')),
+        ('mpr_iterations', 'int', None, False, None, None),
+        ('mpr_tolerance', 'float', None, False, None, None),
+        ('noslip_iterations', 'int', None, False, None, None),
+        ('noslip_tolerance', 'float', None, False, None, None),
+        ('o_margin', 'float', None, False, None, None),
+        ('o_solimp', 'List[float]', [0.8, 0.8, 0.01], False, 3, None),
+        ('o_solref', 'List[float]', [0.02, 1.0], False, 2, None),
+        ('reference', 'str', 'spring', False, None, ('spring', 'user')),
+        ('solver', 'str', 'Newton', False, None, ('PGS', 'CG', 'Newton')),
+        ('timestep', 'float', None, False, None, None),
+        ('tolerance', 'float', None, False, None, None),
+        ('viscosity', 'float', None, False, None, None),
+        ('wind', 'List[float]', [0.0, 0.0, 0.0], False, 3, None),
+    ),
+    "mjcf.elements.elements.OptionFlag": (
+        ('actuation', 'str', 'enable', False, None, ('disable', 'enable')),
+        ('clampctrl', 'str', 'enable', False, None, ('disable', 'enable')),
+        ('constraint', 'str', 'enable', False, None, ('disable', 'enable')),
+        ('contact', 'str', 'enable', False, None, ('disable', 'enable')),
+        ('energy', 'str', 'disable', False, None, ('disable', 'enable')),
+        ('equality', 'str', 'enable', False, None, ('disable', 'enable')),
+        ('filterparent', 'str', 'enable', False, None, ('disable', 'enable')),
+        ('frictionloss', 'str', 'enable', False, None, ('disable', 'enable')),
+        ('fwdinv', 'str', 'disable', False, None, ('disable', 'enable')),
+        ('gravity', 'str', 'enable', False, None, ('disable', 'enable')),
+        ('limit', 'str', 'enable', False, None, ('disable', 'enable')),
+        ('override', 'str', 'disable', False, None, ('disable', 'enable')),
+        ('passive', 'str', 'enable', False, None, ('disable', 'enable')),
+        ('refsafe', 'str', 'enable', False, None, ('disable', 'enable')),
+        ('sensornoise', 'str', 'disable', False, None, ('disable', 'enable')),
+        ('warmstart', 'str', 'enable', False, None, ('disable', 'enable')),
+    ),
+    "mjcf.elements.elements.Size": (
+        ('nconmax', 'int', None, False, None, None),
+        ('njmax', 'int', None, False, None, None),
+        ('nkey', 'int', None, False, None, None),
+        ('nstack', 'int', None, False, None, None),
+        ('nuser_actuator', 'int', None, False, None, None),
+        ('nuser_body', 'int', None, False, None, None),
+        ('nuser_cam', 'int', None, False, None, None),
+        ('nuser_geom', 'int', None, False, None, None),
+        ('nuser_jnt', 'int', None, False, None, None),
+        ('nuser_sensor', 'int', None, False, None, None),
+        ('nuser_site', 'int', None, False, None, None),
+        ('nuser_tendon', 'int', None, False, None, None),
+        ('nuserdata', 'int', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Visual": (
+    ),
+    "mjcf.elements.elements.Statistic": (
+        ('center', 'List[float]', None, False, 3, None),
+        ('extent', 'float', None, False, None, None),
+        ('meaninertia', 'float', None, False, None, None),
+        ('meanmass', 'float', None, False, None, None),
+        ('meansize', 'float', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Default": (
+        ('class_', 'str', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Custom": (
+    ),
+    "mjcf.elements.elements.Numeric": (
+        ('name', 'str', None, True, None, None),
+        ('data', 'str', '0 0 ...', False, None, None),
+        ('size', 'int', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Text": (
+        ('data', 'str', None, True, None, None),
+        ('name', 'str', None, True, None, None),
+    ),
+    "mjcf.elements.elements.Tuple": (
+        ('name', 'str', None, True, None, None),
+    ),
+    "mjcf.elements.elements.Tupleelement": (
+        ('objname', 'str', None, True, None, None),
+        ('objtype', 'str', None, True, None, ('body', 'joint', 'geom', 'site', 'camera', 'light', 'mesh', 'hfield', 'texture', 'material', 'equality', 'tendon', 'actuator', 'sensor', 'numeric', 'text', 'tuple')),
+        ('prm', 'float', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Asset": (
+    ),
+    "mjcf.elements.elements.Texture": (
+        ('builtin', 'str', 'none', False, None, ('none', 'gradient', 'checker', 'flat')),
+        ('file', 'str', None, False, None, None),
+        ('fileback', 'str', None, False, None, None),
+        ('filedown', 'str', None, False, None, None),
+        ('filefront', 'str', None, False, None, None),
+        ('fileleft', 'str', None, False, None, None),
+        ('fileright', 'str', None, False, None, None),
+        ('fileup', 'str', None, False, None, None),
+        ('gridlayout', 'str', None, False, None, None),
+        ('gridsize', 'List[int]', [1, 1], False, 2, None),
+        ('height', 'int', None, False, None, None),
+        ('mark', 'str', 'none', False, None, ('none', 'edge', 'cross', 'random')),
+        ('markrgb', 'List[float]', [0.0, 0.0, 0.0], False, 3, None),
+        ('name', 'str', None, False, None, None),
+        ('random', 'float', None, False, None, None),
+        ('rgb1', 'List[float]', [0.8, 0.8, 0.8], False, 3, None),
+        ('rgb2', 'List[float]', [0.5, 0.5, 0.5], False, 3, None),
+        ('type', 'str', 'cube', False, None, ('2d', 'cube', 'skybox')),
+        ('width', 'int', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Hfield": (
+        ('size', 'List[float]', None, True, 4, None),
+        ('file', 'str', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('ncol', 'int', None, False, None, None),
+        ('nrow', 'int', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Mesh": (
+        ('file', 'str', None, True, None, None),
+        ('class_', 'str', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('scale', 'List[float]', [1.0, 1.0, 1.0], False, 3, None),
+    ),
+    "mjcf.elements.elements.Material": (
+        ('name', 'str', None, True, None, None),
+        ('class_', 'str', None, False, None, None),
+        ('emission', 'float', None, False, None, None),
+        ('reflectance', 'float', None, False, None, None),
+        ('rgba', 'List[float]', [1.0, 1.0, 1.0, 1.0], False, 4, None),
+        ('shininess', 'float', None, False, None, None),
+        ('specular', 'float', None, False, None, None),
+        ('texrepeat', 'List[float]', [1.0, 1.0], False, 2, None),
+        ('texture', 'str', None, False, None, None),
+        ('texuniform', 'bool', False, False, None, None),
+    ),
+    "mjcf.elements.elements.Body": (
+        ('childclass', 'str', None, False, None, None),
+        ('mocap', 'bool', False, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('pos', 'List[float]', None, False, 3, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+        ('axisangle', 'List[float]', None, False, None, None),
+        ('euler', 'List[float]', None, False, None, None),
+        ('quat', 'List[float]', [1, 0, 0, 0], False, None, None),
+        ('xyaxes', 'List[float]', None, False, None, None),
+        ('zaxis', 'List[float]', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Inertial": (
+        ('mass', 'float', None, True, None, None),
+        ('pos', 'List[float]', None, True, 3, None),
+        ('diaginertia', 'List[float]', None, False, 3, None),
+        ('fullinertia', 'List[float]', None, False, 6, None),
+        ('axisangle', 'List[float]', None, False, None, None),
+        ('euler', 'List[float]', None, False, None, None),
+        ('quat', 'List[float]', [1, 0, 0, 0], False, None, None),
+        ('xyaxes', 'List[float]', None, False, None, None),
+        ('zaxis', 'List[float]', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Joint": (
+        ('armature', 'float', None, False, None, None),
+        ('axis', 'List[float]', [0.0, 0.0, 1.0], False, 3, None),
+        ('class_', 'str', None, False, None, None),
+        ('damping', 'float', None, False, None, None),
+        ('frictionloss', 'float', None, False, None, None),
+        ('limited', 'bool', False, False, None, None),
+        ('margin', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('pos', 'List[float]', [0.0, 0.0, 0.0], False, 3, None),
+        ('range', 'List[float]', [0.0, 0.0], False, 2, None),
+        ('ref', 'float', None, False, None, None),
+        ('springdamper', 'List[float]', [0.0, 0.0], False, 2, None),
+        ('springref', 'float', None, False, None, None),
+        ('stiffness', 'float', None, False, None, None),
+        ('type', 'str', 'hinge', False, None, ('free', 'ball', 'slide', 'hinge')),
+        ('user', 'str', '0 0 ...', False, None, None),
+        ('solimpfriction', 'List[float]', None, False, 3, None),
+        ('solimplimit', 'List[float]', None, False, 3, None),
+        ('solreffriction', 'List[float]', None, False, 2, None),
+        ('solreflimit', 'List[float]', None, False, 2, None),
+    ),
+    "mjcf.elements.elements.Freejoint": (
+        ('name', 'str', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Geom": (
+        ('class_', 'str', None, False, None, None),
+        ('conaffinity', 'int', None, False, None, None),
+        ('condim', 'int', None, False, None, None),
+        ('contype', 'int', None, False, None, None),
+        ('density', 'float', None, False, None, None),
+        ('fitscale', 'float', None, False, None, None),
+        ('friction', 'List[float]', [1.0, 0.005, 0.0001], False, 3, None),
+        ('fromto', 'List[float]', None, False, 6, None),
+        ('gap', 'float', None, False, None, None),
+        ('group', 'int', None, False, None, None),
+        ('hfield', 'str', None, False, None, None),
+        ('margin', 'float', None, False, None, None),
+        ('mass', 'float', None, False, None, None),
+        ('material', 'str', None, False, None, None),
+        ('mesh', 'str', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('pos', 'List[float]', [0.0, 0.0, 0.0], False, 3, None),
+        ('rgba', 'List[float]', [0.5, 0.5, 0.5, 1.0], False, 4, None),
+        ('size', 'List[float]', [0.0, 0.0, 0.0], False, 3, None),
+        ('solmix', 'float', None, False, None, None),
+        ('type', 'str', 'sphere', False, None, ('plane', 'hfield', 'sphere', 'capsule', 'ellipsoid', 'cylinder', 'box', 'mesh')),
+        ('user', 'str', '0 0 ...', False, None, None),
+        ('axisangle', 'List[float]', None, False, None, None),
+        ('euler', 'List[float]', None, False, None, None),
+        ('quat', 'List[float]', [1, 0, 0, 0], False, None, None),
+        ('solimp', 'List[float]', [0.9, 0.95, 0.001], False, None, None),
+        ('solref', 'List[float]', [0.02, 1], False, None, None),
+        ('xyaxes', 'List[float]', None, False, None, None),
+        ('zaxis', 'List[float]', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Site": (
+        ('class_', 'str', None, False, None, None),
+        ('group', 'int', None, False, None, None),
+        ('material', 'str', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('pos', 'List[float]', [0.0, 0.0, 0.0], False, 3, None),
+        ('rgba', 'List[float]', [0.5, 0.5, 0.5, 1.0], False, 4, None),
+        ('size', 'List[float]', [0.0, 0.0, 0.0], False, 3, None),
+        ('type', 'str', 'sphere', False, None, ('sphere', 'capsule', 'ellipsoid', 'cylinder', 'box')),
+        ('user', 'str', '0 0 ...', False, None, None),
+        ('axisangle', 'List[float]', None, False, None, None),
+        ('euler', 'List[float]', None, False, None, None),
+        ('quat', 'List[float]', [1, 0, 0, 0], False, None, None),
+        ('xyaxes', 'List[float]', None, False, None, None),
+        ('zaxis', 'List[float]', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Camera": (
+        ('class_', 'str', None, False, None, None),
+        ('fovy', 'float', None, False, None, None),
+        ('ipd', 'float', None, False, None, None),
+        ('mode', 'str', 'fixed', False, None, ('fixed', 'track', 'trackcom', 'targetbody', 'targetbodycom')),
+        ('name', 'str', None, False, None, None),
+        ('pos', 'List[float]', [0.0, 0.0, 0.0], False, 3, None),
+        ('target', 'str', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+        ('axisangle', 'List[float]', None, False, None, None),
+        ('euler', 'List[float]', None, False, None, None),
+        ('quat', 'List[float]', [1, 0, 0, 0], False, None, None),
+        ('xyaxes', 'List[float]', None, False, None, None),
+        ('zaxis', 'List[float]', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Light": (
+        ('active', 'bool', True, False, None, None),
+        ('ambient', 'List[float]', [0.0, 0.0, 0.0], False, 3, None),
+        ('attenuation', 'List[float]', [1.0, 0.0, 0.0], False, 3, None),
+        ('castshadow', 'bool', True, False, None, None),
+        ('class_', 'str', None, False, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('diffuse', 'List[float]', [0.7, 0.7, 0.7], False, 3, None),
+        ('dir', 'List[float]', [0.0, 0.0, -1.0], False, 3, None),
+        ('directional', 'bool', False, False, None, None),
+        ('exponent', 'float', None, False, None, None),
+        ('mode', 'str', 'fixed', False, None, ('fixed', 'track', 'trackcom', 'targetbody', 'targetbodycom')),
+        ('name', 'str', None, False, None, None),
+        ('pos', 'List[float]', [0.0, 0.0, 0.0], False, 3, None),
+        ('specular', 'List[float]', [0.3, 0.3, 0.3], False, 3, None),
+        ('target', 'str', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Contact": (
+    ),
+    "mjcf.elements.elements.Pair": (
+        ('geom1', 'str', None, True, None, None),
+        ('geom2', 'str', None, True, None, None),
+        ('class_', 'str', None, False, None, None),
+        ('condim', 'int', None, False, None, None),
+        ('friction', 'List[float]', [1.0, 1.0, 0.005, 0.0001, 0.0001], False, 5, None),
+        ('gap', 'float', None, False, None, None),
+        ('margin', 'float', None, False, None, None),
+        ('solimp', 'List[float]', [0.9, 0.95, 0.001], False, None, None),
+        ('solref', 'List[float]', [0.02, 1], False, None, None),
+    ),
+    "mjcf.elements.elements.Exclude": (
+        ('body1', 'str', None, True, None, None),
+        ('body2', 'str', None, True, None, None),
+    ),
+    "mjcf.elements.elements.Equality": (
+    ),
+    "mjcf.elements.elements.Tendon": (
+    ),
+    "mjcf.elements.elements.Spatial": (
+        ('class_', 'str', None, False, None, None),
+        ('damping', 'float', None, False, None, None),
+        ('frictionloss', 'float', None, False, None, None),
+        ('limited', 'bool', False, False, None, None),
+        ('margin', 'float', None, False, None, None),
+        ('material', 'str', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('range', 'List[float]', [0.0, 0.0], False, 2, None),
+        ('rgba', 'List[float]', [0.5, 0.5, 0.5, 1.0], False, 4, None),
+        ('stiffness', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+        ('width', 'float', None, False, None, None),
+        ('solimpfriction', 'List[float]', None, False, 3, None),
+        ('solimplimit', 'List[float]', None, False, 3, None),
+        ('solreffriction', 'List[float]', None, False, 2, None),
+        ('solreflimit', 'List[float]', None, False, 2, None),
+    ),
+    "mjcf.elements.elements.Fixed": (
+        ('class_', 'str', None, False, None, None),
+        ('damping', 'str', None, False, None, None),
+        ('frictionloss', 'str', None, False, None, None),
+        ('limited', 'str', None, False, None, None),
+        ('margin', 'str', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('range', 'str', None, False, None, None),
+        ('solimpfriction', 'List[float]', None, False, 3, None),
+        ('solimplimit', 'List[float]', None, False, 3, None),
+        ('solreffriction', 'List[float]', None, False, 2, None),
+        ('solreflimit', 'List[float]', None, False, 2, None),
+        ('stiffness', 'str', None, False, None, None),
+        ('user', 'str', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Actuator": (
+    ),
+    "mjcf.elements.elements.General": (
+        ('biasprm', 'List[float]', [0.0, 0.0, 0.0], False, 3, None),
+        ('biastype', 'str', 'none', False, None, ('none', 'affine', 'user')),
+        ('class_', 'str', None, False, None, None),
+        ('cranklength', 'float', None, False, None, None),
+        ('cranksite', 'str', None, False, None, None),
+        ('ctrllimited', 'bool', False, False, None, None),
+        ('ctrlrange', 'List[float]', [0.0, 0.0], False, 2, None),
+        ('dynprm', 'List[float]', [1.0, 0.0, 0.0], False, 3, None),
+        ('dyntype', 'str', 'none', False, None, ('none', 'integrator', 'filter', 'user')),
+        ('forcelimited', 'bool', False, False, None, None),
+        ('forcerange', 'List[float]', [0.0, 0.0], False, 2, None),
+        ('gainprm', 'List[float]', [1.0, 0.0, 0.0], False, 3, None),
+        ('gaintype', 'str', 'fixed', False, None, ('fixed', 'user')),
+        ('gear', 'List[float]', [1.0, 0.0, 0.0, 0.0, 0.0, 0.0], False, 6, None),
+        ('joint', 'str', None, False, None, None),
+        ('jointinparent', 'str', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('site', 'str', None, False, None, None),
+        ('slidersite', 'str', None, False, None, None),
+        ('tendon', 'str', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.elements.Motor": (
+        ('class_', 'str', None, False, None, None),
+        ('cranklength', 'float', None, False, None, None),
+        ('cranksite', 'str', None, False, None, None),
+        ('ctrllimited', 'bool', False, False, None, None),
+        ('ctrlrange', 'List[float]', [0.0, 0.0], False, 2, None),
+        ('forcelimited', 'bool', False, False, None, None),
+        ('forcerange', 'List[float]', [0.0, 0.0], False, 2, None),
+        ('gear', 'List[float]', [1.0, 0.0, 0.0, 0.0, 0.0, 0.0], False, 6, None),
+        ('joint', 'str', None, False, None, None),
+        ('jointinparent', 'str', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('site', 'str', None, False, None, None),
+        ('slidersite', 'str', None, False, None, None),
+        ('tendon', 'str', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.elements.Position": (
+        ('kp', 'float', None, False, None, None),
+        ('class_', 'str', None, False, None, None),
+        ('cranklength', 'str', None, False, None, None),
+        ('cranksite', 'str', None, False, None, None),
+        ('ctrllimited', 'str', None, False, None, None),
+        ('ctrlrange', 'str', None, False, None, None),
+        ('forcelimited', 'str', None, False, None, None),
+        ('forcerange', 'str', None, False, None, None),
+        ('gear', 'str', None, False, None, None),
+        ('joint', 'str', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('slidersite', 'str', None, False, None, None),
+        ('tendon', 'str', None, False, None, None),
+        ('user', 'str', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Velocity": (
+        ('kv', 'float', None, False, None, None),
+        ('class_', 'str', None, False, None, None),
+        ('cranklength', 'str', None, False, None, None),
+        ('cranksite', 'str', None, False, None, None),
+        ('ctrllimited', 'str', None, False, None, None),
+        ('ctrlrange', 'str', None, False, None, None),
+        ('forcelimited', 'str', None, False, None, None),
+        ('forcerange', 'str', None, False, None, None),
+        ('gear', 'str', None, False, None, None),
+        ('joint', 'str', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('slidersite', 'str', None, False, None, None),
+        ('tendon', 'str', None, False, None, None),
+        ('user', 'str', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Cylinder": (
+        ('area', 'float', None, False, None, None),
+        ('bias', 'List[float]', [0.0, 0.0, 0.0], False, 3, None),
+        ('diameter', 'float', None, False, None, None),
+        ('timeconst', 'float', None, False, None, None),
+        ('class_', 'str', None, False, None, None),
+        ('cranklength', 'str', None, False, None, None),
+        ('cranksite', 'str', None, False, None, None),
+        ('ctrllimited', 'str', None, False, None, None),
+        ('ctrlrange', 'str', None, False, None, None),
+        ('forcelimited', 'str', None, False, None, None),
+        ('forcerange', 'str', None, False, None, None),
+        ('gear', 'str', None, False, None, None),
+        ('joint', 'str', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('slidersite', 'str', None, False, None, None),
+        ('tendon', 'str', None, False, None, None),
+        ('user', 'str', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Muscle": (
+    ),
+    "mjcf.elements.elements.Sensor": (
+    ),
+    "mjcf.elements.elements.Keyframe": (
+    ),
+    "mjcf.elements.elements.Key": (
+        ('act', 'str', '0 0 ...', False, None, None),
+        ('qpos', 'str', None, False, None, None),
+        ('qvel', 'str', '0 0 ...', False, None, None),
+        ('time', 'float', None, False, None, None),
+    ),
+    "mjcf.elements.elements.Worldbody": (
+    ),
+    "mjcf.elements.visual.Global": (
+        ('fovy', 'float', None, False, None, None),
+        ('glow', 'float', None, False, None, None),
+        ('ipd', 'float', None, False, None, None),
+        ('linewidth', 'float', None, False, None, None),
+        ('offheight', 'int', None, False, None, None),
+        ('offwidth', 'int', None, False, None, None),
+    ),
+    "mjcf.elements.visual.Quality": (
+        ('numarrows', 'int', None, False, None, None),
+        ('numquads', 'int', None, False, None, None),
+        ('numslices', 'int', None, False, None, None),
+        ('numstacks', 'int', None, False, None, None),
+        ('offsamples', 'int', None, False, None, None),
+        ('shadowsize', 'int', None, False, None, None),
+    ),
+    "mjcf.elements.visual.Headlight": (
+        ('active', 'int', None, False, None, None),
+        ('ambient', 'List[float]', [0.1, 0.1, 0.1], False, 3, None),
+        ('diffuse', 'List[float]', [0.4, 0.4, 0.4], False, 3, None),
+        ('specular', 'List[float]', [0.5, 0.5, 0.5], False, 3, None),
+    ),
+    "mjcf.elements.visual.Map": (
+        ('alpha', 'float', None, False, None, None),
+        ('fogend', 'float', None, False, None, None),
+        ('fogstart', 'float', None, False, None, None),
+        ('force', 'float', None, False, None, None),
+        ('shadowclip', 'float', None, False, None, None),
+        ('shadowscale', 'float', None, False, None, None),
+        ('stiffness', 'float', None, False, None, None),
+        ('stiffnessrot', 'float', None, False, None, None),
+        ('torque', 'float', None, False, None, None),
+        ('zfar', 'float', None, False, None, None),
+        ('znear', 'float', None, False, None, None),
+    ),
+    "mjcf.elements.visual.Scale": (
+        ('actuatorlength', 'float', None, False, None, None),
+        ('actuatorwidth', 'float', None, False, None, None),
+        ('camera', 'float', None, False, None, None),
+        ('com', 'float', None, False, None, None),
+        ('connect', 'float', None, False, None, None),
+        ('constraint', 'float', None, False, None, None),
+        ('contactheight', 'float', None, False, None, None),
+        ('contactwidth', 'float', None, False, None, None),
+        ('forcewidth', 'float', None, False, None, None),
+        ('framelength', 'float', None, False, None, None),
+        ('framewidth', 'float', None, False, None, None),
+        ('jointlength', 'float', None, False, None, None),
+        ('jointwidth', 'float', None, False, None, None),
+        ('light', 'float', None, False, None, None),
+        ('selectpoint', 'float', None, False, None, None),
+        ('slidercrank', 'float', None, False, None, None),
+    ),
+    "mjcf.elements.visual.Rgba": (
+        ('actuator', 'List[float]', [0.9, 0.4, 0.4, 1.0], False, 4, None),
+        ('camera', 'List[float]', [0.6, 0.9, 0.6, 1.0], False, 4, None),
+        ('com', 'List[float]', [0.9, 0.9, 0.9, 1.0], False, 4, None),
+        ('connect', 'List[float]', [0.2, 0.2, 0.8, 1.0], False, 4, None),
+        ('constraint', 'List[float]', [0.9, 0.0, 0.0, 1.0], False, 4, None),
+        ('contactforce', 'List[float]', [0.7, 0.9, 0.9, 1.0], False, 4, None),
+        ('contactfriction', 'List[float]', [0.9, 0.8, 0.4, 1.0], False, 4, None),
+        ('contactpoint', 'List[float]', [0.9, 0.6, 0.2, 1.0], False, 4, None),
+        ('contacttorque', 'List[float]', [0.9, 0.7, 0.9, 1.0], False, 4, None),
+        ('crankbroken', 'List[float]', [0.9, 0.0, 0.0, 1.0], False, 4, None),
+        ('fog', 'List[float]', [0.0, 0.0, 0.0, 1.0], False, 4, None),
+        ('force', 'List[float]', [1.0, 0.5, 0.5, 1.0], False, 4, None),
+        ('inertia', 'List[float]', [0.8, 0.2, 0.2, 0.6], False, 4, None),
+        ('joint', 'List[float]', [0.2, 0.6, 0.8, 1.0], False, 4, None),
+        ('light', 'List[float]', [0.6, 0.6, 0.9, 1.0], False, 4, None),
+        ('selectpoint', 'List[float]', [0.9, 0.9, 0.1, 1.0], False, 4, None),
+        ('slidercrank', 'List[float]', [0.5, 0.3, 0.8, 1.0], False, 4, None),
+    ),
+    "mjcf.elements.equality.Connect": (
+        ('anchor', 'List[float]', None, True, 3, None),
+        ('body1', 'str', None, True, None, None),
+        ('active', 'bool', True, False, None, None),
+        ('body2', 'str', None, False, None, None),
+        ('class_', 'str', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('solimp', 'List[float]', [0.9, 0.95, 0.001], False, None, None),
+        ('solref', 'List[float]', [0.02, 1], False, None, None),
+    ),
+    "mjcf.elements.equality.Weld": (
+        ('body1', 'str', None, True, None, None),
+        ('body2', 'str', None, False, None, None),
+        ('active', 'str', None, False, None, None),
+        ('class_', 'str', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('solimp', 'List[float]', [0.9, 0.95, 0.001], False, None, None),
+        ('solref', 'List[float]', [0.02, 1], False, None, None),
+    ),
+    "mjcf.elements.equality.Joint": (
+        ('joint1', 'str', None, True, None, None),
+        ('joint2', 'str', None, False, None, None),
+        ('polycoef', 'List[float]', [0.0, 1.0, 0.0, 0.0, 0.0], False, 4, None),
+        ('active', 'str', None, False, None, None),
+        ('class_', 'str', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('solimp', 'List[float]', [0.9, 0.95, 0.001], False, None, None),
+        ('solref', 'List[float]', [0.02, 1], False, None, None),
+    ),
+    "mjcf.elements.equality.Tendon": (
+        ('tendon1', 'str', None, True, None, None),
+        ('polycoef', 'List[float]', [0.0, 1.0, 0.0, 0.0], False, 4, None),
+        ('tendon2', 'str', None, False, None, None),
+        ('active', 'str', None, False, None, None),
+        ('class_', 'str', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('solimp', 'List[float]', [0.9, 0.95, 0.001], False, None, None),
+        ('solref', 'List[float]', [0.02, 1], False, None, None),
+    ),
+    "mjcf.elements.equality.Distance": (
+        ('geom1', 'str', None, True, None, None),
+        ('geom2', 'str', None, True, None, None),
+        ('distance', 'float', None, False, None, None),
+        ('active', 'str', None, False, None, None),
+        ('class_', 'str', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('solimp', 'List[float]', [0.9, 0.95, 0.001], False, None, None),
+        ('solref', 'List[float]', [0.02, 1], False, None, None),
+    ),
+    "mjcf.elements.fixed.Joint": (
+        ('coef', 'float', None, True, None, None),
+        ('joint', 'str', None, True, None, None),
+    ),
+    "mjcf.elements.sensor.Touch": (
+        ('site', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Accelerometer": (
+        ('site', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Velocimeter": (
+        ('site', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Gyro": (
+        ('site', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Force": (
+        ('site', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Torque": (
+        ('site', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Magnetometer": (
+        ('site', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Rangefinder": (
+        ('site', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Jointpos": (
+        ('joint', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Jointvel": (
+        ('joint', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Tendonpos": (
+        ('tendon', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Tendonvel": (
+        ('tendon', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Actuatorpos": (
+        ('actuator', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Actuatorvel": (
+        ('actuator', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Actuatorfrc": (
+        ('actuator', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Ballquat": (
+        ('joint', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Ballangvel": (
+        ('joint', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Framepos": (
+        ('objname', 'str', None, True, None, None),
+        ('objtype', 'str', None, True, None, ('body', 'xbody', 'geom', 'site', 'camera')),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Framequat": (
+        ('objname', 'str', None, True, None, None),
+        ('objtype', 'str', None, True, None, ('body', 'xbody', 'geom', 'site', 'camera')),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Framexaxis": (
+        ('objname', 'str', None, True, None, None),
+        ('objtype', 'str', None, True, None, ('body', 'xbody', 'geom', 'site', 'camera')),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Frameyaxis": (
+        ('objname', 'str', None, True, None, None),
+        ('objtype', 'str', None, True, None, ('body', 'xbody', 'geom', 'site', 'camera')),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Framezaxis": (
+        ('objname', 'str', None, True, None, None),
+        ('objtype', 'str', None, True, None, ('body', 'xbody', 'geom', 'site', 'camera')),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Framelinvel": (
+        ('objname', 'str', None, True, None, None),
+        ('objtype', 'str', None, True, None, ('body', 'xbody', 'geom', 'site', 'camera')),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Frameangvel": (
+        ('objname', 'str', None, True, None, None),
+        ('objtype', 'str', None, True, None, ('body', 'xbody', 'geom', 'site', 'camera')),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Framelinacc": (
+        ('objname', 'str', None, True, None, None),
+        ('objtype', 'str', None, True, None, ('body', 'xbody', 'geom', 'site', 'camera')),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Frameangacc": (
+        ('objname', 'str', None, True, None, None),
+        ('objtype', 'str', None, True, None, ('body', 'xbody', 'geom', 'site', 'camera')),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Subtreecom": (
+        ('body', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Subtreelinvel": (
+        ('body', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.Subtreeangmom": (
+        ('body', 'str', None, True, None, None),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.sensor.User": (
+        ('datatype', 'str', None, True, None, ('real', 'positive', 'axis', 'quaternion')),
+        ('dim', 'int', None, True, None, None),
+        ('needstage', 'str', None, True, None, ('pos', 'vel', 'acc')),
+        ('objname', 'str', None, True, None, None),
+        ('objtype', 'str', None, True, None, ('body', 'joint', 'geom', 'site', 'camera', 'light', 'mesh', 'hfield', 'texture', 'material', 'equality', 'tendon', 'actuator', 'sensor', 'numeric', 'text', 'tuple')),
+        ('cutoff', 'float', None, False, None, None),
+        ('name', 'str', None, False, None, None),
+        ('noise', 'float', None, False, None, None),
+        ('user', 'str', '0 0 ...', False, None, None),
+    ),
+    "mjcf.elements.default.Mesh": (
+    ),
+    "mjcf.elements.default.Material": (
+    ),
+    "mjcf.elements.default.Joint": (
+    ),
+    "mjcf.elements.default.Geom": (
+    ),
+    "mjcf.elements.default.Site": (
+    ),
+    "mjcf.elements.default.Camera": (
+    ),
+    "mjcf.elements.default.Light": (
+    ),
+    "mjcf.elements.default.Pair": (
+    ),
+    "mjcf.elements.default.Equality": (
+    ),
+    "mjcf.elements.default.Tendon": (
+    ),
+    "mjcf.elements.default.General": (
+    ),
+    "mjcf.elements.default.Motor": (
+    ),
+    "mjcf.elements.default.Position": (
+    ),
+    "mjcf.elements.default.Velocity": (
+    ),
+    "mjcf.elements.default.Cylinder": (
+    ),
+    "mjcf.elements.default.Muscle": (
+    ),
+    "mjcf.elements.spatial.Site": (
+        ('site', 'str', None, True, None, None),
+    ),
+    "mjcf.elements.spatial.Geom": (
+        ('geom', 'str', None, True, None, None),
+        ('sidesite', 'str', None, False, None, None),
+    ),
+    "mjcf.elements.spatial.Pulley": (
+        ('divisor', 'float', None, True, None, None),
+    ),
+}
\ No newline at end of file
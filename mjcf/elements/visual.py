@@ -38,6 +38,9 @@ class Global(Element):
         the buffer. The size of this buffer can also be adjusted at runtime,
         but it is usually more convenient to set it in the XML.
     """
+    __slots__ = ()
+    _attribute_names = ['fovy', 'glow', 'ipd', 'linewidth', 'offheight', 'offwidth']
+
     @capture_kwargs
     def __init__(
         self,
@@ -55,7 +58,6 @@ class Global(Element):
         self.linewidth = linewidth
         self.offheight = offheight
         self.offwidth = offwidth
-        self._attribute_names = ['fovy', 'glow', 'ipd', 'linewidth', 'offheight', 'offwidth']
 
 
 class Quality(Element):
@@ -110,6 +112,9 @@ class Quality(Element):
         other advanced feature) is not supported by the video driver, it
         automatically disables that feature.
     """
+    __slots__ = ()
+    _attribute_names = ['numarrows', 'numquads', 'numslices', 'numstacks', 'offsamples', 'shadowsize']
+
     @capture_kwargs
     def __init__(
         self,
@@ -127,7 +132,6 @@ class Quality(Element):
         self.numstacks = numstacks
         self.offsamples = offsamples
         self.shadowsize = shadowsize
-        self._attribute_names = ['numarrows', 'numquads', 'numslices', 'numstacks', 'offsamples', 'shadowsize']
 
 
 class Headlight(Element):
@@ -152,6 +156,9 @@ class Headlight(Element):
     :param specular:
         The specular component of the headlight, in the sense of OpenGL.
     """
+    __slots__ = ()
+    _attribute_names = ['active', 'ambient', 'diffuse', 'specular']
+
     @capture_kwargs
     def __init__(
         self,
@@ -165,7 +172,6 @@ class Headlight(Element):
         self.ambient = ambient
         self.diffuse = diffuse
         self.specular = specular
-        self._attribute_names = ['active', 'ambient', 'diffuse', 'specular']
 
 
 class Map(Element):
@@ -233,6 +239,9 @@ class Map(Element):
         clipping plane is the model extent multiplied by the value of this
         attribute.
     """
+    __slots__ = ()
+    _attribute_names = ['alpha', 'fogend', 'fogstart', 'force', 'shadowclip', 'shadowscale', 'stiffness', 'stiffnessrot', 'torque', 'zfar', 'znear']
+
     @capture_kwargs
     def __init__(
         self,
@@ -260,7 +269,6 @@ class Map(Element):
         self.torque = torque
         self.zfar = zfar
         self.znear = znear
-        self._attribute_names = ['alpha', 'fogend', 'fogstart', 'force', 'shadowclip', 'shadowscale', 'stiffness', 'stiffnessrot', 'torque', 'zfar', 'znear']
 
 
 class Scale(Element):
@@ -321,6 +329,9 @@ class Scale(Element):
         second part of the mechanism is automatically scaled relative to this
         setting.
     """
+    __slots__ = ()
+    _attribute_names = ['actuatorlength', 'actuatorwidth', 'camera', 'com', 'connect', 'constraint', 'contactheight', 'contactwidth', 'forcewidth', 'framelength', 'framewidth', 'jointlength', 'jointwidth', 'light', 'selectpoint', 'slidercrank']
+
     @capture_kwargs
     def __init__(
         self,
@@ -358,7 +369,6 @@ class Scale(Element):
         self.light = light
         self.selectpoint = selectpoint
         self.slidercrank = slidercrank
-        self._attribute_names = ['actuatorlength', 'actuatorwidth', 'camera', 'com', 'connect', 'constraint', 'contactheight', 'contactwidth', 'forcewidth', 'framelength', 'framewidth', 'jointlength', 'jointwidth', 'light', 'selectpoint', 'slidercrank']
 
 
 class Rgba(Element):
@@ -417,6 +427,9 @@ class Rgba(Element):
     :param slidercrank:
         Color of slider-crank mechanisms.
     """
+    __slots__ = ()
+    _attribute_names = ['actuator', 'camera', 'com', 'connect', 'constraint', 'contactforce', 'contactfriction', 'contactpoint', 'contacttorque', 'crankbroken', 'fog', 'force', 'inertia', 'joint', 'light', 'selectpoint', 'slidercrank']
+
     @capture_kwargs
     def __init__(
         self,
@@ -456,4 +469,3 @@ class Rgba(Element):
         self.light = light
         self.selectpoint = selectpoint
         self.slidercrank = slidercrank
-        self._attribute_names = ['actuator', 'camera', 'com', 'connect', 'constraint', 'contactforce', 'contactfriction', 'contactpoint', 'contacttorque', 'crankbroken', 'fog', 'force', 'inertia', 'joint', 'light', 'selectpoint', 'slidercrank']
@@ -0,0 +1,69 @@
+"""
+Name and tag index of an element tree, kept up to date as it grows
+"""
+
+
+class ElementIndex(object):
+    """
+    The elements of a tree by name and by tag, shared by every element of
+    the tree through its _index slot.
+
+    The index is built by the first query on a tree. From then on
+    Element.add_child() adds new subtrees to it and renaming an element
+    moves it to its new name. Elements are listed in document order as of
+    when the index was built, later additions in the order they were added.
+    Adding the root of an indexed tree to another tree invalidates its
+    index, the next query rebuilds one for the combined tree.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.valid = True
+        self.by_name = {}
+        self.by_tag = {}
+        self.add_subtree(root)
+
+    def add_subtree(self, root):
+        """
+        Adds `root` and its descendants to the index
+        """
+        from mjcf.element_table import ElementTable
+
+        by_tag = self.by_tag
+        stack = [root]
+        while stack:
+            element = stack.pop()
+            element._index = self
+            # Tables hold rows rather than elements
+            if element.__class__ is ElementTable:
+                continue
+            tag = element.__class__.__name__.lower()
+            elements = by_tag.get(tag)
+            if elements is None:
+                by_tag[tag] = [element]
+            else:
+                elements.append(element)
+            name = element._values.get("name")
+            if name is not None:
+                self.add_name(element, name)
+            children = element._children
+            if children:
+                stack.extend(reversed(children))
+
+    def add_name(self, element, name):
+        elements = self.by_name.get(name)
+        if elements is None:
+            self.by_name[name] = [element]
+        else:
+            elements.append(element)
+
+    def remove_name(self, element, name):
+        elements = self.by_name.get(name)
+        if elements is not None:
+            # Names are mostly unique, the list is short
+            for i, named in enumerate(elements):
+                if named is element:
+                    del elements[i]
+                    break
+            if not elements:
+                del self.by_name[name]
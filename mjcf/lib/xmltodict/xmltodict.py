@@ -391,6 +391,10 @@ def _process_namespace(name, namespaces, ns_sep=':', attr_prefix='@'):
     return name
 
 
+# Kinds of _emit stack entries
+_EMIT_KEY, _EMIT_ITEM, _EMIT_END = range(3)
+
+
 def _emit(key, value, content_handler,
           attr_prefix='@',
           cdata_key='#text',
@@ -403,19 +407,47 @@ def _emit(key, value, content_handler,
           namespaces=None,
           full_document=True,
           ordered_mixed_children=False):
-    key = _process_namespace(key, namespaces, namespace_separator, attr_prefix)
-    if preprocessor is not None:
-        result = preprocessor(key, value)
-        if result is None:
-            return
-        key, value = result
-    if (not hasattr(value, '__iter__')
-            or isinstance(value, _basestring)
-            or isinstance(value, dict)):
-        value = [value]
-    for index, v in enumerate(value):
-        if full_document and depth == 0 and index > 0:
-            raise ValueError('document with multiple roots')
+    # Walks the dict with an explicit stack rather than recursing once per
+    # level, so deeply nested documents don't hit the recursion limit. Each
+    # entry is (kind, key, value, depth), see _EMIT_KEY and co.
+    stack = [(_EMIT_KEY, key, value, depth)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        kind, key, value, depth = pop()
+
+        if kind == _EMIT_END:
+            cdata, children = value
+            if cdata is not None:
+                content_handler.characters(cdata)
+            if pretty and children:
+                content_handler.ignorableWhitespace(depth * indent)
+            content_handler.endElement(key)
+            if pretty and depth:
+                content_handler.ignorableWhitespace(newl)
+            continue
+
+        if kind == _EMIT_KEY:
+            key = _process_namespace(key, namespaces, namespace_separator,
+                                     attr_prefix)
+            if preprocessor is not None:
+                result = preprocessor(key, value)
+                if result is None:
+                    continue
+                key, value = result
+            if (not hasattr(value, '__iter__')
+                    or isinstance(value, _basestring)
+                    or isinstance(value, dict)):
+                value = [value]
+            value = list(value)
+            if full_document and depth == 0 and len(value) > 1:
+                raise ValueError('document with multiple roots')
+            # Pushed in reverse to emit the items in order
+            for v in reversed(value):
+                push((_EMIT_ITEM, key, v, depth))
+            continue
+
+        v = value
         if v is None:
             v = OrderedDict()
         elif not isinstance(v, dict):
@@ -455,8 +487,17 @@ def _emit(key, value, content_handler,
                         lift_list.append((child_key, val))
                 else:
                     lift_list.append((child_key, child_value))
-            children = sorted(
-                lift_list, key=lambda x: get_child_order_key(x, order_key))
+            # Children built in document order (e.g. by Element._to_dict) are
+            # already sorted, only pay for a sort when they are not.
+            order_keys = [get_child_order_key(x, order_key) for x in lift_list]
+            in_order = all(a <= b for a, b in zip(order_keys, order_keys[1:]))
+            if in_order:
+                children = lift_list
+            else:
+                children = [
+                    child for _, child in sorted(
+                        zip(order_keys, lift_list), key=lambda x: x[0])
+                ]
 
         if pretty:
             content_handler.ignorableWhitespace(depth * indent)
@@ -469,29 +510,22 @@ def _emit(key, value, content_handler,
         content_handler.startElement(key, AttributesImpl(attrs))
         if pretty and children:
             content_handler.ignorableWhitespace(newl)
-        for child_key, child_value in children:
-            _emit(child_key, child_value, content_handler,
-                  attr_prefix, cdata_key, depth+1, preprocessor,
-                  pretty, newl, indent, namespaces=namespaces,
-                  namespace_separator=namespace_separator,
-                  ordered_mixed_children=ordered_mixed_children)
-        if cdata is not None:
-            content_handler.characters(cdata)
-        if pretty and children:
-            content_handler.ignorableWhitespace(depth * indent)
-        content_handler.endElement(key)
-        if pretty and depth:
-            content_handler.ignorableWhitespace(newl)
+        push((_EMIT_END, key, (cdata, bool(children)), depth))
+        for child_key, child_value in reversed(children):
+            push((_EMIT_KEY, child_key, child_value, depth + 1))
 
 
 def get_child_order_key(item, order_key):
     """
     Get the order key for a child element, default to infinity (stable last).
+
+    The key is only read, the child's own _emit drops it from the output, so
+    unparsing the same dict twice gives the same document.
     """
     infinity = float('inf')
     item_key, item_value = item
     if isinstance(item_value, dict):
-        return item_value.pop(order_key, infinity)
+        return item_value.get(order_key, infinity)
     else:
         return infinity
 
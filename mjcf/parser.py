@@ -0,0 +1,160 @@
+"""
+MJCF xml -> Element tree loading
+"""
+import os
+from io import BytesIO
+
+from mjcf.compression import detect_compression, open_decompressor
+from mjcf.element import Element
+
+# tag -> element class, and (parent tag, tag) -> element class for the tags
+# whose meaning depends on where they appear. Built on first use.
+_TAG_CLASSES = {}
+_NESTED_TAG_CLASSES = {}
+
+
+def _get_element_classes(module):
+    return [
+        obj for obj in vars(module).values()
+        if isinstance(obj, type)
+        and issubclass(obj, Element)
+        and obj.__module__ == module.__name__
+    ]
+
+
+def _build_tag_tables():
+    from mjcf.elements import (
+        elements, visual, equality, fixed, sensor, spatial
+    )
+
+    for cls in _get_element_classes(elements):
+        _TAG_CLASSES[cls.__name__.lower()] = cls
+
+    namespaces = {
+        "visual": visual,
+        "equality": equality,
+        "fixed": fixed,
+        "sensor": sensor,
+        "spatial": spatial,
+    }
+    for parent_tag, module in namespaces.items():
+        for cls in _get_element_classes(module):
+            _NESTED_TAG_CLASSES[(parent_tag, cls.__name__.lower())] = cls
+
+
+def get_element_class(tag, parent_tag=None):
+    """
+    Returns the element class for an xml tag found inside `parent_tag`,
+    e.g. ("joint", "fixed") -> mjcf.elements.fixed.Joint
+    """
+    if not _TAG_CLASSES:
+        _build_tag_tables()
+
+    cls = _NESTED_TAG_CLASSES.get((parent_tag, tag))
+    if cls is None:
+        cls = _TAG_CLASSES.get(tag)
+    if cls is None:
+        raise ValueError("Unknown MJCF element <{}>".format(tag))
+
+    return cls
+
+
+class _TreeBuilder(object):
+    """
+    expat handlers building the Element tree as the document streams in.
+
+    Elements are created without calling their constructors, so required
+    attributes may be left out (as they are inside <default>) and every
+    attribute read from the file is kept in the output, default or not.
+    Attribute values are kept as the strings found in the file.
+    """
+
+    def __init__(self, parser):
+        self.parser = parser
+        self.root = None
+        self.stack = []
+        self.tags = []
+
+    def start_element(self, tag, attributes):
+        parent_tag = self.tags[-1] if self.tags else None
+        try:
+            cls = get_element_class(tag, parent_tag)
+            element = cls.__new__(cls)
+            Element.__init__(element)
+            # ordered_attributes gives a flat [name, value, ...] list
+            for i in range(0, len(attributes), 2):
+                name = attributes[i]
+                if name == "class":
+                    name = "class_"
+                setattr(element, name, attributes[i + 1])
+        except (ValueError, AttributeError) as e:
+            raise ValueError("line {}: {}".format(
+                self.parser.CurrentLineNumber,
+                e
+            ))
+
+        if self.stack:
+            self.stack[-1].add_child(element)
+        else:
+            self.root = element
+        self.stack.append(element)
+        self.tags.append(tag)
+
+    def end_element(self, tag):
+        self.stack.pop()
+        self.tags.pop()
+
+
+def _get_parser(encoding=None):
+    # Same expat the xmltodict lib uses, imported on first load. An encoding
+    # given here overrides the one the document declares.
+    from mjcf.lib.xmltodict import expat
+    parser = expat.ParserCreate(encoding)
+    parser.ordered_attributes = True
+    parser.buffer_text = True
+    # Like xmltodict, don't expand entities
+    parser.DefaultHandler = lambda x: None
+    parser.ExternalEntityRefHandler = lambda *x: 1
+    builder = _TreeBuilder(parser)
+    parser.StartElementHandler = builder.start_element
+    parser.EndElementHandler = builder.end_element
+    return parser, builder
+
+
+def load(file):
+    """
+    Loads an MJCF xml document into a tree of mjcf.elements objects and
+    returns its root element.
+
+    `file` is either a path or a binary file-like object. The document is
+    parsed as it is read, without loading it into memory first. gzip and
+    zstd compressed documents are decompressed on the fly, zstd needs the
+    zstandard package.
+    """
+    parser, builder = _get_parser()
+    if isinstance(file, (str, bytes, os.PathLike)):
+        with open(file, "rb") as fh:
+            parser.ParseFile(open_decompressor(fh))
+    else:
+        parser.ParseFile(open_decompressor(file))
+
+    return builder.root
+
+
+def loads(string):
+    """
+    Loads an MJCF xml document from a string, or bytes that may be
+    compressed, see load()
+    """
+    if isinstance(string, bytes) and detect_compression(string[:4]):
+        return load(BytesIO(string))
+
+    if isinstance(string, str):
+        # Already decoded, whatever encoding the document declares
+        parser, builder = _get_parser("utf-8")
+        string = string.encode("utf-8")
+    else:
+        parser, builder = _get_parser()
+    parser.Parse(string, True)
+
+    return builder.root
@@ -0,0 +1,263 @@
+"""
+Names defined by elements and the references between them
+"""
+
+# Element attributes naming an element of the kind given by the element's
+# objtype attribute rather than of a fixed kind
+OBJTYPE = "objtype"
+
+# Namespaces of the objtype values that differ from their namespace name
+_OBJTYPE_NAMESPACES = {"xbody": "body"}
+
+# Element class -> (attribute, namespace) defining a name. Names are unique
+# within their namespace, e.g. a joint and a geom may share a name.
+_DEFINITIONS = {
+    "elements.Default": ("class_", "class"),
+    "elements.Numeric": ("name", "numeric"),
+    "elements.Text": ("name", "text"),
+    "elements.Tuple": ("name", "tuple"),
+    "elements.Texture": ("name", "texture"),
+    "elements.Hfield": ("name", "hfield"),
+    "elements.Mesh": ("name", "mesh"),
+    "elements.Material": ("name", "material"),
+    "elements.Body": ("name", "body"),
+    "elements.Joint": ("name", "joint"),
+    "elements.Freejoint": ("name", "joint"),
+    "elements.Geom": ("name", "geom"),
+    "elements.Site": ("name", "site"),
+    "elements.Camera": ("name", "camera"),
+    "elements.Light": ("name", "light"),
+    "elements.Spatial": ("name", "tendon"),
+    "elements.Fixed": ("name", "tendon"),
+    "elements.General": ("name", "actuator"),
+    "elements.Motor": ("name", "actuator"),
+    "elements.Position": ("name", "actuator"),
+    "elements.Velocity": ("name", "actuator"),
+    "elements.Cylinder": ("name", "actuator"),
+    "elements.Muscle": ("name", "actuator"),
+}
+
+_ACTUATOR_REFERENCES = {
+    "cranksite": "site",
+    "joint": "joint",
+    "jointinparent": "joint",
+    "site": "site",
+    "slidersite": "site",
+    "tendon": "tendon",
+}
+
+# Element class -> {attribute: namespace of the element it names}. Classes
+# with a class_ or childclass attribute also reference a default class.
+_REFERENCES = {
+    "elements.Tupleelement": {"objname": OBJTYPE},
+    "elements.Material": {"texture": "texture"},
+    "elements.Geom": {"hfield": "hfield", "material": "material",
+                      "mesh": "mesh"},
+    "elements.Site": {"material": "material"},
+    "elements.Camera": {"target": "body"},
+    "elements.Light": {"target": "body"},
+    "elements.Pair": {"geom1": "geom", "geom2": "geom"},
+    "elements.Exclude": {"body1": "body", "body2": "body"},
+    "elements.Spatial": {"material": "material"},
+    "elements.General": _ACTUATOR_REFERENCES,
+    "elements.Motor": _ACTUATOR_REFERENCES,
+    "elements.Position": _ACTUATOR_REFERENCES,
+    "elements.Velocity": _ACTUATOR_REFERENCES,
+    "elements.Cylinder": _ACTUATOR_REFERENCES,
+    "equality.Connect": {"body1": "body", "body2": "body"},
+    "equality.Weld": {"body1": "body", "body2": "body"},
+    "equality.Joint": {"joint1": "joint", "joint2": "joint"},
+    "equality.Tendon": {"tendon1": "tendon", "tendon2": "tendon"},
+    "equality.Distance": {"geom1": "geom", "geom2": "geom"},
+    "fixed.Joint": {"joint": "joint"},
+    "spatial.Site": {"site": "site"},
+    "spatial.Geom": {"geom": "geom", "sidesite": "site"},
+}
+
+_SENSOR_REFERENCES = {
+    "site": ["Touch", "Accelerometer", "Velocimeter", "Gyro", "Force",
+             "Torque", "Magnetometer", "Rangefinder"],
+    "joint": ["Jointpos", "Jointvel", "Ballquat", "Ballangvel"],
+    "tendon": ["Tendonpos", "Tendonvel"],
+    "actuator": ["Actuatorpos", "Actuatorvel", "Actuatorfrc"],
+    "body": ["Subtreecom", "Subtreelinvel", "Subtreeangmom"],
+}
+for _attr, _classes in _SENSOR_REFERENCES.items():
+    for _cls in _classes:
+        _DEFINITIONS["sensor." + _cls] = ("name", "sensor")
+        _REFERENCES["sensor." + _cls] = {_attr: _attr}
+for _cls in ["Framepos", "Framequat", "Framexaxis", "Frameyaxis",
+             "Framezaxis", "Framelinvel", "Frameangvel", "Framelinacc",
+             "Frameangacc", "User"]:
+    _DEFINITIONS["sensor." + _cls] = ("name", "sensor")
+    _REFERENCES["sensor." + _cls] = {"objname": OBJTYPE}
+for _cls in ["Connect", "Weld", "Joint", "Tendon", "Distance"]:
+    _DEFINITIONS["equality." + _cls] = ("name", "equality")
+
+# Names that exist without being defined by an element
+_IMPLICIT_NAMES = frozenset([("class", "main"), ("body", "world")])
+
+# Element class -> (definition, references), resolved on first use
+_CLASS_REFERENCES = {}
+
+
+def get_class_references(cls):
+    """
+    Returns ((attribute, namespace) or None, {attribute: namespace}), the
+    name an element of class `cls` defines and the names it references
+    """
+    try:
+        return _CLASS_REFERENCES[cls]
+    except KeyError:
+        pass
+    key = "{}.{}".format(
+        cls.__module__.replace("mjcf.elements.", "", 1),
+        cls.__name__
+    )
+    definition = _DEFINITIONS.get(key)
+    references = dict(_REFERENCES.get(key, {}))
+    if "class_" in cls._attribute_set and key != "elements.Default":
+        references["class_"] = "class"
+    if "childclass" in cls._attribute_set:
+        references["childclass"] = "class"
+    info = _CLASS_REFERENCES[cls] = (definition, references)
+    return info
+
+
+def get_namespace(values, namespace):
+    """
+    Returns the namespace of a reference, given the attribute values of the
+    element making it
+    """
+    if namespace is OBJTYPE:
+        objtype = values.get("objtype")
+        return _OBJTYPE_NAMESPACES.get(objtype, objtype)
+    return namespace
+
+
+def _get_tag(element):
+    # ElementTables stand for their rows
+    cls = getattr(element, "_element_class", element.__class__)
+    return cls.__name__.lower()
+
+
+class ReferenceIndex(object):
+    """
+    Every named element of a tree, built in a single walk.
+
+    `elements` maps (namespace, name) to the element defining the name, e.g.
+    ("joint", "hip_1"). `references` lists the (element, attribute,
+    namespace, name) of every reference to a name and `duplicates` the
+    (element, namespace, name) of names defined more than once.
+
+    Rows of an ElementTable are represented by the table.
+    """
+
+    def __init__(self, root):
+        self.elements = {}
+        self.references = []
+        self.duplicates = []
+        self._add_tree(root)
+
+    def _add_tree(self, root):
+        from mjcf.element_table import ElementTable
+
+        elements = self.elements
+        class_references = _CLASS_REFERENCES
+        stack = [root]
+        pop = stack.pop
+        push = stack.extend
+        while stack:
+            element = pop()
+            cls = element.__class__
+            if cls is ElementTable:
+                for values in element._iter_values():
+                    self._add(element, element._element_class, values)
+                continue
+            try:
+                definition, references = class_references[cls]
+            except KeyError:
+                definition, references = get_class_references(cls)
+            if definition is not None or references:
+                values = element._values
+                if definition is not None:
+                    name = values.get(definition[0])
+                    if name is not None:
+                        key = (definition[1], name)
+                        if key in elements:
+                            self.duplicates.append((element,) + key)
+                        else:
+                            elements[key] = element
+                if references and not references.keys().isdisjoint(values):
+                    self._add_references(element, references, values)
+            children = element._children
+            if children:
+                push(reversed(children))
+
+    def _add(self, element, cls, values):
+        definition, references = get_class_references(cls)
+        if definition is not None:
+            attr, namespace = definition
+            name = values.get(attr)
+            if name is not None:
+                key = (namespace, name)
+                if key in self.elements:
+                    self.duplicates.append((element, namespace, name))
+                else:
+                    self.elements[key] = element
+        if references:
+            self._add_references(element, references, values)
+
+    def _add_references(self, element, references, values):
+        for attr, namespace in references.items():
+            name = values.get(attr)
+            if name is None:
+                continue
+            namespace = get_namespace(values, namespace)
+            # Missing objtypes are for the validator to report
+            if namespace is not None:
+                self.references.append((element, attr, namespace, name))
+
+    def get(self, namespace, name, default=None):
+        """
+        Returns the element defining `name` in `namespace`
+        """
+        return self.elements.get((namespace, name), default)
+
+    def __contains__(self, key):
+        return key in self.elements or key in _IMPLICIT_NAMES
+
+    def get_dangling(self):
+        """
+        Returns the (element, attribute, namespace, name) of every reference
+        to a name that isn't defined
+        """
+        elements = self.elements
+        return [
+            reference for reference in self.references
+            if (reference[2], reference[3]) not in elements
+            and (reference[2], reference[3]) not in _IMPLICIT_NAMES
+        ]
+
+    def get_errors(self):
+        """
+        Returns a message for every duplicate name and dangling reference
+        """
+        errors = [
+            "<{}> {} '{}' is defined more than once".format(
+                _get_tag(element),
+                namespace,
+                name
+            )
+            for element, namespace, name in self.duplicates
+        ]
+        errors.extend(
+            "<{}> {}: {} '{}' is not defined".format(
+                _get_tag(element),
+                "class" if attr == "class_" else attr,
+                namespace,
+                name
+            )
+            for element, attr, namespace, name in self.get_dangling()
+        )
+        return errors
@@ -1,9 +1,198 @@
 import functools
+import re
+import struct
 
 
 def capture_kwargs(f):
+    """
+    Decorates element constructors so that attribute values passed as keyword
+    arguments are kept even when they are equal to the default value.
+    """
     @functools.wraps(f)
     def wrapper(self, *args, **kwargs):
-        self.call_kwargs = kwargs
         f(self, *args, **kwargs)
+        self._drop_default_values(kwargs)
     return wrapper
+
+
+def _format_scalar(value, float_precision=None):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if float_precision is not None and isinstance(value, float):
+        return "%.*g" % (float_precision, value)
+    return str(value)
+
+
+# Element types are part of the key as 1, 1.0 and True compare equal but
+# format differently. So do 0.0 and -0.0, vectors of floats holding zeros
+# add the bytes of their elements as doubles to the key.
+@functools.lru_cache(maxsize=4096)
+def _format_vector(values, types, float_precision, signs=None):
+    if tuple in types:
+        return _format_nested(values, float_precision)
+    if float_precision is None and bool not in types:
+        return " ".join(map(str, values))
+    return " ".join([_format_scalar(v, float_precision) for v in values])
+
+
+# Vector length -> function packing that many doubles into bytes
+_PACKERS = {}
+
+
+def _get_packer(count):
+    pack = _PACKERS[count] = struct.Struct("{}d".format(count)).pack
+    return pack
+
+
+def _format_nested(values, float_precision):
+    # Vectors of vectors are written out flat
+    return " ".join([format_value(v, float_precision) for v in values])
+
+
+def to_python(value):
+    """
+    Returns a numpy array or scalar as Python values, with a single
+    tolist() call. Floats of less than double precision, like float32,
+    become the Python floats they print as: 0.1 rather than
+    0.10000000149011612.
+    """
+    dtype = value.dtype
+    if dtype.kind == "f" and dtype.itemsize < 8:
+        value = value.astype(str).astype(float)
+    return value.tolist()
+
+
+def format_value(value, float_precision=None):
+    """
+    Returns `value` formatted as an MJCF attribute string.
+
+    Lists, tuples and 1-d numpy arrays become space separated vectors and
+    booleans are lowercased. Floats are written with the shortest repr that
+    round trips, or with `float_precision` significant digits when given.
+    Nested vectors are written out flat. Recently formatted vectors are
+    served from a cache.
+    """
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if value_type is list or value_type is tuple:
+        values = tuple(value)
+        types = tuple(map(type, values))
+        signs = None
+        if float in types and 0.0 in values:
+            # The bytes of the doubles tell 0.0 and -0.0 apart
+            pack = _PACKERS.get(len(values)) or _get_packer(len(values))
+            try:
+                signs = pack(*values)
+            except (struct.error, TypeError):
+                return _format_vector.__wrapped__(values, types,
+                                                  float_precision)
+        try:
+            return _format_vector(values, types, float_precision, signs)
+        except TypeError:
+            # Unhashable values, like lists or numpy arrays
+            return _format_nested(values, float_precision)
+    if value_type is float and float_precision is None:
+        return repr(value)
+    if value_type is int:
+        return str(value)
+    # numpy arrays and scalars
+    if hasattr(value, "tolist"):
+        return format_value(to_python(value), float_precision)
+    return _format_scalar(value, float_precision)
+
+
+def _shorten_number(token):
+    # repr() gives the fewest significant digits, drop the other characters
+    # MuJoCo doesn't need: "1.0" -> "1", "0.5" -> ".5", "1e-05" -> "1e-5"
+    if token[-1] not in _DIGITS:
+        return token
+    if token.endswith(".0"):
+        token = token[:-2]
+    if "e" in token:
+        mantissa, _, exponent = token.partition("e")
+        token = mantissa + "e" + str(int(exponent))
+    if token.startswith("0."):
+        token = token[1:]
+    elif token.startswith("-0."):
+        token = "-" + token[2:]
+    return token
+
+
+_DIGITS = frozenset("0123456789")
+
+
+@functools.lru_cache(maxsize=4096)
+def shorten_numbers(text):
+    """
+    Returns the numbers of the formatted `text` written as short as they can
+    be, see format_compact()
+    """
+    return " ".join([_shorten_number(token) for token in text.split()])
+
+
+def format_compact(value, float_precision=None):
+    """
+    Returns format_value() of `value` with its numbers written as short as
+    they can be, e.g. "0 .5 1" rather than "0.0 0.5 1.0". Strings are kept
+    as they are.
+    """
+    if type(value) is str:
+        return value
+    text = format_value(value, float_precision)
+    return shorten_numbers(text) if text else text
+
+
+def format_compact_values(values, float_precision=None):
+    """
+    Returns format_compact() of each of `values`, see format_values()
+    """
+    return [
+        text if text is None or not text or type(value) is str
+        else shorten_numbers(text)
+        for value, text in zip(values, format_values(values, float_precision))
+    ]
+
+
+_needs_escaping = re.compile('["&<>\n\r\t]').search
+_needs_formatting = re.compile(r"[TF\[(]").search
+
+
+def quote_attribute(value):
+    """
+    Returns `value` quoted for use as an XML attribute value, only taking the
+    slow escaping path for strings that need it.
+    """
+    if _needs_escaping(value):
+        # saxutils pulls in urllib and http.client, only import it when needed
+        from xml.sax.saxutils import quoteattr
+        return quoteattr(value)
+    return '"' + value + '"'
+
+
+def format_values(values, float_precision=None):
+    """
+    Returns format_value() of each of `values`, e.g. a column of vectors
+    converted from a numpy array, without going through the vector cache.
+    None values are kept as None.
+    """
+    if float_precision is not None:
+        return [
+            None if v is None else format_value(v, float_precision)
+            for v in values
+        ]
+    formatted = []
+    append = formatted.append
+    for value in values:
+        if type(value) is list:
+            text = " ".join(map(str, value))
+            # Booleans need lowercasing and nested vectors flattening,
+            # numbers never contain these
+            if _needs_formatting(text):
+                text = format_value(value)
+            append(text)
+        elif value is None:
+            append(None)
+        else:
+            append(format_value(value))
+    return formatted
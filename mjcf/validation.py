@@ -0,0 +1,366 @@
+"""
+Checks attribute values against the attribute specs of their elements
+"""
+from mjcf.element import Element, describe
+from mjcf.references import ReferenceIndex
+from mjcf.utils import format_value
+
+# Vector attributes MuJoCo accepts with fewer values than their size,
+# filling in the rest
+_PARTIAL_VECTORS = frozenset([
+    "biasprm", "dynprm", "friction", "gainprm", "gear", "solimp", "size",
+])
+
+# Per element class: {attribute name: check}, built on first use. A check
+# takes an attribute value and returns an error message, or None when the
+# value is valid. Python values of the expected type pass without being
+# formatted, anything else is checked as it will be written to xml.
+_VALIDATORS = {}
+
+# Per element class: {attribute name: (test, names)}, an expression for
+# compiled validators true when the value is valid, with `{v}` standing for
+# the value, and the objects it uses by name. Values of the expected Python
+# type pass without calling their check.
+_TESTS = {}
+
+# Outside and inside <default>: {(element class, attribute names in
+# order): compiled validator}. A compiled validator takes an element's
+# values and returns whether the element is valid, it's None when there is
+# nothing to check. Elements it fails are checked again one value at a time
+# to report their errors. Only a few sets of attributes are
+# usual for each class, the caches stop growing at _MAX_COMPILED all the
+# same.
+_COMPILED = {False: {}, True: {}}
+_MAX_COMPILED = 4096
+
+_INTEGER_TYPES = frozenset([int])
+_NUMBER_TYPES = frozenset([int, float])
+
+
+class ValidationError(ValueError):
+    """
+    Raised by validate(), `errors` lists every problem found
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__("\n".join(errors))
+
+
+def _check_options(options):
+    valid = frozenset(options)
+    message = "must be one of " + ", ".join(options)
+
+    def check(value):
+        if type(value) is not str:
+            value = format_value(value)
+        if value not in valid:
+            return message
+    return check
+
+
+def _check_bool(value):
+    if value is True or value is False:
+        return None
+    text = format_value(value)
+    if text != "true" and text != "false":
+        return "must be true or false"
+
+
+def _check_numbers(convert, size, exact):
+    kind = "an integer" if convert is int else "a number"
+    types = _INTEGER_TYPES if convert is int else _NUMBER_TYPES
+
+    def check_text(text):
+        parts = text.split()
+        if not parts:
+            return "must be " + kind
+        if size is not None and (
+            len(parts) > size or (exact and len(parts) != size)
+        ):
+            return "must have {} values, got {}".format(size, len(parts))
+        try:
+            for part in parts:
+                convert(part)
+        except ValueError:
+            return "'{}' is not {}".format(part, kind)
+
+    if size == 1:
+        def check(value):
+            if type(value) in types:
+                return None
+            return check_text(format_value(value))
+        return check
+
+    # A single number is a valid vector unless an exact count is needed
+    scalar_types = types if size is None or not exact else frozenset()
+
+    def check(value):
+        value_type = type(value)
+        if value_type is list or value_type is tuple:
+            count = len(value)
+            if count and (
+                size is None or count == size or (not exact and count < size)
+            ):
+                # A plain loop, cheaper than set operations on short vectors
+                for item in value:
+                    if type(item) not in types:
+                        break
+                else:
+                    return None
+        elif value_type in scalar_types:
+            return None
+        return check_text(format_value(value))
+    return check
+
+
+def _compile_check(spec):
+    """
+    Returns the check of the attribute described by `spec`, None if any
+    value goes
+    """
+    if spec.options:
+        return _check_options(spec.options)
+    if spec.type == "bool":
+        return _check_bool
+    if spec.type in ("int", "float"):
+        return _check_numbers(int if spec.type == "int" else float, 1, True)
+    if spec.type in ("List[int]", "List[float]"):
+        return _check_numbers(
+            int if spec.type == "List[int]" else float,
+            spec.size,
+            spec.name not in _PARTIAL_VECTORS
+        )
+    return None
+
+
+def _compile_test(spec, check):
+    """
+    Returns (test, names) for an attribute, see _TESTS. Values of the
+    expected Python type are tested inline, anything else calls `check`.
+    """
+    name = spec.name
+    check_name = "check_" + name
+    names = {check_name: check}
+    test = None
+    if spec.options:
+        options = "options_" + name
+        names[options] = frozenset(spec.options)
+        test = "{v}.__class__ is str and {v} in " + options
+    elif spec.type == "bool":
+        test = "{v} is True or {v} is False"
+    elif spec.type in ("int", "List[int]") and spec.size in (None, 1):
+        test = "{v}.__class__ is int"
+    elif spec.type in ("float", "List[float]") and spec.size in (None, 1):
+        test = "{v}.__class__ is float or {v}.__class__ is int"
+    elif (spec.type in ("List[int]", "List[float]") and spec.size
+            and name not in _PARTIAL_VECTORS):
+        types = "types_" + name
+        names[types] = (
+            _INTEGER_TYPES if spec.type == "List[int]" else _NUMBER_TYPES
+        )
+        test = "({{v}}.__class__ is list or {{v}}.__class__ is tuple) and " \
+               "len({{v}}) == {} and {}".format(spec.size, " and ".join(
+                   "{{v}}[{}].__class__ in {}".format(i, types)
+                   for i in range(spec.size)
+               ))
+    if test is None:
+        return check_name + "({v}) is None", names
+    return "(" + test + ") or " + check_name + "({v}) is None", names
+
+
+def _compile_validator(cls, names, in_default):
+    """
+    Returns the compiled validator of elements of class `cls` setting the
+    attributes `names`, in order, see _COMPILED
+    """
+    checks, required = get_validators(cls)
+    if required and not in_default and not set(required).issubset(names):
+        # Always reported
+        return _invalid
+    tests = _TESTS[cls]
+    namespace = {}
+    variables = []
+    conditions = []
+    for i, name in enumerate(names):
+        test = tests.get(name)
+        if test is None:
+            variables.append("_")
+            continue
+        variable = "v{}".format(i)
+        variables.append(variable)
+        expression, test_names = test
+        conditions.append("(" + expression.format(v=variable) + ")")
+        namespace.update(test_names)
+    if not conditions:
+        return None
+    source = "def validate(values):\n    {}, = values.values()\n" \
+             "    return {}\n".format(", ".join(variables),
+                                      " and ".join(conditions))
+    exec(source, namespace)
+    return namespace["validate"]
+
+
+def _invalid(values):
+    return False
+
+
+def get_validators(cls):
+    """
+    Returns ({attribute name: check}, required attribute names) for an
+    element class, compiled from its attribute specs the first time
+    """
+    try:
+        return _VALIDATORS[cls]
+    except KeyError:
+        pass
+    checks = {}
+    tests = {}
+    required = []
+    for spec in cls.get_attribute_specs():
+        check = _compile_check(spec)
+        if check is not None:
+            checks[spec.name] = check
+            tests[spec.name] = _compile_test(spec, check)
+        if spec.required:
+            required.append(spec.name)
+    _TESTS[cls] = tests
+    validators = _VALIDATORS[cls] = (checks, tuple(required))
+    return validators
+
+
+def _get_value_errors(element, values):
+    errors = []
+    checks, required = get_validators(element.__class__)
+    for attr, value in values.items():
+        check = checks.get(attr)
+        if check is None:
+            continue
+        message = check(value)
+        if message is not None:
+            errors.append("{} {}: {}".format(
+                describe(element),
+                "class" if attr == "class_" else attr,
+                message
+            ))
+    return errors, required
+
+
+def get_errors(root, references=False):
+    """
+    Returns a message for every invalid attribute value and every missing
+    required attribute in the tree under `root`, in a single walk.
+
+    Values are checked as they will be written, so "true" and True are both
+    valid booleans. Required attributes may be left out under <default>.
+
+    With `references`, duplicate names and references to names that aren't
+    defined in the tree are reported too, see ReferenceIndex. That takes
+    about as long again, so it's left to complete models.
+    """
+    errors = []
+    _add_errors(root, errors, in_default=False)
+    if references:
+        errors.extend(ReferenceIndex(root).get_errors())
+    return errors
+
+
+def _add_errors(root, errors, in_default):
+    """
+    Adds the errors of the tree under `root` to `errors`, <default> subtrees
+    are checked after the rest of the tree
+    """
+    from mjcf.element_table import ElementTable
+    from mjcf.elements import Default
+
+    defaults = []
+    compiled = _COMPILED[in_default]
+    stack = [root]
+    pop = stack.pop
+    push = stack.extend
+    while stack:
+        element = pop()
+        cls = element.__class__
+        if cls is ElementTable:
+            errors.extend(_get_table_errors(element))
+            continue
+
+        values = element._values
+        key = (cls, *values)
+        try:
+            validator = compiled[key]
+        except KeyError:
+            validator = _compile_validator(cls, key[1:], in_default)
+            if len(compiled) < _MAX_COMPILED:
+                compiled[key] = validator
+        if validator is not None and not validator(values):
+            _add_element_errors(element, errors, in_default)
+
+        children = element._children
+        if not children:
+            continue
+        if cls is Default and not in_default:
+            defaults.extend(children)
+        else:
+            # Pushed in reverse to report errors in xml order
+            push(reversed(children))
+
+    for default in defaults:
+        _add_errors(default, errors, in_default=True)
+
+
+def _add_element_errors(element, errors, in_default):
+    """
+    Adds the errors of `element` alone to `errors`, checking its values one
+    by one
+    """
+    checks, required = get_validators(element.__class__)
+    values = element._values
+    for attr, value in values.items():
+        check = checks.get(attr)
+        if check is not None and check(value) is not None:
+            errors.extend(_get_value_errors(element, {attr: value})[0])
+    if required and not in_default:
+        for attr in required:
+            if attr not in values:
+                errors.append("{} is missing required attribute {}".format(
+                    describe(element),
+                    attr
+                ))
+
+
+def _get_table_errors(table):
+    """
+    Checks each row of an ElementTable, constants only once
+    """
+    cls = table._element_class
+    row = cls.__new__(cls)
+    Element.__init__(row)
+    errors, required = _get_value_errors(row, table._constants)
+    missing = [
+        attr for attr in required
+        if attr not in table._constants and attr not in table._names
+    ]
+    for attr in missing:
+        errors.append("{} rows are missing required attribute {}".format(
+            describe(row),
+            attr
+        ))
+    for values in zip(*table._columns):
+        row._values = {
+            attr: value
+            for attr, value in zip(table._names, values)
+            if value is not None
+        }
+        errors.extend(_get_value_errors(row, row._values)[0])
+    return errors
+
+
+def validate(root, references=False):
+    """
+    Raises a ValidationError listing every problem get_errors() finds in the
+    tree under `root`
+    """
+    errors = get_errors(root, references)
+    if errors:
+        raise ValidationError(errors)
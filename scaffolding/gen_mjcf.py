@@ -128,9 +128,26 @@ class MJScraper(object):
 
         return attr_type, attr_default
 
+    @staticmethod
+    def get_size_options(mjcf_type):
+        """
+        Returns the number of values of a vector type like 'real(3)', and
+        the valid strings of a keyword type like ['local', 'global']
+        """
+        if isinstance(mjcf_type, list):
+            if mjcf_type == ['false', 'true']:
+                return None, None
+            return None, mjcf_type
+        if mjcf_type and mjcf_type.endswith(")") and "(" in mjcf_type:
+            size = mjcf_type[mjcf_type.find("(") + 1:-1]
+            if size.isdigit():
+                return int(size), None
+        return None, None
+
     def _get_type_default(self, dl_item_text):
         """
-        Splits a 'detail' string into the type and default parts
+        Splits a 'detail' string into the type and default parts, also
+        returns the MJCF type as found in the docs
         """
 
         # Separate attr names from attr details
@@ -138,7 +155,7 @@ class MJScraper(object):
         if len(parts) > 1:
             detail = parts[1]
         else:
-            return None, None, 3
+            return None, None, 3, None
 
         # Handle lists of valid strings
         if "[" in detail and "]" in detail:
@@ -165,12 +182,13 @@ class MJScraper(object):
             attr_default = None
 
         # Modify defaults based on type
+        mjcf_type = attr_type
         attr_type, attr_default = self._pythonify_type_and_default(
             attr_type,
             attr_default
         )
 
-        return attr_type, attr_default, required
+        return attr_type, attr_default, required, mjcf_type
 
     def _get_names(self, name_node_text):
         parts = name_node_text.split(":")
@@ -253,7 +271,8 @@ class MJScraper(object):
                 # Make sure we're dealing with an attribute name line
                 if attr_name_node:
                     attr_names = self._get_names(attr_name_node.text)
-                    attr_type, attr_default, attr_required = self._get_type_default(dl_item.text)
+                    attr_type, attr_default, attr_required, mjcf_type = self._get_type_default(dl_item.text)
+                    attr_size, attr_options = self.get_size_options(mjcf_type)
                     attr_desc = dl_item.findNext("dd").text.strip()
 
                     for attr_name in attr_names:
@@ -267,6 +286,8 @@ class MJScraper(object):
                             attr_desc
                         )
                         attribute["required"] = attr_required
+                        attribute["size"] = attr_size
+                        attribute["options"] = attr_options
 
                         attributes.append(attribute)
 
@@ -0,0 +1,123 @@
+"""
+Writes the attribute spec table, mjcf/elements/spec.py, used at runtime
+for element defaults and validation.
+
+Names, types and defaults come from the element classes, sizes and valid
+values of keyword attributes from the MuJoCo docs. Run from this directory
+after changing the element classes:
+
+    python gen_spec.py
+"""
+import importlib
+import inspect
+import os
+import sys
+from jinja2 import Environment, FileSystemLoader
+
+from gen_mjcf import MJScraper
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mjcf.element import Element  # NoQA
+
+MODULES = [
+    "elements", "visual", "equality", "fixed", "sensor", "default", "spatial"
+]
+
+# Element ids of the docs that are nested under these ids
+NAMESPACES = ["default", "equality", "spatial", "fixed", "sensor"]
+VISUAL_IDS = ["global", "quality", "headlight", "map", "scale", "rgba"]
+
+# The docs leave the solver attributes of some elements, e.g. solreflimit,
+# untyped. They take the same values as solref and solimp.
+SOLVER_TYPES = {
+    "solref": ("List[float]", 2),
+    "solimp": ("List[float]", 3),
+}
+
+
+def get_class_path(elem_id):
+    """
+    Returns the module and class name of the element documented as
+    `elem_id`, e.g. sensor-touch -> (sensor, Touch)
+    """
+    parts = elem_id.split("-")
+    if len(parts) > 1 and parts[0] in NAMESPACES:
+        return parts[0], "".join(part.title() for part in parts[1:])
+    if elem_id in VISUAL_IDS:
+        return "visual", elem_id.title()
+    return "elements", "".join(part.title() for part in parts)
+
+
+def get_type_name(annotation):
+    if isinstance(annotation, type):
+        return annotation.__name__
+    return str(annotation).replace("typing.", "")
+
+
+def get_attribute_specs(cls, documented):
+    """
+    Returns the (name, type, default, required, size, options) tuples of
+    the attributes of `cls`
+    """
+    parameters = inspect.signature(cls).parameters
+    specs = []
+    for name in cls._attribute_names:
+        parameter = parameters[name]
+        doc = documented.get(name, {})
+        required = parameter.default is inspect.Parameter.empty
+        size = doc.get("size")
+        if parameter.annotation is inspect.Parameter.empty:
+            attr_type = doc.get("type", "str")
+        elif parameter.annotation is None:
+            attr_type, size = SOLVER_TYPES.get(name[:6], ("str", None))
+        else:
+            attr_type = get_type_name(parameter.annotation)
+        specs.append((
+            name,
+            attr_type,
+            None if required else parameter.default,
+            required,
+            size,
+            tuple(doc["options"]) if doc.get("options") else None,
+        ))
+    return tuple(specs)
+
+
+def main():
+    scraper = MJScraper()
+    documented = {}
+    for elem_id, element in scraper.get_elements().items():
+        documented[get_class_path(elem_id)] = {
+            attribute["name"]: attribute
+            for attribute in element["attributes"]
+        }
+
+    specs = []
+    for module_name in MODULES:
+        module = importlib.import_module("mjcf.elements." + module_name)
+        for cls in vars(module).values():
+            if not (isinstance(cls, type) and issubclass(cls, Element)
+                    and cls.__module__ == module.__name__):
+                continue
+            key = "{}.{}".format(cls.__module__, cls.__name__)
+            attributes = get_attribute_specs(
+                cls,
+                documented.get((module_name, cls.__name__), {})
+            )
+            specs.append((key, [repr(a) for a in attributes]))
+
+    env = Environment(
+        loader=FileSystemLoader("templates"),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+    template = env.get_template("spec.j2")
+    sourcepath = os.path.join(ROOT, "mjcf", "elements", "spec.py")
+    with open(sourcepath, "w") as fh:
+        fh.write(template.render(specs=specs))
+
+
+if __name__ == '__main__':
+    main()
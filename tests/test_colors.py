@@ -0,0 +1,24 @@
+import pytest
+
+from colors import get_rgb, get_rgb_batch, viridis
+
+
+def test_get_rgb():
+    assert get_rgb(viridis, 1) == viridis[-1]
+    assert get_rgb(viridis, 0.5) == viridis[len(viridis) // 2 - 1]
+    # 0 wraps around to the last color, as it always has
+    assert get_rgb(viridis, 0) == viridis[-1]
+    assert get_rgb(viridis, 0, reverse=True) == viridis[0]
+    assert get_rgb(viridis, 1, reverse=True) == viridis[0]
+
+
+def test_get_rgb_batch():
+    np = pytest.importorskip("numpy")
+    values = np.linspace(0, 1, 101)
+    for reverse in (False, True):
+        expected = [
+            get_rgb(viridis, value, reverse=reverse)
+            for value in values.tolist()
+        ]
+        colors = get_rgb_batch("viridis", values, reverse=reverse)
+        assert colors.tolist() == expected
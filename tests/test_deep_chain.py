@@ -0,0 +1,70 @@
+"""
+Trees nested far deeper than Python's recursion limit
+"""
+import sys
+
+import mjcf
+from mjcf import elements as e
+from mjcf.lib.xmltodict import unparse
+
+DEPTH = 10000
+
+
+def get_chain(depth=DEPTH):
+    mujoco = e.Mujoco(model="chain")
+    worldbody = e.Worldbody()
+    mujoco.add_child(worldbody)
+    parent = worldbody
+    for i in range(depth):
+        body = e.Body(name="link_{}".format(i), pos=[0.1, 0, 0])
+        body.add_children([
+            e.Joint(name="joint_{}".format(i), type="hinge", axis=[0, 0, 1]),
+            e.Geom(type="capsule", fromto=[0, 0, 0, 0.1, 0, 0], size=0.02)
+        ])
+        parent.add_child(body)
+        parent = body
+    return mujoco
+
+
+def test_deeper_than_recursion_limit():
+    assert DEPTH > sys.getrecursionlimit()
+
+
+def test_xml():
+    xml = get_chain().xml()
+    assert xml.count("<body ") == DEPTH
+    assert xml.count("</body>") == DEPTH
+    compact = get_chain().xml(pretty=False)
+    assert compact.count("</body>") == DEPTH
+
+
+def test_to_dict():
+    mujoco = get_chain()
+    xml = unparse(mujoco._to_dict(), ordered_mixed_children=True,
+                  short_empty_elements=True, pretty=True)
+    assert xml.count("</body>") == DEPTH
+
+
+def test_clone():
+    copy = get_chain().clone("copy_")
+    assert copy.find(name="copy_link_{}".format(DEPTH - 1)) is not None
+    assert copy.xml().count("</body>") == DEPTH
+
+
+def test_validate():
+    mjcf.validate(get_chain())
+
+
+def test_find():
+    mujoco = get_chain()
+    last = mujoco.find(name="joint_{}".format(DEPTH - 1))
+    assert last is not None
+    assert len(mujoco.find_all(tag="body")) == DEPTH
+    assert len(mujoco.find_all("//joint", type="hinge")) == DEPTH
+    assert mujoco.find(tag="body").find(name=last.name) is last
+
+
+def test_loads():
+    xml = get_chain().xml()
+    loaded = mjcf.loads(xml)
+    assert loaded.xml() == xml
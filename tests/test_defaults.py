@@ -0,0 +1,83 @@
+import mjcf
+from mjcf import DefaultResolver, extract_defaults
+from mjcf import elements as e
+
+
+def get_model(sizes):
+    mujoco = e.Mujoco()
+    worldbody = e.Worldbody()
+    mujoco.add_child(worldbody)
+    for i, size in enumerate(sizes):
+        worldbody.add_child(e.Geom(name="geom_{}".format(i), size=size))
+    return mujoco
+
+
+def effective_sizes(mujoco):
+    resolver = DefaultResolver(mujoco)
+    geoms = mujoco.find_all("worldbody/geom")
+    return [resolver.get(geom, "size") for geom in geoms]
+
+
+def test_extract_defaults():
+    mujoco = get_model([0.5, 0.5, 0.5, 0.2])
+    before = effective_sizes(mujoco)
+    assert extract_defaults(mujoco) == 3
+    assert effective_sizes(mujoco) == before
+    assert mujoco._children[0].__class__ is e.Default
+    assert mujoco.find(tag="default") is mujoco._children[0]
+    assert mjcf.loads(mujoco.xml()).xml() == mujoco.xml()
+
+
+def test_nothing_to_extract():
+    mujoco = get_model([0.1, 0.2, 0.3])
+    xml = mujoco.xml()
+    assert mujoco.find(tag="geom") is not None
+    assert extract_defaults(mujoco) == 0
+    assert mujoco.xml() == xml
+    assert mujoco.find(tag="default") is None
+
+
+def test_index_in_document_order():
+    mujoco = get_model([0.5, 0.5, 0.5])
+    assert mujoco.find(tag="geom") is not None
+    extract_defaults(mujoco)
+    default = mujoco.find(tag="default")
+    assert mujoco._children[0] is default
+    assert mujoco.find_all(tag="geom")[0]._parent is default
+
+
+def test_extract_motor_defaults():
+    mujoco = e.Mujoco()
+    actuator = e.Actuator()
+    mujoco.add_child(actuator)
+    for i in range(5):
+        actuator.add_child(e.Motor(joint="joint_{}".format(i), gear=150,
+                                   ctrlrange=[-1, 1], ctrllimited=True))
+    assert extract_defaults(mujoco) == 15
+    motor = mujoco.find(tag="default").find(tag="motor")
+    assert motor.gear == 150
+    assert motor.ctrlrange == [-1, 1]
+    for element in actuator._children:
+        assert "gear" not in element._values
+        assert "ctrlrange" not in element._values
+
+
+def test_disallowed_attributes_not_extracted():
+    mujoco = e.Mujoco()
+    contact = e.Contact()
+    actuator = e.Actuator()
+    mujoco.add_children([contact, actuator])
+    for i in range(4):
+        contact.add_child(e.Pair(geom1="floor", geom2="geom_{}".format(i),
+                                 condim=1))
+        actuator.add_child(e.Motor(joint="hip", gear=150))
+    extract_defaults(mujoco)
+    default = mujoco.find(tag="default")
+    pair = default.find(tag="pair")
+    assert pair.condim == 1
+    assert "geom1" not in pair._values
+    assert "joint" not in default.find(tag="motor")._values
+    for element in contact._children:
+        assert element.geom1 == "floor"
+    for element in actuator._children:
+        assert element.joint == "hip"
@@ -0,0 +1,54 @@
+import pytest
+
+from mjcf import elements as e
+
+
+def test_add_child():
+    worldbody = e.Worldbody()
+    body = e.Body(name="b")
+    worldbody.add_child(body)
+    assert worldbody._children == [body]
+    assert body._parent is worldbody
+
+
+def test_child_with_another_parent():
+    geom = e.Geom()
+    e.Body().add_child(geom)
+    with pytest.raises(ValueError):
+        e.Body().add_child(geom)
+
+
+def test_loop():
+    outer = e.Body(name="outer")
+    inner = e.Body(name="inner")
+    outer.add_child(inner)
+    with pytest.raises(ValueError):
+        inner.add_child(outer)
+    with pytest.raises(ValueError):
+        inner.add_child(inner)
+
+
+def test_leaf_added_twice():
+    spatial = e.Spatial()
+    site = e.spatial.Site(site="s")
+    spatial.add_children([site, e.spatial.Geom(geom="g"), site])
+    assert spatial._children == [site, spatial._children[1], site]
+
+
+def test_subtree_added_twice():
+    worldbody = e.Worldbody()
+    body = e.Body(name="b")
+    body.add_child(e.Body(name="c"))
+    worldbody.add_child(body)
+    assert worldbody.find(name="c") is not None
+    with pytest.raises(ValueError):
+        worldbody.add_child(body)
+    assert worldbody._children == [body]
+    assert worldbody.find_all(tag="body") == [body, body._children[0]]
+
+
+def test_compact_leaves_out_defaults():
+    joint = e.Joint(name="j", pos=[0, 0, 0], axis=(0, 0, 1), limited=False,
+                    range=[0.0, 0.5], type="hinge")
+    assert joint.xml(pretty=False).endswith('<joint name="j" range="0 .5"/>')
+    assert 'pos="0 0 0"' in joint.xml()
@@ -0,0 +1,23 @@
+import pytest
+
+from mjcf import ElementTable
+from mjcf import elements as e
+
+
+def get_table():
+    return ElementTable(e.Motor, joint=["hip", "knee"], gear=[[1], [2]])
+
+
+def test_rows_cant_have_children():
+    table = get_table()
+    with pytest.raises(TypeError):
+        table.add_child(e.Geom())
+    with pytest.raises(TypeError):
+        table.add_children([e.Geom()])
+    assert table._children == []
+
+
+def test_to_elements():
+    motors = get_table().to_elements()
+    assert [motor.joint for motor in motors] == ["hip", "knee"]
+    assert [motor.gear for motor in motors] == [[1], [2]]
@@ -0,0 +1,76 @@
+import os
+
+import mjcf
+from mjcf import elements as e
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def get_model():
+    mujoco = e.Mujoco()
+    worldbody = e.Worldbody()
+    body = e.Body(name="torso")
+    hip = e.Joint(name="hip", type="hinge")
+    slider = e.Joint(name="slider", type="slide")
+    geom = e.Geom(name="torso_geom", type="sphere", size=0.25)
+    mujoco.add_child(worldbody)
+    worldbody.add_child(body)
+    body.add_children([hip, slider, geom])
+    return mujoco, body, hip, slider, geom
+
+
+def test_find_by_name():
+    mujoco, _, hip, _, _ = get_model()
+    assert mujoco.find(name="hip") is hip
+    assert mujoco.find(name="knee") is None
+
+
+def test_find_all_by_tag_and_filter():
+    mujoco, _, hip, slider, _ = get_model()
+    assert mujoco.find_all(tag="joint") == [hip, slider]
+    assert mujoco.find_all(tag="joint", type="hinge") == [hip]
+
+
+def test_find_all_by_filter_only():
+    mujoco, _, hip, slider, geom = get_model()
+    assert mujoco.find_all(type="slide") == [slider]
+    assert mujoco.find_all(type="sphere") == [geom]
+
+
+def test_find_all_by_path():
+    mujoco, body, hip, slider, geom = get_model()
+    assert mujoco.find_all("worldbody/body") == [body]
+    assert mujoco.find_all("worldbody/body/*") == [hip, slider, geom]
+    assert mujoco.find_all("//joint") == [hip, slider]
+    assert mujoco.find_all("//*") == [
+        mujoco.find(tag="worldbody"), body, hip, slider, geom
+    ]
+    assert mujoco.find_all("//*", type="hinge") == [hip]
+
+
+def test_find_is_limited_to_subtree():
+    mujoco, body, hip, _, _ = get_model()
+    other = e.Body(name="other")
+    mujoco.find(tag="worldbody").add_child(other)
+    assert other.find(name="hip") is None
+    assert body.find(name="hip") is hip
+    assert other.find_all("//*") == []
+
+
+def test_index_follows_changes():
+    mujoco, body, hip, _, _ = get_model()
+    assert mujoco.find(name="hip") is hip
+    knee = e.Joint(name="knee")
+    body.add_child(knee)
+    assert mujoco.find(name="knee") is knee
+    hip.name = "hip_1"
+    assert mujoco.find(name="hip") is None
+    assert mujoco.find(name="hip_1") is hip
+
+
+def test_find_in_loaded_model():
+    mujoco = mjcf.load(os.path.join(ROOT, "ant-gen.xml"))
+    hinges = mujoco.find_all(tag="joint", type="hinge")
+    assert hinges
+    assert mujoco.find_all(type="hinge") == hinges
+    assert len(mujoco.find_all("//*")) > len(hinges)
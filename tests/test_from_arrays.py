@@ -0,0 +1,53 @@
+import pytest
+
+from mjcf import elements as e
+
+
+def test_columns_and_constants():
+    geoms = e.Geom.from_arrays(type="box", name=["a", "b"], size=[[1], [2]],
+                               rgba=(1, 0, 0, 1))
+    assert [geom.name for geom in geoms] == ["a", "b"]
+    assert [geom.size for geom in geoms] == [[1], [2]]
+    assert all(geom.type == "box" for geom in geoms)
+    assert all(geom.rgba == (1, 0, 0, 1) for geom in geoms)
+
+
+def test_vector_constants():
+    for count in [2, 3, 4]:
+        pos = [(i, 0, 0) for i in range(count)]
+        geoms = e.Geom.from_arrays(pos=pos, size=[0.2, 0.2, 0.2])
+        assert len(geoms) == count
+        assert all(geom.size == [0.2, 0.2, 0.2] for geom in geoms)
+        assert [geom.pos for geom in geoms] == pos
+
+
+def test_children():
+    geoms = e.Geom.from_arrays(size=[[1], [2]])
+    bodies = e.Body.from_arrays(pos=[(0, 0, 0), (1, 0, 0)], children=geoms)
+    for body, geom in zip(bodies, geoms):
+        assert body._children == [geom]
+        assert geom._parent is body
+
+
+def test_children_added_to_tree():
+    worldbody = e.Worldbody()
+    geoms = e.Geom.from_arrays(name=["a", "b"])
+    bodies = e.Body.from_arrays(name=["body_a", "body_b"], children=geoms)
+    worldbody.add_children(bodies)
+    assert worldbody.find(name="a") is geoms[0]
+    assert worldbody.find_all(tag="geom") == geoms
+
+
+def test_child_with_parent():
+    worldbody = e.Worldbody()
+    geom = e.Geom()
+    worldbody.add_child(geom)
+    with pytest.raises(ValueError):
+        e.Body.from_arrays(pos=[(0, 0, 0)], children=[geom])
+    assert geom._parent is worldbody
+
+
+def test_same_child_twice():
+    geom = e.Geom()
+    with pytest.raises(ValueError):
+        e.Body.from_arrays(pos=[(0, 0, 0), (1, 0, 0)], children=[geom, geom])
@@ -0,0 +1,20 @@
+"""
+Import time budget, see benchmarks/bench_import.py
+"""
+from statistics import median
+
+import pytest
+
+from benchmarks.bench_import import BUDGETS, get_import_time
+
+RUN_COUNT = 3
+
+
+@pytest.mark.parametrize("statement, budget", BUDGETS)
+def test_import_time(statement, budget):
+    milliseconds = median(
+        get_import_time(statement) for _ in range(RUN_COUNT)
+    )
+    assert milliseconds <= budget, "{} took {:.1f} ms, budget {} ms".format(
+        statement, milliseconds, budget
+    )
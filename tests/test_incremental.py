@@ -0,0 +1,50 @@
+from mjcf import elements as e
+from tests.test_deep_chain import get_chain
+
+
+def get_model():
+    mujoco = e.Mujoco()
+    worldbody = e.Worldbody()
+    mujoco.add_child(worldbody)
+    for i in range(3):
+        body = e.Body(name="body_{}".format(i))
+        body.add_child(e.Geom(name="geom_{}".format(i), size=0.1))
+        worldbody.add_child(body)
+    return mujoco
+
+
+def test_incremental_follows_changes():
+    mujoco = get_model()
+    assert mujoco.xml(incremental=True) == mujoco.xml()
+    mujoco.find(name="geom_1").size = 0.2
+    assert mujoco.xml(incremental=True) == mujoco.xml()
+    mujoco.find(name="body_2").add_child(e.Site(name="site"))
+    assert mujoco.xml(incremental=True) == mujoco.xml()
+    assert mujoco.xml(incremental=True, pretty=False) == mujoco.xml(
+        pretty=False
+    )
+
+
+def test_frozen_subtree():
+    mujoco = get_model()
+    body = mujoco.find(name="body_0")
+    body.freeze()
+    assert mujoco.xml() == mujoco.xml(incremental=True)
+    body._children[0].size = 0.3
+    assert 'size="0.3"' in mujoco.xml()
+    body.unfreeze()
+    assert body._cache is None
+
+
+def test_incremental_deep_chain():
+    mujoco = get_chain(3000)
+    xml = mujoco.xml()
+    assert mujoco.xml(incremental=True) == xml
+    assert mujoco.xml(incremental=True) == xml
+    # Each element keeps its own tags, not the text of its subtree
+    cached = sum(
+        sum(map(len, entry)) if isinstance(entry, tuple) else len(entry)
+        for element in mujoco.find_all("//*")
+        for entry in element._cache.values()
+    )
+    assert cached < len(xml)
@@ -0,0 +1,36 @@
+import pytest
+
+import mjcf
+
+DOCUMENT = """<?xml version="1.0" encoding="{}"?>
+<mujoco model="café"/>
+"""
+
+
+def test_loads_string_ignores_declared_encoding():
+    for encoding in ["utf-8", "latin-1"]:
+        assert mjcf.loads(DOCUMENT.format(encoding)).model == "café"
+
+
+def test_loads_bytes_uses_declared_encoding():
+    for encoding in ["utf-8", "latin-1"]:
+        document = DOCUMENT.format(encoding).encode(encoding)
+        assert mjcf.loads(document).model == "café"
+
+
+def test_round_trip():
+    mujoco = mjcf.loads(
+        '<mujoco model="m"><worldbody><geom size="1"/></worldbody></mujoco>'
+    )
+    assert mjcf.loads(mujoco.xml()).xml() == mujoco.xml()
+    assert mujoco.find(tag="geom").size == "1"
+
+
+def test_unknown_tag():
+    with pytest.raises(ValueError):
+        mjcf.loads("<mujoco><nothing/></mujoco>")
+
+
+def test_tendon_default_not_supported():
+    with pytest.raises(ValueError):
+        mjcf.loads('<mujoco><default><tendon width="1"/></default></mujoco>')
@@ -0,0 +1,45 @@
+import pytest
+
+from mjcf.utils import format_compact, format_value, format_values
+
+
+def test_format_scalars():
+    assert format_value("box") == "box"
+    assert format_value(1) == "1"
+    assert format_value(0.1) == "0.1"
+    assert format_value(True) == "true"
+    assert format_value(0.123456, float_precision=3) == "0.123"
+
+
+def test_format_vectors():
+    assert format_value([0, 0.5, 1]) == "0 0.5 1"
+    assert format_value((1, 1.0, True)) == "1 1.0 true"
+    assert format_compact([0.0, 0.5, 1.0]) == "0 .5 1"
+
+
+def test_signed_zeros():
+    assert format_value([0.0, 1.0]) == "0.0 1.0"
+    assert format_value([-0.0, 1.0]) == "-0.0 1.0"
+    assert format_value((0.0, 1.0)) == "0.0 1.0"
+    assert format_value((-0.0, 1.0)) == "-0.0 1.0"
+
+
+def test_nested_vectors():
+    assert format_value([[1, 2], [3]]) == "1 2 3"
+    assert format_value([(1, 2), (3, True)]) == "1 2 3 true"
+    assert format_values([[[1, 2], [3]], [0.5]]) == ["1 2 3", "0.5"]
+
+
+def test_format_values():
+    assert format_values([[1, 2], None, True, [False]]) == [
+        "1 2", None, "true", "false"
+    ]
+
+
+def test_numpy():
+    np = pytest.importorskip("numpy")
+    assert format_value(np.array([0.1, 0.25])) == "0.1 0.25"
+    assert format_value(np.array([0.1, 0.25], dtype=np.float32)) == "0.1 0.25"
+    assert format_value(np.float32(0.1)) == "0.1"
+    assert format_value(np.array([1, 2], dtype=np.int32)) == "1 2"
+    assert format_value([np.array([1, 2]), np.array([3])]) == "1 2 3"
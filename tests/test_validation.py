@@ -0,0 +1,70 @@
+import pytest
+
+import mjcf
+from mjcf import elements as e
+from mjcf.validation import get_errors
+
+
+def test_valid_values():
+    worldbody = e.Worldbody()
+    worldbody.add_child(e.Geom(pos=[0, 0.5, 1], size=(0.1, 0.2)))
+    worldbody.add_child(e.Geom(pos="0 0.5 1", size=0.1, type="box"))
+    assert get_errors(worldbody) == []
+
+
+def test_invalid_values():
+    worldbody = e.Worldbody()
+    worldbody.add_child(e.Geom(pos=[0, 0.5], type="ball"))
+    worldbody.add_child(e.Geom(pos=[0, True, 1]))
+    worldbody.add_child(e.Geom(pos=[0, "x", 1]))
+    errors = get_errors(worldbody)
+    assert len(errors) == 4
+    assert "must have 3 values, got 2" in errors[0]
+    assert "must be one of" in errors[1]
+    assert "'true' is not a number" in errors[2]
+    assert "'x' is not a number" in errors[3]
+
+
+def test_validate_raises():
+    worldbody = e.Worldbody()
+    worldbody.add_child(e.Geom(size=[]))
+    with pytest.raises(mjcf.ValidationError) as info:
+        mjcf.validate(worldbody)
+    assert len(info.value.errors) == 1
+
+
+def test_values_checked_as_written():
+    mujoco = mjcf.loads(
+        '<mujoco><worldbody><geom pos="0 0 1" size="0.1" type="box"/>'
+        '<geom pos="0 1" type="box"/></worldbody></mujoco>'
+    )
+    errors = get_errors(mujoco)
+    assert len(errors) == 1
+    assert "must have 3 values, got 2" in errors[0]
+
+
+def test_partial_vectors():
+    worldbody = e.Worldbody()
+    worldbody.add_child(e.Geom(size=[0.1], friction=[1, 0.5]))
+    worldbody.add_child(e.Geom(size=[0.1, 0.2, 0.3, 0.4]))
+    errors = get_errors(worldbody)
+    assert len(errors) == 1
+    assert "must have 3 values, got 4" in errors[0]
+
+
+def test_required_attributes():
+    mujoco = mjcf.loads(
+        '<mujoco><default><material rgba="1 0 0 1"/></default>'
+        '<asset><material rgba="1 0 0 1"/></asset></mujoco>'
+    )
+    for _ in range(2):
+        errors = get_errors(mujoco)
+        assert len(errors) == 1
+        assert "missing required attribute name" in errors[0]
+
+
+def test_references_opt_in():
+    worldbody = e.Worldbody()
+    worldbody.add_child(e.Geom(material="missing"))
+    assert get_errors(worldbody) == []
+    assert len(get_errors(worldbody, references=True)) == 1